@@ -0,0 +1,74 @@
+# benchmarks/bench_import_time.py
+
+"""
+Measure cold-start import time of each entry point in a fresh interpreter.
+
+Each entry point is imported in a new process ``--repeat`` times and the best
+time is reported together with any heavy dependency it dragged in. With
+``--check`` the script exits non-zero when an entry point loads a dependency
+it should defer, so it can guard CI against import-time regressions.
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time --repeat 5 --check
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pandas", "matplotlib", "seaborn", "sklearn", "scipy", "requests")
+
+# Entry point -> heavy modules it must not import eagerly
+ENTRY_POINTS = {
+    "src.main": HEAVY_MODULES + ("numpy",),
+    "src.main.service": ("pandas", "matplotlib", "seaborn", "sklearn", "scipy", "requests"),
+    "src.utils": ("pandas", "matplotlib", "seaborn"),
+    "src.modules.currency_exchange": HEAVY_MODULES,
+    "src.modules.risk_assessment": HEAVY_MODULES,
+    "src.modules.resource_optimization": HEAVY_MODULES,
+    "src.modules.resource_optimization.consumption_analysis": HEAVY_MODULES,
+    "src.modules.cognitive_advisors.cognitive_advisor": HEAVY_MODULES,
+    "src.modules.cognitive_advisors.learning": HEAVY_MODULES,
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+def measure(module, heavy=HEAVY_MODULES):
+    """Import ``module`` in a fresh interpreter and return its import time and loaded heavy modules."""
+    completed = subprocess.run([sys.executable, "-c", _PROBE.format(module=module, heavy=tuple(heavy))],
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check", action="store_true", help="Fail if an entry point loads a deferred dependency.")
+    parser.add_argument("modules", nargs="*", help="Entry points to measure (defaults to all known ones).")
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.modules or ENTRY_POINTS:
+        results = [measure(module) for _ in range(args.repeat)]
+        best = min(result["seconds"] for result in results)
+        loaded = results[0]["loaded"]
+        forbidden = [name for name in loaded if name in ENTRY_POINTS.get(module, ())]
+        if forbidden:
+            failures.append((module, forbidden))
+        print(f"{module:58s} {best * 1000:8.1f} ms  heavy: {', '.join(loaded) or '-'}")
+
+    if args.check and failures:
+        for module, forbidden in failures:
+            print(f"FAIL {module} eagerly imports {', '.join(forbidden)}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/bench_linear_allocation.py
+
+"""
+Compare the declared-program fast path against the general nonlinear solver.
+
+Builds random allocation problems: each resource has a cost, belongs to one
+of ``resources / 20`` capacity pools (a sparse ``A_ub``), and total
+allocation must meet a demand (one dense equality row). The linear program is
+solved with HiGHS, the quadratic variant (cost plus a diagonal congestion
+penalty) with the sparse ADMM solver, falling back to ``trust-constr`` if ADMM
+does not converge; both are compared against ``minimize`` (SLSQP) on the same
+problem with analytic gradients, which is only run up to ``--general-limit``
+resources because its dense QP subproblems scale cubically. Run from the repository root:
+
+    python -m benchmarks.bench_linear_allocation --sizes 200,1000,5000
+"""
+
+import argparse
+import logging
+import time
+import numpy as np
+from scipy import sparse
+from src.modules.resource_optimization.linear import LinearProgram, QuadraticProgram
+from src.modules.resource_optimization.optimizer import Optimizer
+
+def allocation_problem(n, quadratic=False, seed=0):
+    rng = np.random.default_rng(seed)
+    cost = rng.uniform(1.0, 10.0, n)
+    pools = max(n // 20, 1)
+    membership = sparse.csr_matrix((np.ones(n), (rng.integers(0, pools, n), np.arange(n))), shape=(pools, n))
+    capacity = np.full(pools, 40.0)
+    demand = 10.0 * pools
+    bounds = (0, 5.0)
+    if quadratic:
+        return QuadraticProgram(sparse.diags(rng.uniform(0.5, 2.0, n)), cost, membership, capacity,
+                                np.ones((1, n)), [demand], bounds)
+    return LinearProgram(cost, membership, capacity, np.ones((1, n)), [demand], bounds)
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="200,1000,5000")
+    parser.add_argument("--general-limit", type=int, default=500)
+    args = parser.parse_args()
+    logging.getLogger("src.modules.resource_optimization").setLevel(logging.WARNING)
+
+    optimizer = Optimizer()
+    print(f"{'problem':>10} {'resources':>10} {'fast path':>12} {'general':>12} {'speedup':>9} {'objective gap':>14}")
+    for n in (int(size) for size in args.sizes.split(",")):
+        for quadratic in (False, True):
+            program = allocation_problem(n, quadratic)
+            fast_time, fast = timed(lambda: optimizer.optimize_program(program))
+            if fast["status"] != "success":
+                raise RuntimeError(f"Fast path failed: {fast['error']}")
+            row = f"{'QP' if quadratic else 'LP':>10} {n:>10} {fast_time * 1e3:>10.1f}ms"
+            if n <= args.general_limit:
+                lower, upper = program.bound_arrays()
+                x0 = np.full(n, 10.0 * max(n // 20, 1) / n)
+                general_time, general = timed(lambda: minimize_general(program, x0, lower, upper))
+                gap = (general.fun - fast["objective"]) / abs(fast["objective"])
+                row += f" {general_time * 1e3:>10.1f}ms {general_time / fast_time:>8.1f}x {gap:>14.2e}"
+            else:
+                row += f" {'skipped':>12} {'-':>9} {'-':>14}"
+            print(row)
+
+def minimize_general(program, x0, lower, upper):
+    from scipy.optimize import minimize
+
+    return minimize(program, x0, jac=program.gradient, method="SLSQP", constraints=program.as_constraints(),
+                    bounds=list(zip(lower, upper)), options={"maxiter": 1000})
+
+if __name__ == "__main__":
+    main()
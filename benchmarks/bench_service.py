@@ -0,0 +1,96 @@
+# benchmarks/bench_service.py
+
+"""
+Load-generate against the asyncio JSON service and report latency and throughput.
+
+By default an in-process service is started on an ephemeral port with fixed
+demo rates; pass ``--port`` to target an already running service instead.
+Run from the repository root:
+
+    python -m benchmarks.bench_service --endpoint convert --concurrency 64 --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import numpy as np
+from src.main.service import NexusService
+from src.modules.currency_exchange.exchange_rates import CurrencyConverter, ExchangeRateProvider
+
+PAYLOADS = {
+    "convert": lambda i: {"amount": i % 1000, "from_currency": "USD", "to_currency": ("EUR", "JPY", "GBP")[i % 3]},
+    "risk": lambda i: {"model": "advanced", "factors": {"factor1": i % 7, "factor2": i % 11, "factor3": i % 13}},
+}
+
+async def client(host, port, path, payload_factory, requests, latencies, offset):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(requests):
+            body = json.dumps(payload_factory(offset + i)).encode()
+            start = time.perf_counter()
+            writer.write(f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if int(status_line.split()[1]) != 200:
+                raise RuntimeError(f"Request failed: {status_line!r}")
+    finally:
+        writer.close()
+
+async def run(args):
+    service = None
+    port = args.port
+    if port is None:
+        provider = ExchangeRateProvider(api_url="http://127.0.0.1:9/unused")
+        provider.set_rates({"EUR": 0.92, "JPY": 151.3, "GBP": 0.79}, "USD")
+        service = NexusService(converter=CurrencyConverter(provider), max_batch_size=args.max_batch_size,
+                               max_batch_delay=args.max_batch_delay)
+        await service.start(args.host, 0)
+        port = service.port
+
+    latencies = []
+    per_client = args.requests // args.concurrency
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        client(args.host, port, f"/{args.endpoint}", PAYLOADS[args.endpoint], per_client, latencies, c * per_client)
+        for c in range(args.concurrency)])
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000.0
+    print(f"endpoint /{args.endpoint}, {len(latencies)} requests, concurrency {args.concurrency}")
+    print(f"throughput : {len(latencies) / elapsed:10.0f} requests/s")
+    print(f"latency p50: {np.percentile(latencies, 50):10.2f} ms")
+    print(f"latency p99: {np.percentile(latencies, 99):10.2f} ms")
+    if service is not None:
+        batching = service.metrics()
+        batching = batching["convert_batching"] if args.endpoint == "convert" else batching["risk_batching"]
+        print(f"batching   : {batching}")
+        await service.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--endpoint", choices=sorted(PAYLOADS), default="convert")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="Target a running service instead of an in-process one.")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--max-batch-size", type=int, default=512)
+    parser.add_argument("--max-batch-delay", type=float, default=0.002)
+    args = parser.parse_args()
+
+    logging.getLogger("src.modules").setLevel(logging.WARNING)
+    logging.getLogger("src.modules.risk_assessment").setLevel(logging.WARNING)
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_worker_spawn.py
+
+"""
+Measure how long process-pool workers take to become ready for optimization jobs.
+
+Each round starts a fresh pool, submits one job per worker that imports the
+resource optimization package and builds an ``Optimizer``, and times how long
+it takes until every worker has answered. Run from the repository root:
+
+    python -m benchmarks.bench_worker_spawn --workers 4 --rounds 3
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+def build_optimizer(settings):
+    """Worker task: import the package on demand and construct an optimizer."""
+    start = time.perf_counter()
+    from src.modules.resource_optimization import Optimizer
+
+    Optimizer(settings)
+    return os.getpid(), time.perf_counter() - start
+
+def spawn_round(start_method, workers, preload=False):
+    context = multiprocessing.get_context(start_method)
+    if preload:
+        # Safe now that importing the package reads no configuration.
+        context.set_forkserver_preload(["src.modules.resource_optimization.optimizer"])
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        results = list(executor.map(build_optimizer, [{}] * workers))
+        ready = time.perf_counter() - start
+    return ready, max(import_time for _, import_time in results)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    # The forkserver process persists across pools, so only its preloaded variant is measured.
+    variants = [(method, False) for method in ("fork", "spawn") if method in multiprocessing.get_all_start_methods()]
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        variants.append(("forkserver", True))
+    for start_method, preload in variants:
+        rounds = [spawn_round(start_method, args.workers, preload) for _ in range(args.rounds)]
+        ready = min(result[0] for result in rounds)
+        imports = min(result[1] for result in rounds)
+        label = start_method + (" (preloaded)" if preload else "")
+        print(f"{label:24s} {args.workers} worker(s): ready in {ready * 1000:8.1f} ms "
+              f"(package import + Optimizer in worker {imports * 1000:7.1f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -19,10 +19,16 @@ __description__ = "A high-tech financial and resource management system for inte
 __license__ = "MIT"
 
 # Importing necessary modules for easy access
-from .app import main
 from .config import Config
 from .logger import setup_logger
 
+def __getattr__(name):
+    # app.py is written to run as a script, so only import it when ``main`` is requested.
+    if name == "main":
+        from .app import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Expose key functionalities
 __all__ = [
     "main",
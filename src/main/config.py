@@ -1,8 +1,46 @@
 # src/main/config.py
 
+import copy
+import functools
 import os
 import json
-import yaml
+
+def load_config_file(config_file):
+    """
+    Parse a JSON or YAML configuration file, reading it at most once per modification.
+
+    Args:
+        config_file (str): Path to a ``.json``, ``.yaml`` or ``.yml`` file.
+
+    Returns:
+        dict: A private copy of the parsed configuration.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file format is unsupported or the file cannot be decoded.
+    """
+    if not os.path.isfile(config_file):
+        raise FileNotFoundError(f"Configuration file '{config_file}' not found.")
+    path = os.path.abspath(config_file)
+    return copy.deepcopy(_parse_config_file(path, os.path.getmtime(path)))
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path, mtime):
+    # ``mtime`` is part of the cache key so an edited file is re-read.
+    with open(path, 'r') as file:
+        if path.endswith('.json'):
+            try:
+                return json.load(file) or {}
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Error decoding JSON configuration: {e}")
+        elif path.endswith('.yaml') or path.endswith('.yml'):
+            import yaml
+
+            try:
+                return yaml.safe_load(file) or {}
+            except yaml.YAMLError as e:
+                raise ValueError(f"Error decoding YAML configuration: {e}")
+        raise ValueError("Unsupported configuration file format. Use JSON or YAML.")
 
 class Config:
     """Configuration settings for Nexus Hyperion."""
@@ -24,37 +62,30 @@ class Config:
 
     def load_from_file(self, config_file):
         """Load configuration from a JSON or YAML file."""
-        if not os.path.isfile(config_file):
-            raise FileNotFoundError(f"Configuration file '{config_file}' not found.")
-
-        with open(config_file, 'r') as file:
-            if config_file.endswith('.json'):
-                self.load_json(file)
-            elif config_file.endswith('.yaml') or config_file.endswith('.yml'):
-                self.load_yaml(file)
-            else:
-                raise ValueError("Unsupported configuration file format. Use JSON or YAML.")
+        self.apply(load_config_file(config_file))
 
     def load_json(self, file):
         """Load configuration from a JSON file."""
         try:
-            config_data = json.load(file)
-            self.API_KEY = config_data.get("API_KEY", self.API_KEY)
-            self.DB_URI = config_data.get("DB_URI", self.DB_URI)
-            self.LOG_LEVEL = config_data.get("LOG_LEVEL", self.LOG_LEVEL).upper()
+            self.apply(json.load(file))
         except json.JSONDecodeError as e:
             raise ValueError(f"Error decoding JSON configuration: {e}")
 
     def load_yaml(self, file):
         """Load configuration from a YAML file."""
+        import yaml
+
         try:
-            config_data = yaml.safe_load(file)
-            self.API_KEY = config_data.get("API_KEY", self.API_KEY)
-            self.DB_URI = config_data.get("DB_URI", self.DB_URI)
-            self.LOG_LEVEL = config_data.get("LOG_LEVEL", self.LOG_LEVEL).upper()
+            self.apply(yaml.safe_load(file))
         except yaml.YAMLError as e:
             raise ValueError(f"Error decoding YAML configuration: {e}")
 
+    def apply(self, config_data):
+        """Apply settings from a parsed configuration mapping."""
+        self.API_KEY = config_data.get("API_KEY", self.API_KEY)
+        self.DB_URI = config_data.get("DB_URI", self.DB_URI)
+        self.LOG_LEVEL = config_data.get("LOG_LEVEL", self.LOG_LEVEL).upper()
+
     def validate(self):
         """Validate required configuration settings."""
         if not self.API_KEY or not self.DB_URI:
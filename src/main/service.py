@@ -0,0 +1,408 @@
+# src/main/service.py
+
+"""
+Asyncio JSON API in front of the core modules.
+
+Endpoints (all JSON over HTTP/1.1 with keep-alive):
+
+    GET  /health     -> {"status": "ok", "metrics": {...}}
+    POST /risk       {"model": "advanced", "factors": {"factor1": 1.0, ...}} -> {"risk": ...}
+    POST /convert    {"amount": 10, "from_currency": "USD", "to_currency": "EUR"}
+                     -> {"converted_amount": ..., "snapshot_version": ...}
+    POST /optimize   {"initial_resources": [...], "algorithm": "minimize"} -> Optimizer result
+
+Concurrent risk and conversion requests are micro-batched into the
+vectorized batch APIs on a worker thread; optimizations run in a process
+pool. Run from the repository root:
+
+    python -m src.main.service --port 8080
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from ..modules.currency_exchange.exchange_rates import CurrencyConverter, ExchangeRateProvider
+from ..modules.risk_assessment.risk_evaluator import RiskEvaluator
+
+# Configure logging for the service module
+logger = logging.getLogger(__name__)
+
+MAX_BODY_SIZE = 1 << 20
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+class RequestError(ValueError):
+    """A client error that maps to an HTTP status code."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+class MicroBatcher:
+    """Coalesce concurrent single-item requests into batch calls.
+
+    The first item to arrive opens a batch; the batch is dispatched when it
+    reaches ``max_batch_size`` items or ``max_delay`` seconds later, whichever
+    comes first. ``process_batch`` runs in ``executor`` and must return one
+    result (or exception instance) per item, in order.
+    """
+
+    def __init__(self, process_batch, max_batch_size=512, max_delay=0.002, executor=None):
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch (callable): Maps a list of items to a list of results.
+            max_batch_size (int): Maximum items per batch.
+            max_delay (float): Maximum seconds the first item of a batch waits.
+            executor (Executor): Where ``process_batch`` runs (the loop's default executor if None).
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item):
+        """Queue ``item`` and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.executor, self.process_batch, [item for item, _ in batch])
+        except Exception as e:
+            logger.error("Batch of %d items failed: %s", len(batch), e)
+            results = [e] * len(batch)
+        self.batches += 1
+        self.items += len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def metrics(self):
+        """Return the number of batches, items and the average batch size."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "average_batch_size": self.items / self.batches if self.batches else 0.0,
+        }
+
+def _solve_optimization(settings, initial_resources, algorithm):
+    """Run one optimization in a worker process."""
+    from ..modules.resource_optimization.optimizer import Optimizer
+
+    optimizer = Optimizer(settings)
+    optimizer.set_algorithm(algorithm)
+    result = optimizer.optimize_resources(initial_resources, (), optimizer.example_objective_function,
+                                          jac=optimizer.example_objective_gradient)
+    if "optimized_resources" in result:
+        result["optimized_resources"] = np.asarray(result["optimized_resources"]).tolist()
+    if "message" in result:
+        result["message"] = str(result["message"])
+    return result
+
+class NexusService:
+    """Asyncio request-serving front-end for risk, conversion and optimization."""
+
+    def __init__(self, risk_evaluator=None, converter=None, optimizer_settings=None,
+                 max_batch_size=512, max_batch_delay=0.002, optimization_workers=None):
+        """
+        Initialize the service.
+
+        Args:
+            risk_evaluator (RiskEvaluator): Evaluator holding the risk models.
+            converter (CurrencyConverter): Converter used for ``/convert``.
+            optimizer_settings (dict): Settings passed to each ``Optimizer``.
+            max_batch_size (int): Maximum requests coalesced into one batch call.
+            max_batch_delay (float): Maximum seconds a request waits for its batch to fill.
+            optimization_workers (int): Size of the optimization process pool (defaults to the CPU count).
+        """
+        self.risk_evaluator = risk_evaluator or RiskEvaluator()
+        self.converter = converter or CurrencyConverter(ExchangeRateProvider())
+        self.optimizer_settings = optimizer_settings or {}
+        self.optimization_workers = optimization_workers
+        self._batch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="service-batch")
+        self._process_executor = None
+        self._risk_batchers = {}
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        self.convert_batcher = MicroBatcher(self._convert_batch, max_batch_size, max_batch_delay,
+                                            self._batch_executor)
+        self._server = None
+        self.requests = 0
+        self.errors = 0
+        self._started_at = time.perf_counter()
+        self._routes = {
+            ("GET", "/health"): self.handle_health,
+            ("POST", "/risk"): self.handle_risk,
+            ("POST", "/convert"): self.handle_convert,
+            ("POST", "/optimize"): self.handle_optimize,
+        }
+
+    async def start(self, host="127.0.0.1", port=8080, unix_path=None):
+        """
+        Start listening on a TCP port or a Unix socket.
+
+        Returns:
+            asyncio.AbstractServer: The running server.
+        """
+        if self._process_executor is None:
+            self._process_executor = self._create_process_executor(preload=True)
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=unix_path)
+            logger.info("NexusService listening on unix:%s.", unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+            logger.info("NexusService listening on %s:%d.", host, self.port)
+        return self._server
+
+    @property
+    def port(self):
+        """The bound TCP port (useful when started with port 0)."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop accepting connections and shut the executors down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._batch_executor.shutdown(wait=True)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=True)
+        logger.info("NexusService stopped: %s", self.metrics())
+
+    def metrics(self):
+        """Return request counts, throughput and per-endpoint batching statistics."""
+        elapsed = time.perf_counter() - self._started_at
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "requests_per_second": self.requests / elapsed if elapsed > 0 else 0.0,
+            "convert_batching": self.convert_batcher.metrics(),
+            "risk_batching": {name: batcher.metrics() for name, batcher in self._risk_batchers.items()},
+        }
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_SIZE:
+                    status, payload = 413, {"error": "Request body too large."}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self.dispatch(method, path.split("?", 1)[0], body)
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}"
+                    f"\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.debug("Connection dropped: %s", e)
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        """
+        Route one request.
+
+        Returns:
+            tuple: ``(status, payload)``.
+        """
+        self.requests += 1
+        handler = self._routes.get((method, path))
+        try:
+            if handler is None:
+                if any(route_path == path for _, route_path in self._routes):
+                    raise RequestError(f"Method {method} not allowed for {path}.", status=405)
+                raise RequestError(f"Unknown endpoint {path}.", status=404)
+            try:
+                payload = json.loads(body) if body else {}
+            except json.JSONDecodeError as e:
+                raise RequestError(f"Invalid JSON body: {e}")
+            if not isinstance(payload, dict):
+                raise RequestError("Request body must be a JSON object.")
+            return 200, await handler(payload)
+        except RequestError as e:
+            self.errors += 1
+            return e.status, {"error": str(e)}
+        except ValueError as e:
+            self.errors += 1
+            return 400, {"error": str(e)}
+        except Exception as e:
+            self.errors += 1
+            logger.error("Request to %s failed: %s", path, e)
+            return 500, {"error": "Internal server error."}
+
+    async def handle_health(self, payload):
+        return {"status": "ok", "metrics": self.metrics()}
+
+    async def handle_risk(self, payload):
+        model_name = payload.get("model", "advanced")
+        factors = payload.get("factors")
+        if not isinstance(factors, dict) or not factors:
+            raise RequestError("'factors' must be a non-empty object.")
+        self.risk_evaluator.get_model(model_name)
+        batcher = self._risk_batchers.get(model_name)
+        if batcher is None:
+            batcher = MicroBatcher(lambda items, name=model_name: self._risk_batch(name, items),
+                                   self._max_batch_size, self._max_batch_delay, self._batch_executor)
+            self._risk_batchers[model_name] = batcher
+        return {"risk": await batcher.submit(factors)}
+
+    async def handle_convert(self, payload):
+        try:
+            amount = float(payload["amount"])
+            from_currency = str(payload["from_currency"])
+            to_currency = str(payload["to_currency"])
+        except (KeyError, TypeError, ValueError):
+            raise RequestError("'amount', 'from_currency' and 'to_currency' are required.")
+        converted_amount, version = await self.convert_batcher.submit((amount, from_currency, to_currency))
+        return {"converted_amount": converted_amount, "snapshot_version": version}
+
+    def _create_process_executor(self, preload=False):
+        """
+        Create the optimization process pool.
+
+        Forked workers would inherit open client sockets and hold connections
+        open, so workers come from a forkserver (or are spawned). With
+        ``preload`` the forkserver imports the optimizer (and SciPy) once; this
+        is process-wide forkserver configuration, so it is only done by ``start``.
+        """
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            if preload:
+                root_package = __package__.rsplit(".", 1)[0]
+                context.set_forkserver_preload([f"{root_package}.modules.resource_optimization.optimizer"])
+        else:
+            context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(max_workers=self.optimization_workers, mp_context=context)
+
+    async def handle_optimize(self, payload):
+        initial_resources = payload.get("initial_resources")
+        if not isinstance(initial_resources, list) or not initial_resources:
+            raise RequestError("'initial_resources' must be a non-empty list.")
+        if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in initial_resources):
+            raise RequestError("'initial_resources' must contain only numbers.")
+        algorithm = payload.get("algorithm", self.optimizer_settings.get("default_algorithm", "minimize"))
+        if algorithm not in ("minimize", "differential_evolution"):
+            raise RequestError(f"Unknown optimization algorithm: {algorithm}")
+        if self._process_executor is None:
+            self._process_executor = self._create_process_executor()
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._process_executor, _solve_optimization,
+                                            self.optimizer_settings, initial_resources, algorithm)
+        if result.get("status") == "failed":
+            raise RequestError(f"Optimization failed: {result.get('error', 'unknown error')}", status=422)
+        return result
+
+    def _risk_batch(self, model_name, items):
+        """Score a micro-batch, one vectorized call per distinct factor layout."""
+        results = [None] * len(items)
+        layouts = {}
+        for position, factors in enumerate(items):
+            layouts.setdefault(tuple(factors), []).append(position)
+        for columns, positions in layouts.items():
+            try:
+                matrix = np.array([[items[p][column] for column in columns] for p in positions], dtype=np.float64)
+            except (TypeError, ValueError):
+                for p in positions:
+                    results[p] = RequestError("Factor values must be numeric.")
+                continue
+            try:
+                risks, errors = self.risk_evaluator.evaluate_risks_columnar(matrix, model_name, list(columns))
+            except ValueError as e:
+                for p in positions:
+                    results[p] = e
+                continue
+            for p, risk, error in zip(positions, risks.tolist(), errors.tolist()):
+                results[p] = RequestError("Risk could not be evaluated for these factors.") if error else risk
+        return results
+
+    def _convert_batch(self, items):
+        """Convert a micro-batch against one pinned rate snapshot."""
+        snapshot = self.converter.rate_provider.get_snapshot()
+        amounts, from_currencies, to_currencies = zip(*items)
+        converted, _, _, _, failed = self.converter._convert_coded(amounts, from_currencies, to_currencies, snapshot)
+        return [
+            RequestError(f"Exchange rate not found for {from_currency} to {to_currency}.") if row_failed
+            else (amount, snapshot.version)
+            for amount, row_failed, from_currency, to_currency
+            in zip(converted.tolist(), failed.tolist(), from_currencies, to_currencies)
+        ]
+
+async def serve(host="127.0.0.1", port=8080, unix_path=None, **service_options):
+    """Run a ``NexusService`` until cancelled."""
+    service = NexusService(**service_options)
+    server = await service.start(host, port, unix_path)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Nexus Hyperion JSON API.")
+    parser.add_argument("--host", default=os.getenv("NEXUS_HYPERION_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("NEXUS_HYPERION_PORT", "8080")))
+    parser.add_argument("--unix", dest="unix_path", help="Listen on a Unix socket instead of TCP.")
+    parser.add_argument("--max-batch-size", type=int, default=512)
+    parser.add_argument("--max-batch-delay", type=float, default=0.002)
+    args = parser.parse_args()
+    logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', level=logging.INFO)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix_path, max_batch_size=args.max_batch_size,
+                          max_batch_delay=args.max_batch_delay))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,7 @@
 # src/modules/cognitive_advisors/cognitive_advisor.py
 
 import logging
-import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 
 # Configure logging for the cognitive advisor module
 logger = logging.getLogger(__name__)
@@ -15,6 +11,9 @@ class CognitiveFinancialAdvisor:
 
     def __init__(self):
         """Initialize the CognitiveFinancialAdvisor."""
+        import pandas as pd
+        from sklearn.linear_model import LinearRegression
+
         self.client_profiles = pd.DataFrame()
         self.model = LinearRegression()
         logger.info("CognitiveFinancialAdvisor initialized.")
@@ -100,6 +99,9 @@ class CognitiveFinancialAdvisor:
         X = np.array([[profile['age'].values[0], profile['income'].values[0]]])
         y = np.array([profile['income'].values[0] * 1.05])  # Assuming a 5% growth rate
 
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+
         # Train a simple linear regression model
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         scaler = StandardScaler()
@@ -1,10 +1,6 @@
 # src/modules/cognitive_advisors/learning.py
 
 import logging
-import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_squared_error
 
 # Configure logging for the learning module
 logger = logging.getLogger(__name__)
@@ -14,6 +10,8 @@ class FinancialPredictor:
 
     def __init__(self):
         """Initialize the FinancialPredictor."""
+        from sklearn.ensemble import RandomForestRegressor
+
         self.model = RandomForestRegressor()
         logger.info("FinancialPredictor initialized.")
 
@@ -25,6 +23,9 @@ class FinancialPredictor:
             data (pd.DataFrame): DataFrame containing features and target.
             target_column (str): The name of the target column to predict.
         """
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import mean_squared_error
+
         logger.info("Training financial prediction model.")
         X = data.drop(columns=[target_column])
         y = data[target_column]
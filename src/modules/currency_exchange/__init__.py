@@ -1,14 +1,34 @@
 # src/modules/currency_exchange/__init__.py
 
 import logging
+from ...utils.lazy import lazy_attributes
 from .exchange_rates import ExchangeRateProvider, CurrencyConverter
-from .transaction import TransactionProcessor
+from .rate_snapshot import RateSnapshot
 
 # Configure logging for the currency exchange module
 logger = logging.getLogger(__name__)
 
 __version__ = "1.0.0"  # Versioning for the module
-__all__ = ["ExchangeRateProvider", "CurrencyConverter", "TransactionProcessor", "create_currency_exchange_system"]
+__all__ = ["ExchangeRateProvider", "AsyncExchangeRateProvider", "CurrencyConverter", "TransactionProcessor",
+           "BatchTransactionResult", "TransactionStatus", "FixedPointConverter", "RoundingPolicy",
+           "RateRefresher", "RateSnapshot", "RateHistoryStore", "TransactionLedger",
+           "TransactionPipeline", "create_currency_exchange_system"]
+
+# Everything beyond plain conversion is imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "FixedPointConverter": ".money",
+    "RoundingPolicy": ".money",
+    "RateHistoryStore": ".rate_history",
+    "TransactionLedger": ".ledger",
+    "TransactionPipeline": ".pipeline",
+    "TransactionProcessor": ".transaction",
+    "BatchTransactionResult": ".batch_result",
+    "TransactionStatus": ".batch_result",
+    "AsyncExchangeRateProvider": ".async_rates",
+    "RateRefresher": ".refresher",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
 
 def create_currency_exchange_system(api_url="https://api.exchangerate-api.com/v4/latest"):
     """
@@ -21,7 +41,8 @@ def create_currency_exchange_system(api_url="https://api.exchangerate-api.com/v4
         dict: A dictionary containing instances of the main classes.
     """
     logger.info("Creating currency exchange system.")
-    
+    from .transaction import TransactionProcessor
+
     # Create instances of the main classes
     rate_provider = ExchangeRateProvider(api_url=api_url)
     converter = CurrencyConverter(rate_provider=rate_provider)
@@ -0,0 +1,126 @@
+# src/modules/currency_exchange/async_rates.py
+
+import asyncio
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from .exchange_rates import ExchangeRateProvider
+
+# Configure logging for the async exchange rates module
+logger = logging.getLogger(__name__)
+
+class AsyncExchangeRateProvider(ExchangeRateProvider):
+    """Exchange rate provider with asyncio fetching on a pooled HTTP session.
+
+    Requests run on a small thread pool over a shared ``requests.Session``
+    whose connection pool is sized to match, so connections are reused.
+    Fetches are single-flight per base: concurrent coroutines that miss the
+    cache for the same base await one in-flight request. Transient failures
+    (connection errors, timeouts and 5xx responses) are retried with
+    exponential backoff.
+    """
+
+    def __init__(self, api_url="https://api.exchangerate-api.com/v4/latest", cache_ttl=3600,
+                 request_timeout=10, max_connections=8, max_retries=3, backoff=0.5):
+        """
+        Initialize the provider.
+
+        Args:
+            api_url (str): The API URL for fetching exchange rates.
+            cache_ttl (int): Time-to-live for cached rates in seconds.
+            request_timeout (float): Timeout for each HTTP request in seconds.
+            max_connections (int): Size of the HTTP connection pool and fetch thread pool.
+            max_retries (int): Number of retries after a transient failure.
+            backoff (float): Delay before the first retry in seconds; doubled on each retry.
+        """
+        super().__init__(api_url=api_url, cache_ttl=cache_ttl, request_timeout=request_timeout)
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="rate-fetch")
+        self._in_flight = {}
+
+    def close(self):
+        """Release the HTTP session and the fetch thread pool."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    async def fetch_rates_async(self, base_currency="USD"):
+        """
+        Fetch exchange rates for one base without blocking the event loop.
+
+        Args:
+            base_currency (str): The base currency to fetch.
+
+        Returns:
+            dict: Rates relative to ``base_currency``.
+        """
+        cached_snapshot = self.cache.get(base_currency)
+        if cached_snapshot is not None:
+            return self._use_cached_snapshot(cached_snapshot)
+
+        task = self._in_flight.get(base_currency)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_with_retries(base_currency))
+            self._in_flight[base_currency] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(base_currency, None))
+        else:
+            logger.debug("Joining in-flight fetch for base currency: %s", base_currency)
+        # Shield so one cancelled waiter does not cancel the fetch shared by the others.
+        return await asyncio.shield(task)
+
+    async def fetch_many_async(self, base_currencies):
+        """
+        Fetch several bases in parallel.
+
+        Requests run concurrently, but the fetched rates are installed in the
+        requested order once all have arrived. Snapshot versions therefore
+        follow ``base_currencies`` and the last fetched base becomes current,
+        whichever response came back last.
+
+        Args:
+            base_currencies (list): Base currencies to fetch.
+
+        Returns:
+            dict: Mapping of base currency to its rates.
+        """
+        async def request(base_currency):
+            if self.cache.get(base_currency) is not None or base_currency in self._in_flight:
+                # Cached, or a single-base fetch already in flight installs its own result.
+                return await self.fetch_rates_async(base_currency), False
+            return await self._request_with_retries(base_currency), True
+
+        responses = await asyncio.gather(*(request(base) for base in base_currencies))
+        results = {}
+        for base_currency, (rates, fetched) in zip(base_currencies, responses):
+            results[base_currency] = self._install_fetched_rates(rates, base_currency) if fetched else rates
+        return results
+
+    async def _fetch_with_retries(self, base_currency):
+        return self._install_fetched_rates(await self._request_with_retries(base_currency), base_currency)
+
+    async def _request_with_retries(self, base_currency):
+        """Request one base's rates, retrying transient failures, without installing them."""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_retries + 1):
+            logger.info("Fetching exchange rates for base currency: %s", base_currency)
+            try:
+                rates = await loop.run_in_executor(self._executor, self._request_rates, base_currency)
+            except requests.RequestException as e:
+                if attempt == self.max_retries or not _is_transient(e):
+                    logger.error("Error fetching exchange rates: %s", e)
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                logger.warning("Transient error fetching %s rates (%s); retrying in %.2fs.", base_currency, e, delay)
+                await asyncio.sleep(delay)
+            else:
+                return rates
+
+def _is_transient(error):
+    """Return True for failures worth retrying: network errors, timeouts and 5xx responses."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
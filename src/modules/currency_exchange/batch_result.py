@@ -0,0 +1,80 @@
+# src/modules/currency_exchange/batch_result.py
+
+from collections.abc import Sequence
+from enum import IntEnum
+import numpy as np
+
+class TransactionStatus(IntEnum):
+    """Status codes stored in ``BatchTransactionResult.status``."""
+
+    SUCCESS = 0
+    FAILED = 1
+
+class BatchTransactionResult(Sequence):
+    """Columnar (struct-of-arrays) results of a transaction batch.
+
+    Amounts are float64 arrays, currencies are integer codes into
+    ``currencies``, statuses are a uint8 ``TransactionStatus`` array and error
+    messages are kept only for failed rows. Indexing a row builds the
+    familiar transaction dict lazily, so nothing is materialized per row
+    unless it is accessed.
+    """
+
+    def __init__(self, original_amounts, currencies, from_codes, to_codes, converted_amounts, status, errors):
+        """
+        Args:
+            original_amounts (np.ndarray): Input amounts.
+            currencies (np.ndarray): Distinct currency codes referenced by the code arrays.
+            from_codes (np.ndarray): Source currency code per row.
+            to_codes (np.ndarray): Target currency code per row.
+            converted_amounts (np.ndarray): Converted amounts (NaN for failed rows).
+            status (np.ndarray): ``TransactionStatus`` per row as uint8.
+            errors (dict): Mapping of failed row index to its error message.
+        """
+        self.original_amounts = original_amounts
+        self.currencies = currencies
+        self.from_codes = from_codes
+        self.to_codes = to_codes
+        self.converted_amounts = converted_amounts
+        self.status = status
+        self.errors = errors
+
+    def __len__(self):
+        return self.status.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BatchTransactionResult index out of range")
+        return self._row(index)
+
+    def __repr__(self):
+        return f"<BatchTransactionResult(transactions={len(self)}, failed={self.failed_count})>"
+
+    def _row(self, row):
+        if self.status[row] == TransactionStatus.FAILED:
+            return {"error": self.errors.get(row, "unknown error"), "status": "failed"}
+        return {
+            "original_amount": float(self.original_amounts[row]),
+            "from_currency": str(self.currencies[self.from_codes[row]]),
+            "to_currency": str(self.currencies[self.to_codes[row]]),
+            "converted_amount": float(self.converted_amounts[row]),
+            "status": "success"
+        }
+
+    @property
+    def success_mask(self):
+        """Boolean mask of successful rows."""
+        return self.status == TransactionStatus.SUCCESS
+
+    @property
+    def failed_count(self):
+        """Number of failed rows."""
+        return int(np.count_nonzero(self.status == TransactionStatus.FAILED))
+
+    def to_dicts(self):
+        """Materialize every row as a transaction dict."""
+        return [self._row(row) for row in range(len(self))]
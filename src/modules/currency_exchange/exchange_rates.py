@@ -1,53 +1,292 @@
 # src/modules/currency_exchange/exchange_rates.py
 
-import requests
+import itertools
 import logging
-import time
-from cachetools import TTLCache, cached
+import threading
+import numpy as np
+from collections import OrderedDict
+from cachetools import TTLCache
+from .rate_snapshot import RateSnapshot
 
 # Configure logging for the exchange rates module
 logger = logging.getLogger(__name__)
 
 class ExchangeRateProvider:
-    """Class to fetch and manage exchange rates from various sources."""
+    """Class to fetch and manage exchange rates from various sources.
+
+    Rates are held in immutable, versioned ``RateSnapshot`` objects. Each
+    snapshot expands its base rates into a full N x N cross-rate matrix, so
+    any currency pair resolves with one array lookup, and a new snapshot is
+    published by swapping a single reference, so readers never lock. Recent
+    versions are retained so batches can be pinned to one of them.
+    """
     
-    def __init__(self, api_url="https://api.exchangerate-api.com/v4/latest", cache_ttl=3600):
+    def __init__(self, api_url="https://api.exchangerate-api.com/v4/latest", cache_ttl=3600, request_timeout=10,
+                 snapshot_history=16, history_store=None):
         """
         Initialize with the API URL and cache settings.
 
         Args:
             api_url (str): The API URL for fetching exchange rates.
             cache_ttl (int): Time-to-live for cached rates in seconds.
+            request_timeout (float): Timeout for each HTTP request in seconds.
+            snapshot_history (int): Number of recent snapshot versions retained for pinning.
+            history_store (RateHistoryStore): Optional on-disk history that fetched snapshots
+                are appended to and that the provider warms from at startup.
         """
         self.api_url = api_url
-        self.rates = {}
-        self.cache = TTLCache(maxsize=100, ttl=cache_ttl)  # Cache for exchange rates
+        self.request_timeout = request_timeout
+        self.cache_ttl = cache_ttl
+        self.snapshot_history = snapshot_history
+        self.base_currency = "USD"
+        self.refresher = None  # Set by RateRefresher to serve stale rates while revalidating
+        self._versions = itertools.count(1)
+        self._snapshots = OrderedDict()
+        self._publish_lock = threading.Lock()
+        self._snapshot = RateSnapshot(0, {}, self.base_currency)
+        self.cache = TTLCache(maxsize=100, ttl=cache_ttl)  # Cache of fetched snapshots per base
+        self._session = None  # Pooled HTTP session, created on first fetch
+        self._session_lock = threading.Lock()
+        self._fetch_locks = {}
+        self._fetch_locks_guard = threading.Lock()
+        self.history_store = history_store
+        if history_store is not None:
+            self.warm_from_history()
         logger.info("ExchangeRateProvider initialized with API URL: %s", api_url)
 
-    @cached(cache=lambda self: self.cache)
+    def warm_from_history(self, base_currency=None):
+        """
+        Publish the latest snapshot from the history store, avoiding a cold fetch.
+
+        The warmed snapshot keeps its recorded timestamp, so it is revalidated
+        as usual once it is older than ``cache_ttl``.
+
+        Returns:
+            RateSnapshot: The warmed snapshot, or None if the history is empty.
+        """
+        base_currency = base_currency or self.base_currency
+        try:
+            latest = self.history_store.latest(base_currency)
+        except ValueError as e:
+            logger.warning("Could not warm exchange rates from history: %s", e)
+            return None
+        if latest is None:
+            return None
+        timestamp, rates = latest
+        snapshot = self.set_rates(rates, base_currency, timestamp=timestamp, source=f"history:{self.history_store.path}")
+        logger.info("Warmed exchange rates from history (%d currencies).", len(snapshot))
+        return snapshot
+
+    def get_rate_at(self, from_currency, to_currency, timestamp):
+        """
+        Get the historical exchange rate in effect at ``timestamp``.
+
+        Args:
+            from_currency (str): The currency to convert from.
+            to_currency (str): The currency to convert to.
+            timestamp (float): Point in time (seconds since the epoch).
+
+        Returns:
+            float: The exchange rate.
+        """
+        if self.history_store is None:
+            logger.error("Historical rates require a history store.")
+            raise ValueError("Historical rates require a history store.")
+        return self.history_store.rate_at(from_currency, to_currency, timestamp)
+
+    @property
+    def rates(self):
+        """Rates relative to ``base_currency`` from the current snapshot."""
+        return self._snapshot.rates
+
+    @rates.setter
+    def rates(self, rates):
+        self.set_rates(rates, self.base_currency)
+
+    @property
+    def snapshot(self):
+        """The current snapshot, without any fetching or revalidation."""
+        return self._snapshot
+
+    def set_rates(self, rates, base_currency, timestamp=None, source="manual"):
+        """
+        Build a new snapshot from base rates and publish it.
+
+        Args:
+            rates (dict): Mapping of currency code to units per one ``base_currency``.
+            base_currency (str): The base of the snapshot.
+            timestamp (float): When the rates were observed (defaults to now).
+            source (str): Where the rates came from.
+
+        Returns:
+            RateSnapshot: The published snapshot.
+        """
+        snapshot = RateSnapshot(next(self._versions), rates, base_currency, timestamp=timestamp, source=source)
+        self.publish(snapshot)
+        return snapshot
+
+    def publish(self, snapshot):
+        """
+        Make ``snapshot`` current with an atomic reference swap and retain it for pinning.
+
+        Args:
+            snapshot (RateSnapshot): The snapshot to publish.
+        """
+        with self._publish_lock:
+            self._snapshots[snapshot.version] = snapshot
+            self._snapshots.move_to_end(snapshot.version)
+            while len(self._snapshots) > self.snapshot_history:
+                self._snapshots.popitem(last=False)
+            self._snapshot = snapshot
+            self.base_currency = snapshot.base_currency
+        logger.debug("Published exchange rate snapshot version %d.", snapshot.version)
+
+    def snapshot_age(self):
+        """Return the age of the current snapshot in seconds (infinite if none)."""
+        snapshot = self._snapshot
+        if not len(snapshot):
+            return float("inf")
+        return snapshot.age()
+
+    def get_snapshot(self, version=None):
+        """
+        Return a rate snapshot, fetching rates first if needed.
+
+        Without a version the current snapshot is returned. Once it is older
+        than ``cache_ttl`` it is revalidated: with a background refresher
+        attached the stale snapshot is served while the refresher fetches,
+        otherwise the refresh happens inline.
+
+        Args:
+            version (int or RateSnapshot): Pin to a retained snapshot version.
+
+        Returns:
+            RateSnapshot: The requested snapshot.
+
+        Raises:
+            ValueError: If the requested version is no longer retained.
+        """
+        if isinstance(version, RateSnapshot):
+            return version
+        if version is not None:
+            snapshot = self._snapshots.get(version)
+            if snapshot is None:
+                logger.error("Exchange rate snapshot version %s is not available.", version)
+                raise ValueError(f"Exchange rate snapshot version {version} is not available.")
+            return snapshot
+
+        if not len(self._snapshot):
+            logger.warning("Exchange rates not fetched. Fetching now...")
+            self.fetch_rates()
+        elif self.snapshot_age() > self.cache_ttl:
+            if self.refresher is not None:
+                self.refresher.request_refresh()
+            else:
+                import requests
+                try:
+                    self.fetch_rates(self.base_currency)
+                except requests.RequestException:
+                    logger.warning("Serving stale exchange rates after a failed refresh.")
+        return self._snapshot
+
+    def get_cross_rates(self):
+        """
+        Return the current cross-rate table, fetching rates first if needed.
+
+        Returns:
+            tuple: ``(currency_index, matrix)`` where ``currency_index`` maps a currency
+            code to its row/column and ``matrix[i, j]`` converts currency i into j.
+        """
+        snapshot = self.get_snapshot()
+        return snapshot.currency_index, snapshot.matrix
+
     def fetch_rates(self, base_currency="USD"):
-        """Fetch exchange rates from the API and cache them."""
+        """
+        Fetch exchange rates from the API and cache them.
+
+        Concurrent callers that miss the cache for the same base wait for a
+        single in-flight request instead of each issuing their own. A cache hit
+        never republishes an older snapshot, so snapshot versions only increase.
+        """
+        cached_snapshot = self.cache.get(base_currency)
+        if cached_snapshot is None:
+            with self._fetch_lock(base_currency):
+                cached_snapshot = self.cache.get(base_currency)
+                if cached_snapshot is None:
+                    return self._fetch_and_install(base_currency)
+
+        return self._use_cached_snapshot(cached_snapshot)
+
+    def _use_cached_snapshot(self, cached_snapshot):
+        """Publish a cached snapshot if it is newer than the current one and return its rates."""
+        logger.info("Using cached exchange rates for base currency: %s", cached_snapshot.base_currency)
+        if cached_snapshot.version > self._snapshot.version:
+            self.publish(cached_snapshot)
+        return cached_snapshot.rates
+
+    def refresh_rates(self, base_currency=None):
+        """
+        Fetch a new snapshot from the API, bypassing the cache.
+
+        Args:
+            base_currency (str): Base to fetch; defaults to the current base.
+
+        Returns:
+            dict: The freshly fetched rates.
+        """
+        base_currency = base_currency or self.base_currency
+        with self._fetch_lock(base_currency):
+            return self._fetch_and_install(base_currency)
+
+    def _fetch_lock(self, base_currency):
+        with self._fetch_locks_guard:
+            return self._fetch_locks.setdefault(base_currency, threading.Lock())
+
+    @property
+    def session(self):
+        """The ``requests.Session`` reused across fetches; ``requests`` is imported on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    self._session = requests.Session()
+        return self._session
+
+    def _request_rates(self, base_currency):
+        """Issue one HTTP request and return the rates payload."""
+        response = self.session.get(f"{self.api_url}/{base_currency}", timeout=self.request_timeout)
+        response.raise_for_status()
+        return response.json()['rates']
+
+    def _install_fetched_rates(self, rates, base_currency):
+        snapshot = self.set_rates(rates, base_currency, source=f"{self.api_url}/{base_currency}")
+        self.cache[base_currency] = snapshot
+        if self.history_store is not None:
+            try:
+                self.history_store.append(snapshot)
+            except (OSError, ValueError) as e:
+                logger.error("Failed to record exchange rate history: %s", e)
+        logger.info("Exchange rates fetched successfully (snapshot version %d).", snapshot.version)
+        return snapshot.rates
+
+    def _fetch_and_install(self, base_currency):
+        import requests
+
         logger.info("Fetching exchange rates for base currency: %s", base_currency)
         try:
-            response = requests.get(f"{self.api_url}/{base_currency}")
-            response.raise_for_status()
-            data = response.json()
-            self.rates = data['rates']
-            logger.info("Exchange rates fetched successfully.")
+            rates = self._request_rates(base_currency)
         except requests.RequestException as e:
             logger.error("Error fetching exchange rates: %s", e)
             raise
+        return self._install_fetched_rates(rates, base_currency)
 
-    def get_rate(self, from_currency, to_currency):
-        """Get the exchange rate from one currency to another."""
-        if not self.rates:
-            logger.warning("Exchange rates not fetched. Fetching now...")
-            self.fetch_rates()
-        
-        rate = self.rates.get(to_currency)
-        if rate is None:
+    def get_rate(self, from_currency, to_currency, snapshot=None):
+        """Get the exchange rate from one currency to another, optionally from a pinned snapshot."""
+        try:
+            rate = self.get_snapshot(snapshot).rate(from_currency, to_currency)
+        except ValueError:
             logger.error("Exchange rate not found for %s to %s.", from_currency, to_currency)
-            raise ValueError(f"Exchange rate not found for {from_currency} to {to_currency}.")
+            raise
         
         logger.info("Exchange rate from %s to %s: %s", from_currency, to_currency, rate)
         return rate
@@ -67,3 +306,85 @@ class CurrencyConverter:
         converted_amount = amount * rate
         logger.info("Converted amount: %s %s", converted_amount, to_currency)
         return converted_amount
+
+    def convert_many(self, amounts, from_currencies, to_currencies, snapshot=None):
+        """
+        Convert many amounts in one vectorized pass.
+
+        Currency codes are mapped to positions in the provider's cross-rate
+        matrix once per distinct code, and all amounts are converted with a
+        single fancy-indexed multiply.
+
+        Args:
+            amounts (array-like): Amounts to convert.
+            from_currencies (array-like): Source currency codes aligned with ``amounts``.
+            to_currencies (array-like): Target currency codes aligned with ``amounts``.
+            snapshot (int or RateSnapshot): Convert against this snapshot version
+                instead of the current one.
+
+        Returns:
+            np.ndarray: Converted amounts as float64.
+
+        Raises:
+            ValueError: If the inputs are misaligned or any currency pair cannot be resolved.
+        """
+        converted, failures = self._convert_many(amounts, from_currencies, to_currencies, snapshot)
+        if failures:
+            (from_currency, to_currency), error = next(iter(failures.items()))
+            logger.error("Bulk conversion failed for %s to %s: %s", from_currency, to_currency, error)
+            raise ValueError(f"Cannot convert {from_currency} to {to_currency}: {error}")
+        return converted
+
+    def _convert_many(self, amounts, from_currencies, to_currencies, snapshot=None):
+        """
+        Vectorized conversion that reports unresolvable pairs instead of raising.
+
+        Returns:
+            tuple: ``(converted, failures)`` where rows of unresolvable pairs are NaN
+            and ``failures`` maps each failed ``(from, to)`` pair to its exception.
+        """
+        converted, codes, from_codes, to_codes, failed = self._convert_coded(
+            amounts, from_currencies, to_currencies, snapshot)
+        failures = {}
+        if failed.any():
+            size = codes.shape[0]
+            for pair in np.unique(from_codes[failed] * size + to_codes[failed]).tolist():
+                from_currency, to_currency = str(codes[pair // size]), str(codes[pair % size])
+                logger.error("Exchange rate not found for %s to %s.", from_currency, to_currency)
+                failures[(from_currency, to_currency)] = ValueError(
+                    f"Exchange rate not found for {from_currency} to {to_currency}.")
+        return converted, failures
+
+    def _convert_coded(self, amounts, from_currencies, to_currencies, snapshot=None):
+        """
+        Vectorized conversion over integer-coded currencies.
+
+        Returns:
+            tuple: ``(converted, codes, from_codes, to_codes, failed)`` where ``codes`` holds the
+            distinct currency codes, ``from_codes``/``to_codes`` index into it per row and
+            ``failed`` masks rows whose currency pair could not be resolved (converted as NaN).
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        from_currencies = np.asarray(from_currencies, dtype=str)
+        to_currencies = np.asarray(to_currencies, dtype=str)
+        if amounts.ndim != 1 or from_currencies.shape != amounts.shape or to_currencies.shape != amounts.shape:
+            logger.error("Amounts and currency codes must be aligned one-dimensional arrays.")
+            raise ValueError("Amounts and currency codes must be aligned one-dimensional arrays.")
+        count = amounts.shape[0]
+        logger.info("Converting batch of %d amounts.", count)
+        if count == 0:
+            empty_codes = np.empty(0, dtype=np.intp)
+            return np.empty(0), np.empty(0, dtype=str), empty_codes, empty_codes, np.zeros(0, dtype=bool)
+
+        snapshot = self.rate_provider.get_snapshot(snapshot)
+        codes, inverse = np.unique(np.concatenate([from_currencies, to_currencies]), return_inverse=True)
+        inverse = inverse.reshape(-1)
+        from_codes, to_codes = inverse[:count], inverse[count:]
+        positions = snapshot.positions(codes.tolist())
+        from_positions, to_positions = positions[from_codes], positions[to_codes]
+
+        rates = np.full(count, np.nan)
+        known = (from_positions >= 0) & (to_positions >= 0)
+        rates[known] = snapshot.matrix[from_positions[known], to_positions[known]]
+        failed = ~np.isfinite(rates)
+        return amounts * rates, codes, from_codes, to_codes, failed
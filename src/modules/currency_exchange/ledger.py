@@ -0,0 +1,121 @@
+# src/modules/currency_exchange/ledger.py
+
+import logging
+import sqlite3
+import threading
+import time
+
+# Configure logging for the transaction ledger module
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    original_amount REAL,
+    from_currency TEXT,
+    to_currency TEXT,
+    converted_amount REAL,
+    status TEXT NOT NULL,
+    error TEXT
+)
+"""
+
+_INSERT = """
+INSERT INTO transactions
+    (recorded_at, original_amount, from_currency, to_currency, converted_amount, status, error)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+def _as_float(amount):
+    """Return ``amount`` as a float (numpy scalars and Decimals do not bind), or None if it is not numeric."""
+    try:
+        return None if amount is None else float(amount)
+    except (TypeError, ValueError):
+        return None
+
+def sqlite_path_from_uri(db_uri):
+    """
+    Extract the database path from a ``sqlite:///path`` URI.
+
+    Args:
+        db_uri (str): A SQLite URI such as ``Config.DB_URI``, or a plain path.
+
+    Returns:
+        str: The database path (``:memory:`` for an in-memory database).
+    """
+    if db_uri.startswith("sqlite:///"):
+        return db_uri[len("sqlite:///"):] or ":memory:"
+    if db_uri in ("sqlite://", "sqlite:"):
+        return ":memory:"
+    if "://" in db_uri:
+        raise ValueError(f"Unsupported ledger database URI: {db_uri}")
+    return db_uri
+
+class TransactionLedger:
+    """Durable SQLite ledger of processed transactions.
+
+    The database runs in WAL mode so readers do not block the writer, and
+    batches are group-committed with a single ``executemany`` per
+    transaction.
+    """
+
+    def __init__(self, db_uri="sqlite:///nexus_hyperion.db"):
+        """
+        Open (and if needed create) the ledger database.
+
+        Args:
+            db_uri (str): SQLite URI or path, e.g. ``Config.DB_URI``.
+        """
+        self.path = sqlite_path_from_uri(db_uri)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SCHEMA)
+            self._connection.commit()
+        logger.info("TransactionLedger opened at %s.", self.path)
+
+    @classmethod
+    def from_config(cls, config):
+        """Create a ledger from a ``Config`` object's ``DB_URI``."""
+        return cls(config.DB_URI)
+
+    @staticmethod
+    def to_row(transaction_details, recorded_at=None):
+        """Flatten a transaction details dict into a ledger row (amounts as floats SQLite can bind)."""
+        return (
+            time.time() if recorded_at is None else recorded_at,
+            _as_float(transaction_details.get("original_amount")),
+            transaction_details.get("from_currency"),
+            transaction_details.get("to_currency"),
+            _as_float(transaction_details.get("converted_amount")),
+            transaction_details.get("status", "unknown"),
+            transaction_details.get("error"),
+        )
+
+    def write_batch(self, rows):
+        """
+        Group-commit a batch of ledger rows in one transaction.
+
+        Args:
+            rows (list): Tuples of ``(recorded_at, original_amount, from_currency,
+                to_currency, converted_amount, status, error)``.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(_INSERT, rows)
+
+    def record(self, transaction_details):
+        """Durably record a single transaction."""
+        self.write_batch([self.to_row(transaction_details)])
+
+    def count(self):
+        """Return the number of recorded transactions."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
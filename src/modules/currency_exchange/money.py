@@ -0,0 +1,273 @@
+# src/modules/currency_exchange/money.py
+
+import logging
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN, ROUND_HALF_UP
+from enum import Enum
+import numpy as np
+
+# Configure logging for the fixed-point money module
+logger = logging.getLogger(__name__)
+
+# ISO 4217 minor units for currencies that do not use two decimal places
+CURRENCY_SCALES = {
+    "BIF": 0, "CLP": 0, "DJF": 0, "GNF": 0, "ISK": 0, "JPY": 0, "KMF": 0, "KRW": 0, "PYG": 0,
+    "RWF": 0, "UGX": 0, "UYI": 0, "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0, "XPF": 0,
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3,
+    "CLF": 4, "UYW": 4,
+}
+DEFAULT_SCALE = 2
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+_INT64_MAX = np.uint64(np.iinfo(np.int64).max)
+_MAX_DIVISOR_STEP = 9  # 10**9 < 2**32, so each long-division step stays within uint64
+
+class RoundingPolicy(Enum):
+    """How converted amounts are rounded to the target currency's minor unit."""
+
+    HALF_EVEN = "half_even"
+    HALF_UP = "half_up"  # Ties away from zero
+    DOWN = "down"  # Toward zero
+    FLOOR = "floor"
+    CEILING = "ceiling"
+
+_DECIMAL_ROUNDING = {
+    RoundingPolicy.HALF_EVEN: ROUND_HALF_EVEN,
+    RoundingPolicy.HALF_UP: ROUND_HALF_UP,
+    RoundingPolicy.DOWN: ROUND_DOWN,
+    RoundingPolicy.FLOOR: ROUND_FLOOR,
+    RoundingPolicy.CEILING: ROUND_CEILING,
+}
+
+def currency_scale(currency):
+    """Return the number of minor-unit decimal places of ``currency``."""
+    return CURRENCY_SCALES.get(currency, DEFAULT_SCALE)
+
+def to_minor_units(amount, currency, rounding=RoundingPolicy.HALF_EVEN):
+    """
+    Convert a major-unit amount to integer minor units exactly.
+
+    Args:
+        amount (str, int, Decimal or float): The amount; floats are taken at their shortest repr.
+        currency (str): The amount's currency.
+        rounding (RoundingPolicy): Rounding for digits below the minor unit.
+
+    Returns:
+        int: The amount in minor units.
+    """
+    value = Decimal(str(amount)).scaleb(currency_scale(currency))
+    return int(value.quantize(Decimal(1), rounding=_DECIMAL_ROUNDING[rounding]))
+
+def from_minor_units(minor_amount, currency):
+    """Convert integer minor units back to an exact ``Decimal`` amount."""
+    return Decimal(int(minor_amount)).scaleb(-currency_scale(currency))
+
+def _mul_u64(a, b):
+    """Multiply uint64 arrays into 128-bit ``(hi, lo)`` products using 32-bit limbs."""
+    a_lo, a_hi = a & _MASK32, a >> _SHIFT32
+    b_lo, b_hi = b & _MASK32, b >> _SHIFT32
+    low_low = a_lo * b_lo
+    low_high = a_lo * b_hi
+    high_low = a_hi * b_lo
+    middle = (low_low >> _SHIFT32) + (low_high & _MASK32) + (high_low & _MASK32)
+    lo = (low_low & _MASK32) | ((middle & _MASK32) << _SHIFT32)
+    hi = a_hi * b_hi + (low_high >> _SHIFT32) + (high_low >> _SHIFT32) + (middle >> _SHIFT32)
+    return hi, lo
+
+def _divmod_u128(hi, lo, divisor):
+    """Long-divide 128-bit ``(hi, lo)`` values by a scalar divisor below 2**32."""
+    divisor = np.uint64(divisor)
+    remainder = np.zeros_like(lo)
+    limbs = []
+    for limb in (hi >> _SHIFT32, hi & _MASK32, lo >> _SHIFT32, lo & _MASK32):
+        current = (remainder << _SHIFT32) | limb
+        limbs.append(current // divisor)
+        remainder = current % divisor
+    return (limbs[0] << _SHIFT32) | limbs[1], (limbs[2] << _SHIFT32) | limbs[3], remainder
+
+def _scaled_divide(amounts, rates, exponent, rounding):
+    """
+    Compute ``round(amounts * rates / 10**exponent)`` exactly for int64 arrays.
+
+    The product is formed in 128 bits and divided by powers of ten in steps
+    small enough for 64-bit long division; the remainders are recombined so
+    the rounding decision sees the exact fraction.
+    """
+    negative = amounts < 0
+    magnitude = np.abs(amounts).astype(np.uint64)
+    hi, lo = _mul_u64(magnitude, rates.astype(np.uint64))
+
+    remainder = np.zeros_like(lo)
+    scale = np.uint64(1)
+    left = exponent
+    while left > 0:
+        step = min(left, _MAX_DIVISOR_STEP)
+        hi, lo, step_remainder = _divmod_u128(hi, lo, 10 ** step)
+        remainder += step_remainder * scale
+        scale *= np.uint64(10 ** step)
+        left -= step
+    if np.any(hi) or np.any(lo > _INT64_MAX):
+        logger.error("Converted amount does not fit in int64 minor units.")
+        raise OverflowError("Converted amount does not fit in int64 minor units.")
+
+    quotient = lo
+    if exponent > 0:
+        inexact = remainder > 0
+        twice = remainder * np.uint64(2)
+        if rounding is RoundingPolicy.HALF_EVEN:
+            round_away = (twice > scale) | ((twice == scale) & ((quotient & np.uint64(1)) == 1))
+        elif rounding is RoundingPolicy.HALF_UP:
+            round_away = twice >= scale
+        elif rounding is RoundingPolicy.DOWN:
+            round_away = np.zeros_like(inexact)
+        elif rounding is RoundingPolicy.FLOOR:
+            round_away = inexact & negative
+        else:
+            round_away = inexact & ~negative
+        quotient = quotient + round_away.astype(np.uint64)
+
+    result = quotient.astype(np.int64)
+    return np.where(negative, -result, result)
+
+class FixedPointConverter:
+    """Exact currency conversion over int64 minor units.
+
+    Rates are quantized once per snapshot to ``rate_decimals`` decimal places
+    (an int64 numerator over ``10**rate_decimals``). Conversion multiplies in
+    128-bit integer arithmetic and rounds once to the target currency's minor
+    unit with an explicit ``RoundingPolicy``, so results are exact and
+    reproducible while the kernels stay vectorized.
+    """
+
+    def __init__(self, rate_provider, rate_decimals=9, rounding=RoundingPolicy.HALF_EVEN):
+        """
+        Initialize the converter.
+
+        Args:
+            rate_provider (ExchangeRateProvider): Source of rate snapshots.
+            rate_decimals (int): Decimal places kept when quantizing rates.
+            rounding (RoundingPolicy): Default rounding of converted amounts.
+        """
+        if not 0 <= rate_decimals <= 12:
+            raise ValueError("rate_decimals must be between 0 and 12.")
+        self.rate_provider = rate_provider
+        self.rate_decimals = rate_decimals
+        self.rounding = rounding
+        self._quantized = {}
+        logger.info("FixedPointConverter initialized with %d rate decimals and %s rounding.",
+                    rate_decimals, rounding.value)
+
+    def quantized_rates(self, snapshot=None):
+        """
+        Return the snapshot's cross-rate matrix quantized to integer numerators.
+
+        Returns:
+            tuple: ``(snapshot, numerators)`` where ``numerators`` is an int64 matrix
+            (-1 where no finite rate exists) over ``10**rate_decimals``.
+        """
+        snapshot = self.rate_provider.get_snapshot(snapshot)
+        numerators = self._quantized.get(snapshot.version)
+        if numerators is None:
+            with np.errstate(invalid="ignore", over="ignore"):
+                scaled = np.rint(snapshot.matrix * 10.0 ** self.rate_decimals)
+            valid = np.isfinite(scaled) & (scaled >= 0) & (scaled < 2.0 ** 63)
+            numerators = np.where(valid, scaled, -1).astype(np.int64)
+            numerators.setflags(write=False)
+            # Keep only a handful of versions; snapshots are immutable so entries never go stale.
+            if len(self._quantized) >= 8:
+                self._quantized.pop(next(iter(self._quantized)))
+            self._quantized[snapshot.version] = numerators
+        return snapshot, numerators
+
+    def convert_minor_many(self, minor_amounts, from_currencies, to_currencies, snapshot=None, rounding=None):
+        """
+        Convert int64 minor-unit amounts in one vectorized pass.
+
+        Args:
+            minor_amounts (array-like): Amounts in minor units of their source currency.
+            from_currencies (array-like): Source currency codes aligned with the amounts.
+            to_currencies (array-like): Target currency codes aligned with the amounts.
+            snapshot (int or RateSnapshot): Pin the conversion to a snapshot version.
+            rounding (RoundingPolicy): Override the default rounding policy.
+
+        Returns:
+            np.ndarray: Converted amounts in minor units of the target currencies (int64).
+
+        Raises:
+            ValueError: If the inputs are misaligned, an amount does not fit in int64 or a
+                currency pair cannot be resolved.
+            OverflowError: If a converted amount does not fit in int64.
+        """
+        rounding = rounding or self.rounding
+        minor_amounts = np.asarray(minor_amounts)
+        if minor_amounts.dtype.kind not in "iu":
+            raise ValueError("Minor-unit amounts must be integers.")
+        if minor_amounts.dtype.kind == "u" and np.any(minor_amounts > _INT64_MAX):
+            # astype would silently wrap these to negative amounts.
+            logger.error("Minor-unit amounts must fit in int64.")
+            raise ValueError("Minor-unit amounts must fit in int64.")
+        minor_amounts = minor_amounts.astype(np.int64)
+        from_currencies = np.asarray(from_currencies, dtype=str)
+        to_currencies = np.asarray(to_currencies, dtype=str)
+        if minor_amounts.ndim != 1 or from_currencies.shape != minor_amounts.shape or to_currencies.shape != minor_amounts.shape:
+            logger.error("Amounts and currency codes must be aligned one-dimensional arrays.")
+            raise ValueError("Amounts and currency codes must be aligned one-dimensional arrays.")
+        count = minor_amounts.shape[0]
+        if np.any(minor_amounts == np.iinfo(np.int64).min):
+            raise OverflowError("Minor-unit amounts must be greater than the int64 minimum.")
+        if count == 0:
+            return np.empty(0, dtype=np.int64)
+
+        snapshot, numerators = self.quantized_rates(snapshot)
+        codes, inverse = np.unique(np.concatenate([from_currencies, to_currencies]), return_inverse=True)
+        inverse = inverse.reshape(-1)
+        positions = snapshot.positions(codes.tolist())
+        scales = np.array([currency_scale(str(code)) for code in codes], dtype=np.int64)
+        from_codes, to_codes = inverse[:count], inverse[count:]
+
+        rates = np.full(count, -1, dtype=np.int64)
+        known = (positions[from_codes] >= 0) & (positions[to_codes] >= 0)
+        rates[known] = numerators[positions[from_codes][known], positions[to_codes][known]]
+        if np.any(rates < 0):
+            row = int(np.flatnonzero(rates < 0)[0])
+            logger.error("Exchange rate not found for %s to %s.", from_currencies[row], to_currencies[row])
+            raise ValueError(f"Exchange rate not found for {from_currencies[row]} to {to_currencies[row]}.")
+
+        exponents = self.rate_decimals + scales[from_codes] - scales[to_codes]
+        converted = np.empty(count, dtype=np.int64)
+        for exponent in np.unique(exponents).tolist():
+            rows = exponents == exponent
+            if exponent < 0:
+                # Fold the scale into the rate; the product must itself fit in int64.
+                limit = np.iinfo(np.int64).max
+                factor = 10 ** -exponent
+                if factor > limit or np.any(rates[rows] > limit // factor):
+                    logger.error("Scaled exchange rate does not fit in int64.")
+                    raise OverflowError("Scaled exchange rate does not fit in int64.")
+                converted[rows] = _scaled_divide(minor_amounts[rows], rates[rows] * np.int64(factor), 0, rounding)
+            else:
+                converted[rows] = _scaled_divide(minor_amounts[rows], rates[rows], exponent, rounding)
+        logger.info("Converted batch of %d minor-unit amounts.", count)
+        return converted
+
+    def convert_minor(self, minor_amount, from_currency, to_currency, snapshot=None, rounding=None):
+        """Convert a single minor-unit amount; see ``convert_minor_many``."""
+        return int(self.convert_minor_many([int(minor_amount)], [from_currency], [to_currency],
+                                           snapshot=snapshot, rounding=rounding)[0])
+
+    def convert(self, amount, from_currency, to_currency, snapshot=None, rounding=None):
+        """
+        Convert a major-unit amount exactly.
+
+        Args:
+            amount (str, int or Decimal): The amount in ``from_currency``.
+            from_currency (str): The currency to convert from.
+            to_currency (str): The currency to convert to.
+
+        Returns:
+            Decimal: The converted amount, rounded to the target's minor unit.
+        """
+        rounding = rounding or self.rounding
+        minor_amount = to_minor_units(amount, from_currency, rounding)
+        converted = self.convert_minor(minor_amount, from_currency, to_currency, snapshot, rounding)
+        return from_minor_units(converted, to_currency)
@@ -0,0 +1,229 @@
+# src/modules/currency_exchange/pipeline.py
+
+import logging
+import queue
+import threading
+import time
+import numpy as np
+from .ledger import TransactionLedger
+from .transaction import _coerce_amounts
+
+# Configure logging for the transaction pipeline module
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+class TransactionPipeline:
+    """Pipelined transaction processing with batched ledger writes.
+
+    Submitted transactions flow through an input queue into a conversion
+    stage that converts micro-batches with ``CurrencyConverter.convert_many``
+    and then into a ledger writer that group-commits everything queued to
+    SQLite in one transaction. A micro-batch is cut when it reaches
+    ``batch_size`` or ``flush_interval`` seconds after its first transaction.
+    A failed commit is retried; rows that still cannot be written are kept in
+    ``unwritten_rows`` and make ``close`` raise.
+    """
+
+    def __init__(self, converter, ledger, batch_size=1000, flush_interval=0.05, max_queue_size=100000,
+                 write_retries=3, retry_delay=0.05):
+        """
+        Initialize the pipeline and start its stages.
+
+        Args:
+            converter (CurrencyConverter): Converter used by the conversion stage.
+            ledger (TransactionLedger or str): Ledger, or a SQLite URI such as ``Config.DB_URI``.
+            batch_size (int): Maximum transactions per micro-batch.
+            flush_interval (float): Maximum seconds a transaction waits for its batch to fill.
+            max_queue_size (int): Bound on queued transactions; ``submit`` blocks when full.
+            write_retries (int): Retries of a failed ledger commit before its rows are set aside.
+            retry_delay (float): Seconds before the first retry; doubled for each further retry.
+        """
+        self.converter = converter
+        self._owns_ledger = not isinstance(ledger, TransactionLedger)
+        self.ledger = TransactionLedger(ledger) if self._owns_ledger else ledger
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.write_retries = write_retries
+        self.retry_delay = retry_delay
+        self.unwritten_rows = []
+        self._input = queue.Queue(maxsize=max_queue_size)
+        self._ledger_queue = queue.Queue(maxsize=max(2, max_queue_size // max(batch_size, 1)))
+        self._stats_lock = threading.Lock()
+        self.submitted = 0
+        self.converted = 0
+        self.failed = 0
+        self.committed = 0
+        self.commits = 0
+        self.last_error = None
+        self._started_at = time.perf_counter()
+        self._closed = False
+        self._converter_thread = threading.Thread(target=self._convert_loop, name="txn-convert", daemon=True)
+        self._writer_thread = threading.Thread(target=self._write_loop, name="txn-ledger", daemon=True)
+        self._converter_thread.start()
+        self._writer_thread.start()
+        logger.info("TransactionPipeline started with batch size %d and flush interval %.3fs.",
+                    batch_size, flush_interval)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, amount, from_currency, to_currency):
+        """Queue one transaction for conversion and durable logging."""
+        if self._closed:
+            raise RuntimeError("TransactionPipeline is closed.")
+        self._input.put((amount, from_currency, to_currency))
+        with self._stats_lock:
+            self.submitted += 1
+
+    def submit_many(self, transactions):
+        """
+        Queue many transactions.
+
+        Args:
+            transactions (list): Dictionaries with 'amount', 'from_currency' and 'to_currency'.
+        """
+        for transaction in transactions:
+            self.submit(transaction['amount'], transaction['from_currency'], transaction['to_currency'])
+
+    def close(self):
+        """
+        Flush every queued transaction to the ledger and stop the pipeline.
+
+        A ledger the pipeline created from a URI is closed as well.
+
+        Raises:
+            RuntimeError: If some transactions could not be committed; they remain in ``unwritten_rows``.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._input.put(_STOP)
+        self._converter_thread.join()
+        self._writer_thread.join()
+        if self._owns_ledger:
+            self.ledger.close()
+        logger.info("TransactionPipeline closed: %s", self.metrics())
+        if self.unwritten_rows:
+            logger.error("%d transactions were not committed to the ledger.", len(self.unwritten_rows))
+            raise RuntimeError(f"{len(self.unwritten_rows)} transactions were not committed to the ledger: "
+                               f"{self.last_error}")
+
+    def _next_batch(self):
+        """Block for a first transaction, then fill the batch until it is full or the interval expires."""
+        item = self._input.get()
+        if item is _STOP:
+            return None, True
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._input.get(timeout=remaining) if remaining > 0 else self._input.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _convert_loop(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._ledger_queue.put(self._convert_batch(batch))
+        self._ledger_queue.put(_STOP)
+
+    def _convert_batch(self, batch):
+        recorded_at = time.time()
+        raw_amounts, from_currencies, to_currencies = zip(*batch)
+        # Non-numeric amounts fail their own rows only; the rest of the micro-batch still converts.
+        amounts, amount_errors = _coerce_amounts(raw_amounts)
+        try:
+            converted, failures = self.converter._convert_many(amounts, from_currencies, to_currencies)
+        except Exception as e:
+            logger.error("Conversion stage failed for a batch of %d: %s", len(batch), e)
+            converted = np.full(len(batch), np.nan)
+            failures = {(str(f), str(t)): e for f, t in zip(from_currencies, to_currencies)}
+
+        rows = []
+        failed = 0
+        for row, (amount, from_currency, to_currency, converted_amount) in enumerate(
+                zip(amounts.tolist(), from_currencies, to_currencies, converted.tolist())):
+            error = amount_errors.get(row) or failures.get((str(from_currency), str(to_currency)))
+            if error is None:
+                rows.append((recorded_at, amount, from_currency, to_currency, converted_amount, "success", None))
+            else:
+                failed += 1
+                # Amounts are bound as Python floats; an invalid one is recorded as NULL with its error.
+                amount = None if row in amount_errors else amount
+                rows.append((recorded_at, amount, from_currency, to_currency, None, "failed", str(error)))
+        with self._stats_lock:
+            self.converted += len(batch) - failed
+            self.failed += failed
+        return rows
+
+    def _write_loop(self):
+        stopping = False
+        while not stopping:
+            rows = self._ledger_queue.get()
+            if rows is _STOP:
+                break
+            # Group-commit every batch that queued up while the previous commit ran.
+            while True:
+                try:
+                    more = self._ledger_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if more is _STOP:
+                    stopping = True
+                    break
+                rows.extend(more)
+            self._write(rows)
+
+    def _write(self, rows):
+        """Commit ``rows``, retrying with backoff; set them aside if every attempt fails."""
+        for attempt in range(self.write_retries + 1):
+            try:
+                self.ledger.write_batch(rows)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error("Ledger commit of %d transactions failed (attempt %d of %d): %s",
+                             len(rows), attempt + 1, self.write_retries + 1, e)
+                if attempt < self.write_retries:
+                    time.sleep(self.retry_delay * 2 ** attempt)
+                continue
+            with self._stats_lock:
+                self.committed += len(rows)
+                self.commits += 1
+            return
+        with self._stats_lock:
+            self.unwritten_rows.extend(rows)
+
+    def metrics(self):
+        """
+        Return pipeline throughput metrics.
+
+        Returns:
+            dict: Counts per stage, number of commits, average rows per commit,
+            queue depth, committed transactions per second and transactions that
+            could not be committed (``unwritten``).
+        """
+        with self._stats_lock:
+            elapsed = time.perf_counter() - self._started_at
+            return {
+                "submitted": self.submitted,
+                "converted": self.converted,
+                "failed": self.failed,
+                "committed": self.committed,
+                "unwritten": len(self.unwritten_rows),
+                "commits": self.commits,
+                "average_commit_size": self.committed / self.commits if self.commits else 0.0,
+                "queued": self._input.qsize(),
+                "throughput": self.committed / elapsed if elapsed > 0 else 0.0,
+                "last_error": self.last_error,
+            }
@@ -0,0 +1,205 @@
+# src/modules/currency_exchange/rate_history.py
+
+import logging
+import os
+import struct
+import threading
+import numpy as np
+
+# Configure logging for the rate history module
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"NXRH"
+_FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<4sHHI")  # magic, format version, reserved, currency count
+_CODE_WIDTH = 8
+
+class RateHistoryStore:
+    """Append-only on-disk history of exchange rate snapshots.
+
+    The file starts with a header listing a fixed currency universe, followed
+    by fixed-width little-endian records: a float64 timestamp and one float64
+    rate per currency, relative to the snapshot's base (NaN where the snapshot
+    had no rate). Since any base-relative vector ``v`` gives cross rates as
+    ``v[to] / v[from]``, each record resolves every pair. Reads go through a
+    read-only memory map and point-in-time lookups binary-search the
+    timestamp column, so snapshots must be appended in time order.
+    """
+
+    def __init__(self, path, currencies=None):
+        """
+        Open an existing history file or prepare a new one.
+
+        Args:
+            path (str): Path to the history file.
+            currencies (list): Currency universe for a new file. Defaults to the
+                currencies of the first appended snapshot. Ignored for existing files.
+        """
+        self.path = str(path)
+        self.currencies = None
+        self._lock = threading.Lock()
+        self._records = None
+        self._mapped_size = None
+        if os.path.isfile(self.path) and os.path.getsize(self.path) > 0:
+            self._read_header()
+            self._truncate_partial_record()
+        elif currencies:
+            self._write_header(currencies)
+        logger.info("RateHistoryStore opened at %s with %d snapshots.", self.path, len(self))
+
+    def _set_universe(self, currencies):
+        self.currencies = tuple(currencies)
+        self.currency_index = {code: position for position, code in enumerate(self.currencies)}
+        self.record_dtype = np.dtype([("timestamp", "<f8"), ("rates", "<f8", (len(self.currencies),))])
+        header_size = _PREFIX.size + _CODE_WIDTH * len(self.currencies)
+        self.header_size = header_size + (-header_size % 8)
+
+    def _write_header(self, currencies):
+        currencies = sorted(set(currencies))
+        if any(len(code.encode("ascii")) > _CODE_WIDTH for code in currencies):
+            raise ValueError(f"Currency codes must be at most {_CODE_WIDTH} ASCII characters.")
+        self._set_universe(currencies)
+        header = _PREFIX.pack(_MAGIC, _FORMAT_VERSION, 0, len(currencies))
+        header += b"".join(code.encode("ascii").ljust(_CODE_WIDTH, b"\0") for code in currencies)
+        with open(self.path, "wb") as history_file:
+            history_file.write(header.ljust(self.header_size, b"\0"))
+
+    def _read_header(self):
+        with open(self.path, "rb") as history_file:
+            magic, version, _, count = _PREFIX.unpack(history_file.read(_PREFIX.size))
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                logger.error("%s is not a rate history file.", self.path)
+                raise ValueError(f"{self.path} is not a rate history file.")
+            codes = history_file.read(_CODE_WIDTH * count)
+        self._set_universe(
+            codes[i:i + _CODE_WIDTH].rstrip(b"\0").decode("ascii") for i in range(0, len(codes), _CODE_WIDTH)
+        )
+
+    def _truncate_partial_record(self):
+        """Drop a trailing partial record left behind by an interrupted append."""
+        size = os.path.getsize(self.path)
+        excess = (size - self.header_size) % self.record_dtype.itemsize
+        if size >= self.header_size and excess:
+            logger.warning("Truncating %d bytes of partial record from %s.", excess, self.path)
+            with open(self.path, "r+b") as history_file:
+                history_file.truncate(size - excess)
+
+    def __len__(self):
+        if self.currencies is None:
+            return 0
+        return (os.path.getsize(self.path) - self.header_size) // self.record_dtype.itemsize
+
+    def _mapped_records(self):
+        """Return a read-only memory map of all complete records, remapping after appends."""
+        size = os.path.getsize(self.path) if self.currencies is not None else 0
+        if self._records is None or size != self._mapped_size:
+            count = len(self)
+            if count == 0:
+                self._records = np.empty(0, dtype=self.record_dtype if self.currencies is not None else "<f8")
+            else:
+                self._records = np.memmap(self.path, dtype=self.record_dtype, mode="r",
+                                          offset=self.header_size, shape=(count,))
+            self._mapped_size = size
+        return self._records
+
+    def append(self, snapshot, fsync=False):
+        """
+        Append a snapshot record.
+
+        Args:
+            snapshot (RateSnapshot): The snapshot to record.
+            fsync (bool): Force the record to stable storage before returning.
+
+        Raises:
+            ValueError: If the snapshot is older than the last recorded one.
+        """
+        if not len(snapshot):
+            return
+        with self._lock:
+            if self.currencies is None:
+                self._write_header(snapshot.currencies)
+            records = self._mapped_records()
+            if len(records) and snapshot.timestamp < records["timestamp"][-1]:
+                logger.error("Snapshots must be appended in timestamp order.")
+                raise ValueError("Snapshots must be appended in timestamp order.")
+
+            record = np.zeros(1, dtype=self.record_dtype)
+            record["timestamp"] = snapshot.timestamp
+            record["rates"] = np.nan
+            positions = [self.currency_index.get(code, -1) for code in snapshot.currencies]
+            known = np.array([position >= 0 for position in positions], dtype=bool)
+            if not known.all():
+                logger.debug("Dropping %d currencies outside the history universe.", int((~known).sum()))
+            record["rates"][0, np.array(positions)[known]] = snapshot.base_rates[known]
+
+            with open(self.path, "ab") as history_file:
+                history_file.write(record.tobytes())
+                history_file.flush()
+                if fsync:
+                    os.fsync(history_file.fileno())
+
+    def timestamps(self):
+        """Return the recorded snapshot timestamps in ascending order."""
+        records = self._mapped_records()
+        return records["timestamp"] if len(records) else np.empty(0)
+
+    def _record_at(self, timestamp):
+        records = self._mapped_records()
+        position = int(np.searchsorted(self.timestamps(), timestamp, side="right")) - 1
+        if position < 0:
+            logger.error("No exchange rate snapshot recorded at or before %s.", timestamp)
+            raise ValueError(f"No exchange rate snapshot recorded at or before {timestamp}.")
+        return records[position]
+
+    def latest(self, base_currency="USD"):
+        """
+        Return the most recent recorded rates.
+
+        Args:
+            base_currency (str): Base to express the rates in.
+
+        Returns:
+            tuple: ``(timestamp, rates)``, or None if the history is empty.
+        """
+        if len(self) == 0:
+            return None
+        return self.rates_at(float("inf"), base_currency)
+
+    def rates_at(self, timestamp, base_currency="USD"):
+        """
+        Return the rates in effect at ``timestamp``.
+
+        Args:
+            timestamp (float): Point in time (seconds since the epoch).
+            base_currency (str): Base to express the rates in.
+
+        Returns:
+            tuple: ``(snapshot_timestamp, rates)`` where ``rates`` maps currency codes
+            to units per one ``base_currency``.
+        """
+        record = self._record_at(timestamp)
+        rates = np.asarray(record["rates"])
+        base_position = self.currency_index.get(base_currency)
+        if base_position is None or not np.isfinite(rates[base_position]):
+            raise ValueError(f"No {base_currency} rate recorded at {timestamp}.")
+        relative = rates / rates[base_position]
+        return float(record["timestamp"]), {
+            code: float(value) for code, value in zip(self.currencies, relative.tolist()) if np.isfinite(value)
+        }
+
+    def rate_at(self, from_currency, to_currency, timestamp):
+        """
+        Return the exchange rate from one currency to another at ``timestamp``.
+
+        Raises:
+            ValueError: If no snapshot precedes ``timestamp`` or the pair was not recorded.
+        """
+        record = self._record_at(timestamp)
+        from_position = self.currency_index.get(from_currency)
+        to_position = self.currency_index.get(to_currency)
+        if from_position is not None and to_position is not None:
+            rate = float(record["rates"][to_position] / record["rates"][from_position])
+            if np.isfinite(rate):
+                return rate
+        logger.error("Exchange rate not found for %s to %s at %s.", from_currency, to_currency, timestamp)
+        raise ValueError(f"Exchange rate not found for {from_currency} to {to_currency} at {timestamp}.")
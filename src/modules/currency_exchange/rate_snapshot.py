@@ -0,0 +1,96 @@
+# src/modules/currency_exchange/rate_snapshot.py
+
+import time
+from types import MappingProxyType
+import numpy as np
+
+class RateSnapshot:
+    """An immutable, versioned set of exchange rates.
+
+    A snapshot holds the base-relative rate vector and the derived N x N
+    cross-rate matrix (``matrix[i, j]`` converts currency i into j) as
+    read-only arrays. Providers publish new snapshots by swapping a single
+    reference, so readers never lock and a batch can be pinned to one
+    consistent version.
+    """
+
+    __slots__ = ("version", "base_currency", "currencies", "currency_index", "base_rates", "matrix",
+                 "timestamp", "source", "_rates")
+
+    def __init__(self, version, rates, base_currency, timestamp=None, source="manual"):
+        """
+        Build a snapshot from base-relative rates.
+
+        Args:
+            version (int): Monotonically increasing snapshot version.
+            rates (dict): Mapping of currency code to units per one ``base_currency``.
+            base_currency (str): The base of ``rates``.
+            timestamp (float): When the rates were observed (defaults to now).
+            source (str): Where the rates came from, e.g. the API URL.
+        """
+        rates = dict(rates)
+        if rates:
+            rates.setdefault(base_currency, 1.0)
+        currencies = tuple(sorted(rates))
+        base_rates = np.array([rates[code] for code in currencies], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrix = base_rates[np.newaxis, :] / base_rates[:, np.newaxis]
+        base_rates.setflags(write=False)
+        matrix.setflags(write=False)
+
+        set_field = object.__setattr__
+        set_field(self, "version", version)
+        set_field(self, "base_currency", base_currency)
+        set_field(self, "currencies", currencies)
+        set_field(self, "currency_index", MappingProxyType({code: i for i, code in enumerate(currencies)}))
+        set_field(self, "base_rates", base_rates)
+        set_field(self, "matrix", matrix)
+        set_field(self, "timestamp", time.time() if timestamp is None else timestamp)
+        set_field(self, "source", source)
+        set_field(self, "_rates", MappingProxyType(rates))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RateSnapshot is immutable.")
+
+    def __repr__(self):
+        return (f"<RateSnapshot(version={self.version}, base={self.base_currency}, "
+                f"currencies={len(self.currencies)}, source={self.source})>")
+
+    def __len__(self):
+        return len(self.currencies)
+
+    @property
+    def rates(self):
+        """Read-only mapping of currency code to units per one ``base_currency``."""
+        return self._rates
+
+    def age(self):
+        """Return the snapshot's age in seconds."""
+        return time.time() - self.timestamp
+
+    def rate(self, from_currency, to_currency):
+        """
+        Return the rate converting ``from_currency`` into ``to_currency``.
+
+        Raises:
+            ValueError: If either currency is missing or the rate is not finite.
+        """
+        from_position = self.currency_index.get(from_currency)
+        to_position = self.currency_index.get(to_currency)
+        if from_position is not None and to_position is not None:
+            rate = float(self.matrix[from_position, to_position])
+            if np.isfinite(rate):
+                return rate
+        raise ValueError(f"Exchange rate not found for {from_currency} to {to_currency}.")
+
+    def positions(self, codes):
+        """
+        Map currency codes to matrix positions.
+
+        Args:
+            codes (iterable): Currency codes.
+
+        Returns:
+            np.ndarray: Positions, with -1 for codes missing from the snapshot.
+        """
+        return np.array([self.currency_index.get(str(code), -1) for code in codes], dtype=np.intp)
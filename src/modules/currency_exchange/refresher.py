@@ -0,0 +1,132 @@
+# src/modules/currency_exchange/refresher.py
+
+import logging
+import threading
+import time
+
+# Configure logging for the rate refresher module
+logger = logging.getLogger(__name__)
+
+class RateRefresher:
+    """Background thread that keeps an ExchangeRateProvider's snapshot fresh.
+
+    The refresher re-fetches rates ahead of expiry (at ``refresh_ahead`` of
+    the provider's TTL by default). While it is attached, the provider serves
+    the last good snapshot even past its TTL and merely wakes the refresher,
+    so conversions never wait on the network after start-up.
+    """
+
+    def __init__(self, provider, base_currency=None, refresh_interval=None, refresh_ahead=0.8, retry_interval=5.0):
+        """
+        Initialize the refresher.
+
+        Args:
+            provider (ExchangeRateProvider): The provider to keep fresh.
+            base_currency (str): Base to refresh; defaults to the provider's current base.
+            refresh_interval (float): Seconds between refreshes; defaults to
+                ``refresh_ahead * provider.cache_ttl``.
+            refresh_ahead (float): Fraction of the TTL after which to refresh.
+            retry_interval (float): Seconds to wait before retrying a failed refresh.
+        """
+        self.provider = provider
+        self.base_currency = base_currency or provider.base_currency
+        self.refresh_interval = refresh_interval or refresh_ahead * provider.cache_ttl
+        self.retry_interval = retry_interval
+        self.refresh_count = 0
+        self.failure_count = 0
+        self.last_refresh_latency = None
+        self.max_refresh_latency = 0.0
+        self.last_error = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self, warm=True):
+        """
+        Attach to the provider and start the background thread.
+
+        Args:
+            warm (bool): Fetch once synchronously first so the first conversion is served from memory.
+        """
+        if self._thread is not None:
+            return
+        if warm:
+            self.refresh()
+        self.provider.refresher = self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rate-refresher", daemon=True)
+        self._thread.start()
+        logger.info("RateRefresher started for base %s every %.1fs.", self.base_currency, self.refresh_interval)
+
+    def stop(self, timeout=None):
+        """Detach from the provider and stop the background thread."""
+        if self.provider.refresher is self:
+            self.provider.refresher = None
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("RateRefresher stopped.")
+
+    def request_refresh(self):
+        """Ask the background thread to refresh now; repeated requests coalesce."""
+        self._wake.set()
+
+    def refresh(self):
+        """
+        Refresh the provider's snapshot once, keeping the last good snapshot on failure.
+
+        Returns:
+            bool: True if the refresh succeeded.
+        """
+        start = time.perf_counter()
+        try:
+            self.provider.refresh_rates(self.base_currency)
+        except Exception as e:
+            self.failure_count += 1
+            self.last_error = str(e)
+            logger.warning("Background rate refresh failed; serving last good snapshot: %s", e)
+            return False
+        latency = time.perf_counter() - start
+        self.refresh_count += 1
+        self.last_refresh_latency = latency
+        self.max_refresh_latency = max(self.max_refresh_latency, latency)
+        self.last_error = None
+        return True
+
+    def _run(self):
+        succeeded = True
+        while not self._stop.is_set():
+            if succeeded:
+                self._wake.wait(self.refresh_interval)
+            else:
+                # Back off after a failure instead of retrying on every stale read.
+                self._stop.wait(self.retry_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            succeeded = self.refresh()
+
+    def metrics(self):
+        """
+        Return refresh metrics.
+
+        Returns:
+            dict: Snapshot age, refresh/failure counts, latest and maximum refresh latency and last error.
+        """
+        return {
+            "snapshot_age": self.provider.snapshot_age(),
+            "refresh_count": self.refresh_count,
+            "failure_count": self.failure_count,
+            "last_refresh_latency": self.last_refresh_latency,
+            "max_refresh_latency": self.max_refresh_latency,
+            "last_error": self.last_error,
+        }
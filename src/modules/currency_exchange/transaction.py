@@ -1,6 +1,8 @@
 # src/modules/currency_exchange/transaction.py
 
 import logging
+import numpy as np
+from .batch_result import BatchTransactionResult
 from .exchange_rates import CurrencyConverter
 
 # Configure logging for the transaction module
@@ -9,9 +11,16 @@ logger = logging.getLogger(__name__)
 class TransactionProcessor:
     """Class to process currency exchange transactions."""
     
-    def __init__(self, converter: CurrencyConverter):
-        """Initialize with a CurrencyConverter instance."""
+    def __init__(self, converter: CurrencyConverter, ledger=None):
+        """
+        Initialize with a CurrencyConverter instance.
+
+        Args:
+            converter (CurrencyConverter): Converter used for transactions.
+            ledger (TransactionLedger): Optional durable sink for ``log_transaction``.
+        """
         self.converter = converter
+        self.ledger = ledger
         logger.info("TransactionProcessor initialized.")
 
     def process_transaction(self, amount, from_currency, to_currency):
@@ -42,40 +51,87 @@ class TransactionProcessor:
             logger.error("Transaction failed: %s", e)
             return {"error": str(e), "status": "failed"}
 
-    def process_batch_transactions(self, transactions):
+    def process_batch_transactions(self, transactions, snapshot=None, columnar=False):
         """
         Process a batch of currency exchange transactions.
 
         Args:
             transactions (list): A list of transaction dictionaries, each containing
                                  'amount', 'from_currency', and 'to_currency'.
+            snapshot (int or RateSnapshot): Pin the whole batch to this rate snapshot version.
+            columnar (bool): Return a ``BatchTransactionResult`` instead of a list of dicts.
 
         Returns:
-            list: A list of dictionaries containing transaction results.
+            list or BatchTransactionResult: The transaction results.
         """
         logger.info("Processing batch transactions.")
-        results = []
-        for transaction in transactions:
-            result = self.process_transaction(
-                transaction['amount'],
-                transaction['from_currency'],
-                transaction['to_currency']
-            )
-            results.append(result)
-        logger.info("Batch processing complete. Results: %s", results)
+        amounts, amount_errors = _coerce_amounts([transaction['amount'] for transaction in transactions])
+        result = self._process_columns(
+            amounts,
+            [transaction['from_currency'] for transaction in transactions],
+            [transaction['to_currency'] for transaction in transactions],
+            snapshot,
+            amount_errors,
+        )
+        if columnar:
+            return result
+        results = result.to_dicts()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Batch results: %s", results)
         return results
 
+    def process_batch_arrays(self, amounts, from_currencies, to_currencies, snapshot=None):
+        """
+        Process a columnar batch of transactions.
+
+        Args:
+            amounts (array-like): Amounts to convert.
+            from_currencies (array-like): Source currency codes aligned with ``amounts``.
+            to_currencies (array-like): Target currency codes aligned with ``amounts``.
+            snapshot (int or RateSnapshot): Pin the whole batch to this rate snapshot version.
+
+        Returns:
+            BatchTransactionResult: Columnar results with lazy per-row dict views.
+        """
+        logger.info("Processing columnar batch transactions.")
+        return self._process_columns(np.asarray(amounts, dtype=np.float64), from_currencies, to_currencies, snapshot, {})
+
+    def _process_columns(self, amounts, from_currencies, to_currencies, snapshot, amount_errors):
+        try:
+            snapshot = self.converter.rate_provider.get_snapshot(snapshot)
+        except Exception as e:
+            # Like process_transaction, a failed rate fetch fails the transactions instead of raising.
+            logger.error("Batch failed: exchange rates are unavailable: %s", e)
+            return _failed_columns(amounts, from_currencies, to_currencies, str(e), amount_errors)
+        converted, codes, from_codes, to_codes, failed = self.converter._convert_coded(
+            amounts, from_currencies, to_currencies, snapshot)
+        if amount_errors:
+            failed[list(amount_errors)] = True
+        errors = {}
+        for row in np.flatnonzero(failed).tolist():
+            if row in amount_errors:
+                errors[row] = amount_errors[row]
+            else:
+                errors[row] = (f"Exchange rate not found for {codes[from_codes[row]]} "
+                               f"to {codes[to_codes[row]]}.")
+        status = failed.astype(np.uint8)  # TransactionStatus.SUCCESS == 0, FAILED == 1
+        result = BatchTransactionResult(amounts, codes, from_codes, to_codes, converted, status, errors)
+        logger.info("Batch processing complete: %d succeeded, %d failed.", len(result) - len(errors), len(errors))
+        return result
+
     def log_transaction(self, transaction_details):
         """
-        Log transaction details to a file or database.
+        Log transaction details to the ledger database, or the console if no ledger is set.
 
         Args:
             transaction_details (dict): The details of the transaction to log.
         """
-        # Here you can implement logging to a file or database
         logger.info("Logging transaction: %s", transaction_details)
-        # For demonstration, we will just log to console
-        print(f"Transaction logged: {transaction_details}")
+        if self.ledger is not None:
+            self.ledger.record(transaction_details)
+        else:
+            # Without a ledger there is no durable sink; just log to console
+            print(f"Transaction logged: {transaction_details}")
 
     def process_and_log_transaction(self, amount, from_currency, to_currency):
         """
@@ -92,3 +148,39 @@ class TransactionProcessor:
         transaction_details = self.process_transaction(amount, from_currency, to_currency)
         self.log_transaction(transaction_details)
         return transaction_details
+
+def _failed_columns(amounts, from_currencies, to_currencies, error, amount_errors):
+    """Build a ``BatchTransactionResult`` in which every row failed with ``error``."""
+    from_currencies = np.asarray(from_currencies, dtype=str)
+    to_currencies = np.asarray(to_currencies, dtype=str)
+    if amounts.ndim != 1 or from_currencies.shape != amounts.shape or to_currencies.shape != amounts.shape:
+        logger.error("Amounts and currency codes must be aligned one-dimensional arrays.")
+        raise ValueError("Amounts and currency codes must be aligned one-dimensional arrays.")
+    count = amounts.shape[0]
+    codes, inverse = np.unique(np.concatenate([from_currencies, to_currencies]), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    errors = {row: amount_errors.get(row, error) for row in range(count)}
+    return BatchTransactionResult(amounts, codes, inverse[:count], inverse[count:], np.full(count, np.nan),
+                                  np.ones(count, dtype=np.uint8), errors)
+
+def _coerce_amounts(values):
+    """
+    Convert amounts to a float64 array, marking non-numeric ones as NaN.
+
+    Returns:
+        tuple: ``(amounts, errors)`` where ``errors`` maps the row of each
+        non-numeric amount to its error message.
+    """
+    try:
+        return np.array(values, dtype=np.float64), {}
+    except (TypeError, ValueError):
+        pass
+    amounts = np.empty(len(values))
+    errors = {}
+    for row, value in enumerate(values):
+        try:
+            amounts[row] = float(value)
+        except (TypeError, ValueError) as e:
+            amounts[row] = np.nan
+            errors[row] = f"Invalid amount {value!r}: {e}"
+    return amounts, errors
@@ -2,47 +2,109 @@
 
 import logging
 import os
-import json
-from pathlib import Path
+from ...main.config import load_config_file
+from ...utils.lazy import lazy_attributes
 
 # Configure logging for the resource optimization module
 logger = logging.getLogger(__name__)
 
-# Load configuration from a JSON file or environment variables
-def load_config():
-    """Load configuration settings from a JSON file or environment variables."""
-    config_path = Path(os.getenv("RESOURCE_OPTIMIZATION_CONFIG", "config.json"))
-    if config_path.is_file():
-        with open(config_path) as config_file:
-            config = json.load(config_file)
-            logger.info("Configuration loaded from %s", config_path)
-            return config
-    else:
+def load_config(config_path=None):
+    """
+    Load configuration settings on demand.
+
+    Nothing is read at import time, so importing the package (for example in a
+    freshly spawned worker process) performs no file I/O. Parsed files are
+    cached by ``main.config.load_config_file`` until they change on disk.
+
+    Args:
+        config_path (str): Path to a JSON or YAML file. Defaults to the
+            ``RESOURCE_OPTIMIZATION_CONFIG`` environment variable, then ``config.json``.
+
+    Returns:
+        dict: The configuration, or an empty dict if the file does not exist.
+    """
+    config_path = config_path or os.getenv("RESOURCE_OPTIMIZATION_CONFIG", "config.json")
+    try:
+        config = load_config_file(config_path)
+    except FileNotFoundError:
         logger.warning("Configuration file not found. Using default settings.")
         return {}
+    logger.info("Configuration loaded from %s", config_path)
+    return config
 
-# Global configuration variable
-config = load_config()
+# The module-level ``config`` attribute, loaded on first access and kept until ``reload_config``
+_config = None
 
-__version__ = "1.0.0"
-__all__ = ["Optimizer", "ConsumptionAnalyzer", "create_resource_optimization_system", "configure_logging"]
+def reload_config(config_path=None):
+    """
+    Reload the configuration behind the module-level ``config`` attribute.
 
-def create_resource_optimization_system():
+    Args:
+        config_path (str): Path to a JSON or YAML file, see ``load_config``.
+
+    Returns:
+        dict: The reloaded configuration.
+    """
+    global _config
+    _config = load_config(config_path)
+    return _config
+
+__version__ = "1.0.0"
+__all__ = ["Optimizer", "ConsumptionAnalyzer", "LinearProgram", "QuadraticProgram", "MemoizedObjective",
+           "ConsumptionStats", "WindowedAggregator", "create_resource_optimization_system", "configure_logging",
+           "load_config", "reload_config"]
+
+# Optimizer (SciPy) and ConsumptionAnalyzer (pandas/matplotlib) are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "Optimizer": ".optimizer",
+    "ConsumptionAnalyzer": ".consumption_analysis",
+    "LinearProgram": ".linear",
+    "QuadraticProgram": ".linear",
+    "MemoizedObjective": ".memoization",
+    "ConsumptionStats": ".streaming",
+    "WindowedAggregator": ".windows",
+}
+
+_lazy_getattr, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
+
+def __getattr__(name):
+    if name == "config":
+        # Backwards-compatible module attribute, loaded once on first access.
+        return _config if _config is not None else reload_config()
+    return _lazy_getattr(name)
+
+def create_resource_optimization_system(config=None):
     """
     Factory method to create a resource optimization system.
 
+    Args:
+        config (dict): Configuration to use; loaded with ``load_config`` when omitted.
+
     Returns:
-        dict: A dictionary containing instances of the main classes.
+        dict: A dictionary containing instances of the main classes and the ``config`` they were
+        built from, so callers read settings from the system instead of reloading them.
+
+    Raises:
+        ValueError: If the configuration is invalid.
     """
     logger.info("Creating resource optimization system.")
     from .optimizer import Optimizer
     from .consumption_analysis import ConsumptionAnalyzer
 
+    if config is None:
+        config = load_config()
+    try:
+        validate_config(config)
+    except ValueError as e:
+        logger.error("Configuration validation failed: %s", e)
+        raise
+
     optimizer = Optimizer(config.get("optimizer_settings", {}))
     analyzer = ConsumptionAnalyzer(config.get("analysis_settings", {}))
     return {
         "optimizer": optimizer,
-        "analyzer": analyzer
+        "analyzer": analyzer,
+        "config": config
     }
 
 def configure_logging(level=logging.INFO):
@@ -78,13 +140,3 @@ def validate_config(config):
         if key not in config:
             raise ValueError(f"Missing required configuration key: {key}")
     logger.info("Configuration validated successfully.")
-
-# Validate the loaded configuration
-try:
-    validate_config(config)
-except ValueError as e:
-    logger.error("Configuration validation failed: %s", e)
-    raise
-
-# Initialize the module
-logger.info("Resource Optimization Module initialized.")
@@ -1,9 +1,7 @@
 # src/modules/resource_optimization/consumption_analysis.py
 
 import logging
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 
 # Configure logging for the consumption analysis module
 logger = logging.getLogger(__name__)
@@ -46,6 +44,58 @@ class ConsumptionAnalyzer:
             logger.error("Consumption analysis failed: %s", e)
             return {"error": str(e), "status": "failed"}
 
+    def analyze_consumption_stream(self, sources, chunksize=None, max_workers=None):
+        """
+        Analyze consumption data too large to load at once, in bounded memory.
+
+        Rows are read in chunks (``DataLoader.iter_chunks`` for files) and folded
+        into mergeable running aggregates (see ``streaming.ConsumptionStats``);
+        several files are aggregated in parallel and their results merged.
+
+        Args:
+            sources (str or list or iterable): A CSV/Parquet path, a list of paths, or an
+                iterable of DataFrame chunks.
+            chunksize (int): Rows per chunk read from files (``chunksize`` setting, default 100000).
+            max_workers (int): Worker processes for multiple files (defaults to the CPU count).
+
+        Returns:
+            dict: The ``analyze_consumption`` totals and averages plus count, variance, std, min,
+            max and approximate quantiles per column.
+        """
+        from .streaming import DEFAULT_QUANTILES, analyze_chunks, analyze_files
+
+        chunksize = chunksize or self.settings.get("chunksize", 100000)
+        quantiles = self.settings.get("quantiles", DEFAULT_QUANTILES)
+        relative_accuracy = self.settings.get("quantile_accuracy", 0.01)
+        logger.info("Starting streaming consumption analysis.")
+        try:
+            if isinstance(sources, (str, os.PathLike)):
+                sources = [sources]
+            sources = sources if isinstance(sources, (list, tuple)) else iter(sources)
+            if isinstance(sources, (list, tuple)) and all(isinstance(source, (str, os.PathLike)) for source in sources):
+                stats = analyze_files(sources, chunksize, quantiles, relative_accuracy, max_workers)
+            else:
+                stats = analyze_chunks(sources, quantiles, relative_accuracy)
+            logger.info("Streaming consumption analysis successful (%d rows).", stats.rows)
+            return stats.summary()
+        except Exception as e:
+            logger.error("Streaming consumption analysis failed: %s", e)
+            return {"error": str(e), "status": "failed"}
+
+    def create_window_aggregator(self):
+        """
+        Create an incremental windowed aggregator for live consumption data.
+
+        The window width and retained history come from the ``window_seconds``
+        (default 60) and ``window_history`` (default 60) settings.
+
+        Returns:
+            WindowedAggregator: An empty aggregator; feed it with ``add``, ``add_frame`` or ``ingest``.
+        """
+        from .windows import WindowedAggregator
+
+        return WindowedAggregator(self.settings.get("window_seconds", 60.0), self.settings.get("window_history", 60))
+
     def visualize_consumption(self, data, kind='bar'):
         """
         Visualize resource consumption data.
@@ -54,6 +104,9 @@ class ConsumptionAnalyzer:
             data (pd.DataFrame): DataFrame containing resource consumption data.
             kind (str): Type of plot to create (e.g., 'bar', 'line', 'heatmap').
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         logger.info("Visualizing consumption data with kind: %s", kind)
         try:
             plt.figure(figsize=(10, 6))
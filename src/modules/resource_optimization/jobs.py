@@ -0,0 +1,203 @@
+# src/modules/resource_optimization/jobs.py
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+
+# Configure logging for the optimization jobs module
+logger = logging.getLogger(__name__)
+
+# Per-problem "stop" flags shared with worker processes by the pool initializer
+_worker_stop_flags = None
+
+def _init_worker(stop_flags, log_level):
+    """Install the shared stop flags in a worker process."""
+    global _worker_stop_flags
+    _worker_stop_flags = stop_flags
+    logging.getLogger(__package__).setLevel(log_level)
+
+def _run_start(optimizer, problem_index, start_index, problem, x0, target_objective, stop_flags=None):
+    """
+    Run one start of one problem.
+
+    The run is skipped if the problem was already solved to its target, and
+    stops early (through the SciPy callback) as soon as it reaches the target
+    or another start of the same problem does.
+
+    Returns:
+        tuple: ``(problem_index, start_index, outcome)`` where ``outcome`` is None for a
+        skipped start, otherwise a dict with ``x``, ``fun``, ``success``, ``message``
+        and ``target_reached`` (or ``error``).
+    """
+    flags = _worker_stop_flags if stop_flags is None else stop_flags
+    if flags[problem_index]:
+        return problem_index, start_index, None
+
+    def stop_early(intermediate_result):
+        if flags[problem_index]:
+            raise StopIteration
+        if target_objective is None:
+            return
+        fun = getattr(intermediate_result, "fun", None)
+        if fun is None:
+            # Methods such as SLSQP (before SciPy 1.16) pass only the current point ``xk``.
+            fun = problem["objective_function"](intermediate_result)
+            fun = fun[0] if problem.get("jac") is True else fun
+        if fun <= target_objective:
+            flags[problem_index] = 1
+            raise StopIteration
+
+    try:
+        result = optimizer._solve(problem["objective_function"], x0, problem.get("constraints", ()),
+                                  problem.get("bounds"), callback=stop_early, jac=problem.get("jac"))
+    except Exception as e:
+        logger.error("Start %d of problem %d failed: %s", start_index, problem_index, e)
+        return problem_index, start_index, {"error": str(e)}
+
+    fun = float(result.fun)
+    target_reached = target_objective is not None and fun <= target_objective
+    if target_reached:
+        flags[problem_index] = 1
+    return problem_index, start_index, {
+        "x": np.asarray(result.x),
+        "fun": fun,
+        "success": bool(result.success) or target_reached,
+        "message": str(result.message),
+        "target_reached": target_reached,
+    }
+
+def starting_points(initial_resources, n_starts, bounds=None, rng=None):
+    """
+    Generate ``n_starts`` starting points, the first being ``initial_resources``.
+
+    Additional points are drawn uniformly from ``bounds``; unbounded or
+    missing bounds fall back to the ``(0, 1)`` box ``differential_evolution``
+    uses, widened to contain the initial point.
+
+    Returns:
+        np.ndarray: Array of shape ``(n_starts, len(initial_resources))``.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    x0 = np.asarray(initial_resources, dtype=float)
+    low = np.minimum(0.0, x0)
+    high = np.maximum(1.0, x0)
+    if bounds is not None:
+        for position, (lower, upper) in enumerate(bounds):
+            if lower is not None and np.isfinite(lower):
+                low[position] = lower
+            if upper is not None and np.isfinite(upper):
+                high[position] = upper
+    points = rng.uniform(low, high, size=(max(n_starts, 1), x0.shape[0]))
+    points[0] = x0
+    return points
+
+def run_optimization_jobs(optimizer, problems, n_starts=1, target_objective=None, max_workers=None, seed=None,
+                          log_level=logging.WARNING):
+    """
+    Solve many independent problems with multi-start restarts and keep the best result per problem.
+
+    Starts are scheduled round-robin across problems (every problem's first
+    start before any second start), with at most two tasks per worker in
+    flight. Once a problem reaches its target objective, its queued starts are
+    dropped and its running starts stop at their next iteration.
+
+    Args:
+        optimizer (Optimizer): Optimizer whose algorithm and settings are used for every start.
+        problems (dict or list): Problems keyed by ID (list positions are used as IDs). Each
+            problem is a dict with ``initial_resources`` and ``objective_function`` and optionally
+            ``constraints``, ``bounds``, ``jac``, ``n_starts`` and ``target_objective``. Objective functions
+            must be picklable (module-level functions) when more than one worker is used.
+        n_starts (int): Default number of starts per problem.
+        target_objective (float): Default objective value at which a problem counts as solved.
+        max_workers (int): Number of worker processes (defaults to the CPU count); 1 solves in-process.
+        seed (int): Seed for the random starting points.
+        log_level (int): Logging level for the resource optimization loggers in workers.
+
+    Returns:
+        dict: Mapping of problem ID to the best result: ``optimized_resources``, ``objective``,
+        ``status``, ``message``, ``start``, ``starts_completed``, ``starts_cancelled`` and
+        ``target_reached`` (or ``error`` and ``status`` "failed" if every start failed).
+    """
+    items = list(problems.items()) if isinstance(problems, dict) else list(enumerate(problems))
+    rng = np.random.default_rng(seed)
+    starts = []
+    targets = []
+    for problem_id, problem in items:
+        if "initial_resources" not in problem or "objective_function" not in problem:
+            logger.error("Problem %r needs 'initial_resources' and 'objective_function'.", problem_id)
+            raise ValueError(f"Problem {problem_id!r} needs 'initial_resources' and 'objective_function'.")
+        targets.append(problem.get("target_objective", target_objective))
+        starts.append(starting_points(problem["initial_resources"], problem.get("n_starts", n_starts),
+                                      problem.get("bounds"), rng))
+
+    # Round-robin schedule: (problem_index, start_index)
+    schedule = deque(
+        (problem_index, start_index)
+        for start_index in range(max(len(points) for points in starts) if starts else 0)
+        for problem_index, points in enumerate(starts) if start_index < len(points)
+    )
+    outcomes = [[] for _ in items]
+    cancelled = [0] * len(items)
+    max_workers = max_workers or os.cpu_count() or 1
+    logger.info("Running %d optimization starts for %d problems on %d workers.",
+                len(schedule), len(items), max_workers)
+
+    def task_args(problem_index, start_index):
+        return (optimizer, problem_index, start_index, items[problem_index][1],
+                starts[problem_index][start_index], targets[problem_index])
+
+    def record(outcome):
+        problem_index, _, result = outcome
+        if result is None:
+            cancelled[problem_index] += 1
+        else:
+            outcomes[problem_index].append(outcome[1:])
+
+    if max_workers == 1:
+        stop_flags = bytearray(len(items))
+        for problem_index, start_index in schedule:
+            record(_run_start(*task_args(problem_index, start_index), stop_flags=stop_flags))
+    else:
+        context = multiprocessing.get_context()
+        stop_flags = context.RawArray("b", len(items))
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(stop_flags, log_level)) as pool:
+            pending = set()
+            while schedule or pending:
+                while schedule and len(pending) < 2 * max_workers:
+                    problem_index, start_index = schedule.popleft()
+                    if stop_flags[problem_index]:
+                        cancelled[problem_index] += 1
+                        continue
+                    pending.add(pool.submit(_run_start, *task_args(problem_index, start_index)))
+                if pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        outcome = future.result()
+                        if outcome[2] is not None and outcome[2].get("target_reached"):
+                            stop_flags[outcome[0]] = 1
+                        record(outcome)
+
+    results = {}
+    for problem_index, (problem_id, _) in enumerate(items):
+        solved = [(start_index, result) for start_index, result in outcomes[problem_index] if "error" not in result]
+        summary = {"starts_completed": len(outcomes[problem_index]), "starts_cancelled": cancelled[problem_index]}
+        if not solved:
+            errors = [result["error"] for _, result in outcomes[problem_index]]
+            results[problem_id] = {"error": errors[0] if errors else "No starts were run.", "status": "failed",
+                                   **summary}
+            continue
+        start_index, best = min(solved, key=lambda item: (not item[1]["success"], item[1]["fun"]))
+        results[problem_id] = {
+            "optimized_resources": best["x"],
+            "objective": best["fun"],
+            "status": "success" if best["success"] else "failed",
+            "message": best["message"],
+            "start": start_index,
+            "target_reached": best["target_reached"],
+            **summary,
+        }
+    return results
@@ -0,0 +1,291 @@
+# src/modules/resource_optimization/linear.py
+
+import logging
+import numpy as np
+from scipy import sparse
+from scipy.optimize import Bounds, LinearConstraint, linprog, minimize
+from scipy.sparse.linalg import splu
+
+# Configure logging for the linear programming module
+logger = logging.getLogger(__name__)
+
+def _as_matrix(matrix, n):
+    if matrix is None:
+        return None
+    matrix = sparse.csr_matrix(matrix, dtype=float)
+    if matrix.shape[1] != n:
+        logger.error("Constraint matrix has %d columns, expected %d.", matrix.shape[1], n)
+        raise ValueError(f"Constraint matrix has {matrix.shape[1]} columns, expected {n}.")
+    return matrix
+
+def _as_vector(vector, rows, name):
+    vector = np.asarray(vector, dtype=float).ravel()
+    if vector.shape[0] != rows:
+        logger.error("%s has %d entries, expected %d.", name, vector.shape[0], rows)
+        raise ValueError(f"{name} has {vector.shape[0]} entries, expected {rows}.")
+    return vector
+
+class LinearProgram:
+    """
+    An allocation problem declared by its coefficients::
+
+        minimize    c @ x
+        subject to  A_ub @ x <= b_ub
+                    A_eq @ x == b_eq
+                    bounds[i][0] <= x[i] <= bounds[i][1]
+
+    Constraint matrices may be dense arrays or SciPy sparse matrices; they are
+    stored as CSR. Bounds default to ``(0, None)`` (non-negative allocations),
+    as in ``linprog``. Instances are also callable as an ordinary objective.
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=(0, None)):
+        self.c = np.asarray(c, dtype=float).ravel()
+        n = self.c.shape[0]
+        if (A_ub is None) != (b_ub is None) or (A_eq is None) != (b_eq is None):
+            logger.error("Constraint matrices and right-hand sides must be given together.")
+            raise ValueError("Constraint matrices and right-hand sides must be given together.")
+        self.A_ub = _as_matrix(A_ub, n)
+        self.b_ub = None if A_ub is None else _as_vector(b_ub, self.A_ub.shape[0], "b_ub")
+        self.A_eq = _as_matrix(A_eq, n)
+        self.b_eq = None if A_eq is None else _as_vector(b_eq, self.A_eq.shape[0], "b_eq")
+        self.bounds = bounds
+
+    @property
+    def size(self):
+        """Number of resources (decision variables)."""
+        return self.c.shape[0]
+
+    def bound_arrays(self):
+        """Return the bounds as ``(lower, upper)`` arrays with infinities for missing bounds."""
+        bounds = self.bounds if self.bounds is not None else (None, None)
+        if len(bounds) == 2 and not isinstance(bounds[0], (tuple, list, np.ndarray)):
+            bounds = [bounds] * self.size
+        lower = np.array([-np.inf if low is None else low for low, _ in bounds], dtype=float)
+        upper = np.array([np.inf if high is None else high for _, high in bounds], dtype=float)
+        return lower, upper
+
+    def __call__(self, x):
+        return float(self.c @ x)
+
+    def gradient(self, x):
+        return self.c
+
+    def as_constraints(self):
+        """Return the constraints as ``minimize``-style dicts (for the general solvers)."""
+        constraints = []
+        if self.A_ub is not None:
+            constraints.append({"type": "ineq", "fun": lambda x: self.b_ub - self.A_ub @ x,
+                                "jac": lambda x: -self.A_ub.toarray()})
+        if self.A_eq is not None:
+            constraints.append({"type": "eq", "fun": lambda x: self.A_eq @ x - self.b_eq,
+                                "jac": lambda x: self.A_eq.toarray()})
+        return constraints
+
+class QuadraticProgram(LinearProgram):
+    """
+    A ``LinearProgram`` with an added quadratic term, minimizing ``0.5 * x @ Q @ x + c @ x``.
+
+    ``Q`` must be symmetric positive semidefinite for the solution to be a
+    global minimum; it may be dense or sparse.
+    """
+
+    def __init__(self, Q, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=(0, None)):
+        super().__init__(c, A_ub, b_ub, A_eq, b_eq, bounds)
+        self.Q = sparse.csr_matrix(Q, dtype=float)
+        if self.Q.shape != (self.size, self.size):
+            logger.error("Q has shape %s, expected %s.", self.Q.shape, (self.size, self.size))
+            raise ValueError(f"Q has shape {self.Q.shape}, expected {(self.size, self.size)}.")
+
+    def __call__(self, x):
+        return float(0.5 * x @ (self.Q @ x) + self.c @ x)
+
+    def gradient(self, x):
+        return self.Q @ x + self.c
+
+    def hessian(self, x):
+        return self.Q
+
+def solve_linear_program(program):
+    """
+    Solve a ``LinearProgram`` with the HiGHS solver.
+
+    Returns:
+        dict: ``optimized_resources``, ``objective``, ``status``, ``message``, ``solver``,
+        ``iterations`` and the constraint ``duals`` (marginals, i.e. shadow prices of capacity).
+    """
+    result = linprog(program.c, A_ub=program.A_ub, b_ub=program.b_ub, A_eq=program.A_eq, b_eq=program.b_eq,
+                     bounds=program.bounds, method="highs")
+    if not result.success:
+        logger.error("Linear program failed: %s", result.message)
+        return {"error": result.message, "status": "failed", "solver": "highs"}
+    duals = {}
+    if program.A_ub is not None:
+        duals["ineqlin"] = result.ineqlin.marginals
+    if program.A_eq is not None:
+        duals["eqlin"] = result.eqlin.marginals
+    return {
+        "optimized_resources": result.x,
+        "objective": float(result.fun),
+        "status": "success",
+        "message": result.message,
+        "solver": "highs",
+        "iterations": int(result.nit),
+        "duals": duals,
+    }
+
+def _admm_qp(P, q, A, lower, upper, tolerance=1e-8, infeasibility_tolerance=1e-5, max_iterations=10000,
+             sigma=1e-6, alpha=1.6):
+    """
+    Solve ``min 0.5 x'Px + q'x  s.t.  lower <= Ax <= upper`` with the operator-splitting
+    (ADMM) iteration used by OSQP.
+
+    Every iteration solves the same sparse quasi-definite KKT system, so it is
+    factorized once (and again only when the step size ``rho`` is rebalanced);
+    an iteration then costs two triangular solves and a few sparse products.
+    Like OSQP, the iteration stops early when the change in ``y`` certifies
+    primal infeasibility or the change in ``x`` certifies dual infeasibility
+    (an unbounded objective).
+
+    Returns:
+        tuple: ``(x, iterations, status)`` with ``status`` one of ``"solved"``,
+        ``"primal_infeasible"``, ``"dual_infeasible"`` or ``"max_iterations"``.
+    """
+    n, m = P.shape[0], A.shape[0]
+    equality = upper - lower < 1e-12
+    lower_finite, upper_finite = np.isfinite(lower), np.isfinite(upper)
+    finite_lower, finite_upper = np.where(lower_finite, lower, 0.0), np.where(upper_finite, upper, 0.0)
+
+    def factorize(rho):
+        rho_rows = np.where(equality, 1e3 * rho, rho)  # Stiffer steps for equality rows, as in OSQP
+        kkt = sparse.bmat([[P + sigma * sparse.identity(n), A.T], [A, sparse.diags(-1.0 / rho_rows)]], format="csc")
+        return splu(kkt), rho_rows
+
+    def primal_infeasible(delta_y):
+        # delta_y certifies infeasibility if A'dy ~ 0 and u'max(dy, 0) + l'min(dy, 0) < 0.
+        norm = np.max(np.abs(delta_y), initial=0.0)
+        if norm == 0.0:
+            return False
+        threshold = infeasibility_tolerance * norm
+        positive, negative = np.maximum(delta_y, 0.0), np.minimum(delta_y, 0.0)
+        if np.any(positive[~upper_finite] > threshold) or np.any(negative[~lower_finite] < -threshold):
+            return False
+        return (np.max(np.abs(A.T @ delta_y), initial=0.0) <= threshold
+                and finite_upper @ positive + finite_lower @ negative <= -threshold)
+
+    def dual_infeasible(delta_x):
+        # delta_x certifies an unbounded objective if P dx ~ 0, q'dx < 0 and A dx keeps every row feasible.
+        norm = np.max(np.abs(delta_x), initial=0.0)
+        if norm == 0.0:
+            return False
+        threshold = infeasibility_tolerance * norm
+        if np.max(np.abs(P @ delta_x), initial=0.0) > threshold or q @ delta_x > -threshold:
+            return False
+        A_delta = A @ delta_x
+        return not (np.any(A_delta[upper_finite] > threshold) or np.any(A_delta[lower_finite] < -threshold))
+
+    rho = 0.1
+    kkt, rho_rows = factorize(rho)
+    x = np.zeros(n)
+    z = np.clip(np.zeros(m), lower, upper)
+    y = np.zeros(m)
+    for iteration in range(1, max_iterations + 1):
+        x_previous, y_previous = x, y
+        solution = kkt.solve(np.concatenate([sigma * x - q, z - y / rho_rows]))
+        z_tilde = z + (solution[n:] - y) / rho_rows
+        x = alpha * solution[:n] + (1 - alpha) * x
+        z_relaxed = alpha * z_tilde + (1 - alpha) * z
+        z_next = np.clip(z_relaxed + y / rho_rows, lower, upper)
+        y = y + rho_rows * (z_relaxed - z_next)
+        z = z_next
+        if iteration % 10:
+            continue
+        Ax, Px, ATy = A @ x, P @ x, A.T @ y
+        primal = np.max(np.abs(Ax - z), initial=0.0)
+        dual = np.max(np.abs(Px + q + ATy), initial=0.0)
+        primal_scale = max(np.max(np.abs(Ax), initial=0.0), np.max(np.abs(z), initial=0.0))
+        dual_scale = max(np.max(np.abs(Px), initial=0.0), np.max(np.abs(ATy), initial=0.0),
+                         np.max(np.abs(q), initial=0.0))
+        if primal <= tolerance * (1 + primal_scale) and dual <= tolerance * (1 + dual_scale):
+            return x, iteration, "solved"
+        if primal_infeasible(y - y_previous):
+            return x, iteration, "primal_infeasible"
+        if dual_infeasible(x - x_previous):
+            return x, iteration, "dual_infeasible"
+        if iteration % 50 == 0:
+            # Rebalance rho so that primal and dual residuals shrink at a similar rate.
+            balanced = rho * np.sqrt((primal / (primal_scale + 1e-12)) / (dual / (dual_scale + 1e-12) + 1e-12))
+            balanced = min(max(balanced, 1e-6), 1e6)
+            if balanced > 5 * rho or balanced < rho / 5:
+                rho = balanced
+                kkt, rho_rows = factorize(rho)
+    return x, max_iterations, "max_iterations"
+
+def solve_quadratic_program(program, initial_resources=None):
+    """
+    Solve a ``QuadraticProgram``.
+
+    The sparse ADMM solver handles the problem first and reports infeasible or
+    unbounded problems itself; only if it runs out of iterations is
+    ``trust-constr`` run with the exact gradient and sparse Hessian.
+
+    Args:
+        program (QuadraticProgram): The problem.
+        initial_resources (list): Optional starting point for the ``trust-constr`` fallback;
+            defaults to zeros clipped to the bounds.
+
+    Returns:
+        dict: ``optimized_resources``, ``objective``, ``status``, ``message``, ``solver`` and ``iterations``.
+    """
+    lower, upper = program.bound_arrays()
+    rows, row_lower, row_upper = [], [], []
+    if program.A_ub is not None:
+        rows.append(program.A_ub)
+        row_lower.append(np.full(program.A_ub.shape[0], -np.inf))
+        row_upper.append(program.b_ub)
+    if program.A_eq is not None:
+        rows.append(program.A_eq)
+        row_lower.append(program.b_eq)
+        row_upper.append(program.b_eq)
+    bounded = np.flatnonzero(np.isfinite(lower) | np.isfinite(upper))
+    rows.append(sparse.identity(program.size, format="csr")[bounded])
+    row_lower.append(lower[bounded])
+    row_upper.append(upper[bounded])
+
+    x, iterations, status = _admm_qp(program.Q, program.c, sparse.vstack(rows, format="csc"),
+                                     np.concatenate(row_lower), np.concatenate(row_upper))
+    if status in ("primal_infeasible", "dual_infeasible"):
+        message = "The problem is infeasible." if status == "primal_infeasible" else "The problem is unbounded."
+        logger.error("Quadratic program failed after %d ADMM iterations: %s", iterations, message)
+        return {"error": message, "status": "failed", "solver": "admm", "iterations": iterations}
+    if status == "solved":
+        return {
+            "optimized_resources": x,
+            "objective": program(x),
+            "status": "success",
+            "message": "Converged.",
+            "solver": "admm",
+            "iterations": iterations,
+        }
+    logger.warning("ADMM did not converge; falling back to trust-constr.")
+
+    x0 = np.zeros(program.size) if initial_resources is None else np.asarray(initial_resources, dtype=float)
+    x0 = np.clip(x0, lower, upper)
+    constraints = []
+    if program.A_ub is not None:
+        constraints.append(LinearConstraint(program.A_ub, -np.inf, program.b_ub))
+    if program.A_eq is not None:
+        constraints.append(LinearConstraint(program.A_eq, program.b_eq, program.b_eq))
+    result = minimize(program, x0, jac=program.gradient, hess=program.hessian, method="trust-constr",
+                      constraints=constraints, bounds=Bounds(lower, upper))
+    if not result.success:
+        logger.error("Quadratic program failed: %s", result.message)
+        return {"error": result.message, "status": "failed", "solver": "trust-constr"}
+    return {
+        "optimized_resources": result.x,
+        "objective": float(result.fun),
+        "status": "success",
+        "message": result.message,
+        "solver": "trust-constr",
+        "iterations": int(result.nit),
+    }
@@ -0,0 +1,146 @@
+# src/modules/resource_optimization/memoization.py
+
+import logging
+import time
+from collections import OrderedDict
+import numpy as np
+
+# Configure logging for the memoization module
+logger = logging.getLogger(__name__)
+
+def _copy_value(value):
+    """Copy arrays (also inside a ``(value, gradient)`` tuple) so callers cannot mutate cached values."""
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_value(item) for item in value)
+    return value
+
+class _EvaluationCache:
+    """Bounded LRU cache of one function's values, with call statistics."""
+
+    def __init__(self, function, decimals, max_entries):
+        self.function = function
+        self.decimals = decimals
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.evaluations = 0
+        self.hits = 0
+        self.evaluation_time = 0.0
+
+    def key(self, x, args):
+        rounded = np.round(np.asarray(x, dtype=float), self.decimals) + 0.0  # + 0.0 folds -0.0 into 0.0
+        return rounded.shape, rounded.tobytes(), args
+
+    def __call__(self, x, *args):
+        if np.ndim(x) > 1:
+            # A vectorized population is evaluated as one batch and not cached.
+            return self.evaluate(x, *args)
+        try:
+            key = self.key(x, args)
+            hash(key)
+        except TypeError:
+            # Unhashable extra arguments: evaluate without caching.
+            return self.evaluate(x, *args)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return _copy_value(self.entries[key])
+        value = self.evaluate(x, *args)
+        self.entries[key] = _copy_value(value)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def evaluate(self, x, *args):
+        start = time.perf_counter()
+        value = self.function(x, *args)
+        self.evaluation_time += time.perf_counter() - start
+        self.evaluations += 1
+        return value
+
+    def stats(self, since=None):
+        evaluations, hits, evaluation_time = self.evaluations, self.hits, self.evaluation_time
+        if since is not None:
+            evaluations -= since["evaluations"]
+            hits -= since["cache_hits"]
+            evaluation_time -= since["evaluation_time"]
+        calls = evaluations + hits
+        return {
+            "calls": calls,
+            "evaluations": evaluations,
+            "cache_hits": hits,
+            "hit_rate": hits / calls if calls else 0.0,
+            "evaluation_time": evaluation_time,
+            "time_per_evaluation": evaluation_time / evaluations if evaluations else 0.0,
+        }
+
+class MemoizedObjective:
+    """
+    Memoizing, instrumented wrapper around an objective function and its gradient.
+
+    Values are cached in a bounded LRU cache keyed by the parameter vector
+    rounded to ``decimals`` places (and any extra hashable ``args``), so repeated evaluations at the same point
+    (line searches revisiting a step, the solver asking for the value and
+    gradient separately, restarts) are served from the cache. Keep
+    ``decimals`` fine enough to separate finite-difference steps (about
+    ``1.5e-8 * max(1, |x|)``); the default of 12 does for ``|x|`` up to 1e3.
+
+    SciPy already reuses the value at the current point within one solve, so
+    most hits come from reusing the same wrapper across solves: restarts,
+    re-solves after a constraint change, or multi-start runs that converge to
+    the same optimum.
+
+    Populations passed to a ``vectorized_objective`` are evaluated in one call
+    and bypass the cache. Evaluations made in other processes (differential
+    evolution with ``workers``) are not counted.
+    """
+
+    def __init__(self, function, gradient=None, decimals=12, max_entries=1024):
+        """
+        Wrap an objective and, optionally, its gradient.
+
+        Args:
+            function (callable): The objective; may also return ``(value, gradient)`` when used with ``jac=True``.
+            gradient (callable): Optional gradient function, cached separately.
+            decimals (int): Decimal places the parameter vector is rounded to for the cache key.
+            max_entries (int): Maximum number of cached points per function.
+        """
+        if max_entries < 1:
+            logger.error("max_entries must be positive, got %s.", max_entries)
+            raise ValueError("max_entries must be positive.")
+        self._objective = _EvaluationCache(function, decimals, max_entries)
+        self._gradient = _EvaluationCache(gradient, decimals, max_entries) if callable(gradient) else None
+        if getattr(function, "vectorized", False):
+            self.vectorized = True
+
+    def __call__(self, x, *args):
+        return self._objective(x, *args)
+
+    @property
+    def jac(self):
+        """The memoized gradient, to pass as ``jac`` (None if no gradient function was given)."""
+        return self._gradient
+
+    def clear(self):
+        """Drop cached values; statistics are kept."""
+        self._objective.entries.clear()
+        if self._gradient is not None:
+            self._gradient.entries.clear()
+
+    def stats(self, since=None):
+        """
+        Return call statistics.
+
+        Args:
+            since (dict): An earlier result of ``stats``; if given, only calls made since then are counted.
+
+        Returns:
+            dict: ``calls``, ``evaluations``, ``cache_hits``, ``hit_rate``, ``evaluation_time``
+            and ``time_per_evaluation`` (seconds) for the objective, plus the same under
+            ``gradient`` when a gradient function is wrapped.
+        """
+        stats = self._objective.stats(since)
+        if self._gradient is not None:
+            stats["gradient"] = self._gradient.stats(since.get("gradient") if since else None)
+        return stats
@@ -3,10 +3,24 @@
 import logging
 import numpy as np
 from scipy.optimize import minimize, differential_evolution
+from .linear import LinearProgram, QuadraticProgram, solve_linear_program, solve_quadratic_program
+from .memoization import MemoizedObjective
 
 # Configure logging for the optimizer module
 logger = logging.getLogger(__name__)
 
+def vectorized_objective(function):
+    """
+    Declare that ``function`` accepts a whole population at once.
+
+    A vectorized objective is called with an array of shape ``(n, S)`` holding
+    S candidate allocations as columns and must return S objective values;
+    called with a single allocation of shape ``(n,)`` it returns a scalar.
+    ``differential_evolution`` then evaluates each generation in one call.
+    """
+    function.vectorized = True
+    return function
+
 class Optimizer:
     """Class to perform resource optimization using various algorithms."""
     
@@ -19,42 +33,157 @@ class Optimizer:
         """
         self.settings = settings or {}
         self.default_algorithm = self.settings.get("default_algorithm", "minimize")
+        self.workers = self.settings.get("workers", 1)  # Parallel population evaluation for differential evolution
+        self._rolling = None  # Warm-start state for reoptimize(), created on first use
         logger.info("Optimizer initialized with settings: %s", self.settings)
 
-    def optimize_resources(self, initial_resources, constraints, objective_function):
+    def __getstate__(self):
+        # Warm-start state stays in this process; optimizers are pickled to job workers without it.
+        state = self.__dict__.copy()
+        state["_rolling"] = None
+        return state
+
+    def optimize_resources(self, initial_resources, constraints, objective_function, jac=None):
         """
         Optimize resource allocation using the specified algorithm.
 
         Args:
             initial_resources (list): Initial resource allocation.
             constraints (dict): Constraints for the optimization.
-            objective_function (callable): The objective function to minimize.
+            objective_function (callable): The objective function to minimize. A ``LinearProgram``
+                or ``QuadraticProgram`` is dispatched to ``optimize_program`` (its constraints are
+                part of the program, so ``constraints`` must be empty).
+            jac (callable or bool): Gradient of the objective, or True if the objective
+                returns ``(value, gradient)``. Without it ``minimize`` uses finite differences.
+
+        With ``differential_evolution``, ``initial_resources`` seeds the initial
+        population when it lies within the bounds.
 
         Returns:
             dict: Optimization results including the optimized resources and status.
         """
+        if isinstance(objective_function, LinearProgram):
+            if constraints:
+                logger.error("Constraints of a declared program must be part of the program.")
+                return {"error": "Constraints of a declared program must be part of the program.",
+                        "status": "failed"}
+            return self.optimize_program(objective_function, initial_resources)
         logger.info("Starting optimization process with algorithm: %s", self.default_algorithm)
         try:
-            if self.default_algorithm == "minimize":
-                result = minimize(objective_function, initial_resources, constraints=constraints)
-            elif self.default_algorithm == "differential_evolution":
-                result = differential_evolution(objective_function, bounds=[(0, 1)] * len(initial_resources), constraints=constraints)
-            else:
-                raise ValueError(f"Unknown optimization algorithm: {self.default_algorithm}")
+            result = self._solve(objective_function, initial_resources, constraints, jac=jac)
 
             logger.info("Optimization successful: %s", result)
             return {
                 "optimized_resources": result.x,
                 "status": "success",
-                "message": result.message
+                "message": result.message,
+                "evaluations": int(getattr(result, "nfev", 0)),
             }
         except Exception as e:
             logger.error("Optimization failed: %s", e)
             return {"error": str(e), "status": "failed"}
 
+    def _solve(self, objective_function, initial_resources, constraints=(), bounds=None, callback=None, jac=None):
+        """
+        Run the configured algorithm once and return SciPy's ``OptimizeResult``.
+
+        Args:
+            objective_function (callable): The objective function to minimize.
+            initial_resources (list): Starting point (also seeds differential evolution).
+            constraints (dict or sequence): Constraints for the optimization.
+            bounds (list): Optional ``(low, high)`` pairs; differential evolution defaults to ``(0, 1)``.
+            callback (callable): Called with the intermediate result after each iteration;
+                raising ``StopIteration`` ends the run early. Some methods (SLSQP before
+                SciPy 1.16) pass the current point as an array instead.
+            jac (callable or bool): Objective gradient for ``minimize``.
+        """
+        if self.default_algorithm == "minimize":
+            return minimize(objective_function, initial_resources, jac=jac, constraints=constraints, bounds=bounds,
+                            callback=callback)
+        if self.default_algorithm == "differential_evolution":
+            bounds = bounds or [(0, 1)] * len(initial_resources)
+            low, high = np.asarray(bounds, dtype=float).T
+            x0 = np.asarray(initial_resources, dtype=float)
+            # Seed the population with the starting point only when it is feasible for the bounds.
+            x0 = x0 if np.all((x0 >= low) & (x0 <= high)) else None
+            if getattr(objective_function, "vectorized", False):
+                # One objective call per generation instead of one per population member.
+                parallel = {"vectorized": True, "updating": "deferred"}
+            elif self.workers != 1:
+                parallel = {"workers": self.workers, "updating": "deferred"}
+            else:
+                parallel = {}
+            return differential_evolution(objective_function, bounds=bounds, constraints=constraints, x0=x0,
+                                          callback=callback, **parallel)
+        raise ValueError(f"Unknown optimization algorithm: {self.default_algorithm}")
+
+    def optimize_program(self, program, initial_resources=None):
+        """
+        Solve a declared linear or quadratic program with a specialized solver.
+
+        Linear programs go to ``linprog`` (HiGHS). Quadratic programs go to a
+        sparse ADMM solver first and fall back to ``trust-constr`` with the exact
+        gradient and sparse Hessian if it does not converge. The configured
+        algorithm is not used.
+
+        Args:
+            program (LinearProgram): The problem, possibly a ``QuadraticProgram``.
+            initial_resources (list): Optional starting point (used by the quadratic solver only).
+
+        Returns:
+            dict: Optimization results including the optimized resources, objective, status and solver.
+        """
+        logger.info("Solving a declared %s program with %d resources.",
+                    "quadratic" if isinstance(program, QuadraticProgram) else "linear", program.size)
+        try:
+            if isinstance(program, QuadraticProgram):
+                return solve_quadratic_program(program, initial_resources)
+            return solve_linear_program(program)
+        except Exception as e:
+            logger.error("Optimization failed: %s", e)
+            return {"error": str(e), "status": "failed"}
+
+    def optimize_many(self, problems, n_starts=1, target_objective=None, max_workers=None, seed=None):
+        """
+        Solve many independent problems, each from several starting points, in a process pool.
+
+        See ``jobs.run_optimization_jobs`` for the problem format.
+
+        Returns:
+            dict: Mapping of problem ID to the best result found for that problem.
+        """
+        from .jobs import run_optimization_jobs
+
+        return run_optimization_jobs(self, problems, n_starts=n_starts, target_objective=target_objective,
+                                     max_workers=max_workers, seed=seed)
+
+    def reoptimize(self, problem_id, initial_resources, constraints, objective_function, jac=None, bounds=None,
+                   compare_cold=False):
+        """
+        Re-solve a recurring problem, warm-starting from its previous solution.
+
+        The previous solution, BFGS inverse Hessian and active constraint set are
+        kept per ``problem_id``; see ``rolling.RollingOptimizer``.
+
+        Returns:
+            dict: Optimization results, including ``warm_started``, ``iterations``,
+            ``evaluations`` and the ``savings`` versus a cold start.
+        """
+        if self._rolling is None:
+            from .rolling import RollingOptimizer
+
+            self._rolling = RollingOptimizer(self.settings.get("active_tolerance", 1e-6))
+        return self._rolling.reoptimize(problem_id, objective_function, initial_resources, constraints, jac=jac,
+                                        bounds=bounds, compare_cold=compare_cold)
+
+    @vectorized_objective
     def example_objective_function(self, resources):
         """Example objective function to minimize."""
-        return np.sum(np.square(resources))  # Minimize the sum of squares of resources
+        return np.sum(np.square(resources), axis=0)  # Minimize the sum of squares of resources
+
+    def example_objective_gradient(self, resources):
+        """Analytic gradient of ``example_objective_function``."""
+        return 2.0 * np.asarray(resources, dtype=float)
 
     def set_algorithm(self, algorithm_name):
         """
@@ -70,17 +199,43 @@ class Optimizer:
         """Get the currently set optimization algorithm."""
         return self.default_algorithm
 
-    def optimize_with_custom_function(self, initial_resources, constraints, custom_function):
+    def optimize_with_custom_function(self, initial_resources, constraints, custom_function, jac=None, memoize=True):
         """
         Optimize resources using a custom objective function.
 
         Args:
             initial_resources (list): Initial resource allocation.
             constraints (dict): Constraints for the optimization.
-            custom_function (callable): Custom objective function to minimize.
+            custom_function (callable): Custom objective function to minimize. Decorate it with
+                ``vectorized_objective`` if it can evaluate a whole population at once.
+            jac (callable or bool): Optional gradient, see ``optimize_resources``.
+            memoize (bool): Cache and time objective and gradient evaluations (see
+                ``memoization.MemoizedObjective``); the cache is sized by the
+                ``objective_cache_size`` and ``objective_cache_decimals`` settings. Pass a
+                ``MemoizedObjective`` as ``custom_function`` to share its cache across calls.
 
         Returns:
-            dict: Optimization results including the optimized resources and status.
+            dict: Optimization results including the optimized resources and status, and with
+            ``memoize`` the ``evaluation_stats`` (evaluations, time per evaluation, cache hit rate).
+            Declared ``LinearProgram``/``QuadraticProgram`` objectives are never wrapped, so they
+            keep the fast path of ``optimize_program``.
         """
         logger.info("Starting optimization with custom function.")
-        return self.optimize_resources(initial_resources, constraints, custom_function)
+        if not memoize or isinstance(custom_function, LinearProgram):
+            return self.optimize_resources(initial_resources, constraints, custom_function, jac=jac)
+
+        if isinstance(custom_function, MemoizedObjective):
+            objective = custom_function
+            jac = objective.jac if jac is None else jac
+        else:
+            objective = MemoizedObjective(custom_function, gradient=jac,
+                                          decimals=self.settings.get("objective_cache_decimals", 12),
+                                          max_entries=self.settings.get("objective_cache_size", 1024))
+            jac = objective.jac if callable(jac) else jac
+        before = objective.stats()
+        result = self.optimize_resources(initial_resources, constraints, objective, jac=jac)
+        result["evaluation_stats"] = objective.stats(since=before)
+        logger.info("Objective evaluations: %d (%.1f%% cache hits, %.3g s each).",
+                    result["evaluation_stats"]["evaluations"], 100 * result["evaluation_stats"]["hit_rate"],
+                    result["evaluation_stats"]["time_per_evaluation"])
+        return result
@@ -0,0 +1,207 @@
+# src/modules/resource_optimization/rolling.py
+
+import logging
+import threading
+import numpy as np
+from scipy.optimize import minimize
+
+# Configure logging for the rolling re-optimization module
+logger = logging.getLogger(__name__)
+
+def _as_constraint_list(constraints):
+    if not constraints:
+        return []
+    if isinstance(constraints, dict):
+        return [constraints]
+    return list(constraints)
+
+class _ProblemState:
+    """What is carried from one solve of a problem to the next."""
+
+    __slots__ = ("x", "hess_inv", "active", "constraint_count", "baseline", "solves")
+
+    def __init__(self):
+        self.x = None
+        self.hess_inv = None
+        self.active = ()
+        self.constraint_count = 0
+        self.baseline = None  # (iterations, evaluations) of the first, cold solve
+        self.solves = 0
+
+class RollingOptimizer:
+    """Warm-started re-optimization of recurring problems keyed by problem ID.
+
+    Each solve of a problem starts from the previous solution. Unconstrained
+    problems also reuse BFGS's inverse Hessian approximation. Constrained
+    problems remember which inequality constraints were active and the next
+    solve only carries those (plus equalities) as a working set, adding any
+    constraint the relaxed solution violates and re-solving until it is
+    feasible. With many mostly slack constraints this avoids evaluating and
+    linearizing them on every SLSQP iteration. Problems whose dimension or
+    constraint count changes restart cold. Only successful solves update the
+    carried state.
+    """
+
+    def __init__(self, active_tolerance=1e-6):
+        """
+        Initialize the rolling optimizer.
+
+        Args:
+            active_tolerance (float): Slack below which an inequality constraint counts as active.
+        """
+        self.active_tolerance = active_tolerance
+        self._states = {}
+        self._lock = threading.Lock()
+        self.totals = {"solves": 0, "warm_solves": 0, "evaluations": 0, "evaluations_saved": 0,
+                       "iterations_saved": 0}
+        logger.info("RollingOptimizer initialized.")
+
+    def reset(self, problem_id=None):
+        """Forget the warm-start state of one problem, or of all problems."""
+        with self._lock:
+            if problem_id is None:
+                self._states.clear()
+            else:
+                self._states.pop(problem_id, None)
+
+    def reoptimize(self, problem_id, objective_function, initial_resources, constraints=(), jac=None, bounds=None,
+                   compare_cold=False):
+        """
+        Solve the current version of a recurring problem, warm-starting from its last solution.
+
+        Args:
+            problem_id (hashable): Identifies the problem across solves.
+            objective_function (callable): The objective function for the current data.
+            initial_resources (list): Cold-start point, used for the first solve and for ``compare_cold``.
+            constraints (dict or list): ``minimize``-style constraint dicts for the current data.
+            jac (callable or bool): Optional objective gradient.
+            bounds (list): Optional ``(low, high)`` pairs.
+            compare_cold (bool): Also solve from ``initial_resources`` to measure the exact savings.
+
+        Returns:
+            dict: ``optimized_resources``, ``objective``, ``status``, ``message``, ``warm_started``,
+            ``iterations``, ``evaluations``, ``active_constraints`` and ``savings`` (iterations and
+            evaluations saved versus the cold baseline, or versus the cold solve when ``compare_cold``).
+        """
+        constraints = _as_constraint_list(constraints)
+        x0 = np.asarray(initial_resources, dtype=float)
+        with self._lock:
+            state = self._states.setdefault(problem_id, _ProblemState())
+        if state.x is not None and (state.x.shape != x0.shape or state.constraint_count != len(constraints)):
+            logger.info("Problem %r changed shape; restarting cold.", problem_id)
+            state.__init__()
+        warm = state.x is not None
+
+        try:
+            result, iterations, evaluations = self._solve(state, objective_function, x0, constraints, jac, bounds)
+        except Exception as e:
+            logger.error("Re-optimization of problem %r failed: %s", problem_id, e)
+            return {"error": str(e), "status": "failed"}
+
+        x = np.asarray(result.x, dtype=float)
+        active = self._active_constraints(constraints, x)
+        if result.success:
+            state.x = x
+            state.hess_inv = self._positive_definite(getattr(result, "hess_inv", None))
+            state.active = active
+            state.constraint_count = len(constraints)
+            state.solves += 1
+            if state.baseline is None:
+                state.baseline = (iterations, evaluations)
+        else:
+            logger.warning("Re-optimization of problem %r did not converge; keeping the previous state.", problem_id)
+
+        baseline = state.baseline or (iterations, evaluations)
+        if compare_cold and warm:
+            cold = _ProblemState()
+            _, cold_iterations, cold_evaluations = self._solve(cold, objective_function, x0, constraints, jac, bounds)
+            baseline = (cold_iterations, cold_evaluations)
+        savings = {"iterations": baseline[0] - iterations, "evaluations": baseline[1] - evaluations} if warm else \
+            {"iterations": 0, "evaluations": 0}
+
+        with self._lock:
+            self.totals["solves"] += 1
+            self.totals["warm_solves"] += int(warm)
+            self.totals["evaluations"] += evaluations
+            self.totals["evaluations_saved"] += savings["evaluations"]
+            self.totals["iterations_saved"] += savings["iterations"]
+        logger.info("Problem %r solved (%s start) in %d iterations, %d evaluations.",
+                    problem_id, "warm" if warm else "cold", iterations, evaluations)
+        return {
+            "optimized_resources": x,
+            "objective": float(result.fun),
+            "status": "success" if result.success else "failed",
+            "message": str(result.message),
+            "warm_started": warm,
+            "iterations": iterations,
+            "evaluations": evaluations,
+            "active_constraints": list(active),
+            "savings": savings,
+        }
+
+    def _solve(self, state, objective_function, x0, constraints, jac, bounds):
+        """Run the warm (or cold) solve and return ``(result, iterations, evaluations)``."""
+        start = state.x if state.x is not None else x0
+        if not constraints:
+            if bounds is None:
+                options = {"hess_inv0": state.hess_inv} if state.hess_inv is not None else {}
+                result = minimize(objective_function, start, jac=jac, method="BFGS", options=options)
+            else:
+                result = minimize(objective_function, start, jac=jac, method="L-BFGS-B", bounds=bounds)
+            return result, int(result.nit), int(result.nfev)
+
+        if state.x is None:
+            result = minimize(objective_function, start, jac=jac, method="SLSQP", constraints=constraints,
+                              bounds=bounds)
+            return result, int(result.nit), int(result.nfev)
+
+        # Working-set solve: equality constraints plus the previously active inequalities. If the
+        # relaxed solution satisfies every other constraint it also solves the full problem;
+        # otherwise the violated constraints join the working set and the solve is repeated.
+        working = {position for position, constraint in enumerate(constraints)
+                   if constraint["type"] == "eq" or position in state.active}
+        iterations = evaluations = 0
+        while True:
+            subset = [constraint for position, constraint in enumerate(constraints) if position in working]
+            result = minimize(objective_function, start, jac=jac, method="SLSQP", constraints=subset,
+                              bounds=bounds)
+            iterations += int(result.nit)
+            evaluations += int(result.nfev)
+            violated = self._violated_constraints(constraints, result.x) - working
+            if not violated:
+                return result, iterations, evaluations
+            logger.debug("Adding %d violated constraints to the working set.", len(violated))
+            working |= violated
+            start = result.x
+
+    @staticmethod
+    def _positive_definite(matrix):
+        """Return ``matrix`` symmetrized if it is a usable BFGS inverse Hessian, else None."""
+        if not isinstance(matrix, np.ndarray) or matrix.ndim != 2:
+            return None
+        matrix = (matrix + matrix.T) / 2.0
+        try:
+            np.linalg.cholesky(matrix)
+        except np.linalg.LinAlgError:
+            return None
+        return matrix
+
+    def _constraint_values(self, constraint, x):
+        return np.atleast_1d(np.asarray(constraint["fun"](x, *constraint.get("args", ())), dtype=float))
+
+    def _violated_constraints(self, constraints, x):
+        violated = set()
+        for position, constraint in enumerate(constraints):
+            values = self._constraint_values(constraint, x)
+            if constraint["type"] == "ineq" and np.any(values < -self.active_tolerance):
+                violated.add(position)
+            elif constraint["type"] == "eq" and np.any(np.abs(values) > self.active_tolerance):
+                violated.add(position)
+        return violated
+
+    def _active_constraints(self, constraints, x):
+        active = []
+        for position, constraint in enumerate(constraints):
+            if constraint["type"] == "ineq" and np.all(self._constraint_values(constraint, x) <= self.active_tolerance):
+                active.append(position)
+        return tuple(active)
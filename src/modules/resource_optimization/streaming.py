@@ -0,0 +1,281 @@
+# src/modules/resource_optimization/streaming.py
+
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Configure logging for the streaming consumption analysis module
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.99)
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantiles with a relative-error guarantee (DDSketch).
+
+    Values are counted in logarithmic buckets ``(gamma^(i-1), gamma^i]`` with
+    ``gamma = (1 + a) / (1 - a)``, so any reported quantile is within a
+    relative error ``a`` of an actual value at that rank. Negative values use
+    a mirrored set of buckets. Memory depends only on the range of magnitudes;
+    past ``max_buckets`` each store collapses the buckets holding its lowest
+    values (the smallest positive values, the most negative values), which
+    only affects the accuracy of quantiles at the low end of that store's
+    range. Two sketches with the same accuracy merge by adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        if not 0 < relative_accuracy < 1:
+            logger.error("relative_accuracy must be in (0, 1), got %s.", relative_accuracy)
+            raise ValueError("relative_accuracy must be in (0, 1).")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zeros = 0
+        self.count = 0
+
+    def _add_buckets(self, store, magnitudes):
+        indices, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64),
+                                    return_counts=True)
+        for index, count in zip(indices.tolist(), counts.tolist()):
+            store[index] = store.get(index, 0) + count
+
+    def update(self, values):
+        """Add an array of values (NaNs must already be removed)."""
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return
+        self.count += values.size
+        tiny = np.abs(values) < 1e-12
+        self.zeros += int(np.count_nonzero(tiny))
+        if np.any(values > 0):
+            self._add_buckets(self.positive, values[(values > 0) & ~tiny])
+        if np.any(values < 0):
+            self._add_buckets(self.negative, -values[(values < 0) & ~tiny])
+        self._collapse()
+
+    def merge(self, other):
+        """Add the counts of another sketch with the same accuracy."""
+        if other.gamma != self.gamma:
+            logger.error("Cannot merge sketches with different accuracies.")
+            raise ValueError("Cannot merge sketches with different accuracies.")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for index, count in other_store.items():
+                store[index] = store.get(index, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self._collapse()
+        return self
+
+    def _collapse(self):
+        # Fold the lowest values into the lowest kept bucket: the smallest indices of the positive
+        # store, but the largest (highest-magnitude) indices of the mirrored negative store.
+        for store, descending in ((self.positive, False), (self.negative, True)):
+            if len(store) > self.max_buckets:
+                indices = sorted(store, reverse=descending)
+                excess = indices[:len(indices) - self.max_buckets + 1]
+                store[excess[-1]] = sum(store.pop(index) for index in excess[:-1]) + store[excess[-1]]
+
+    def _value(self, index):
+        return 2.0 * self.gamma ** index / (self.gamma + 1.0)
+
+    def quantile(self, q):
+        """Return the approximate ``q``-quantile (0 <= q <= 1), or NaN if the sketch is empty."""
+        if self.count == 0:
+            return float("nan")
+        # Bucket values in ascending order: most negative first, then zeros, then positives.
+        ordered = [(-self._value(index), self.negative[index]) for index in sorted(self.negative, reverse=True)]
+        ordered.append((0.0, self.zeros))
+        ordered += [(self._value(index), self.positive[index]) for index in sorted(self.positive)]
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, count in ordered:
+            seen += count
+            if seen > rank:
+                return value
+        return ordered[-1][0]
+
+class _ColumnStats:
+    """Running aggregates of one column."""
+
+    __slots__ = ("count", "total", "mean", "m2", "minimum", "maximum", "sketch")
+
+    def __init__(self, relative_accuracy):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def combine(self, count, total, mean, m2, minimum, maximum):
+        """Fold in the aggregates of another batch (Chan et al.'s parallel form of Welford's update)."""
+        if count == 0:
+            return
+        combined = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / combined
+        self.m2 += m2 + delta * delta * self.count * count / combined
+        self.count = combined
+        self.total += total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+class ConsumptionStats:
+    """
+    Mergeable running aggregates of every numeric column of a consumption stream.
+
+    Each chunk is reduced to per-column count, sum, mean, sum of squared
+    deviations, min, max and a ``QuantileSketch``, and folded into the
+    running totals, so memory does not grow with the number of rows. Stats
+    built from different chunks or files combine exactly with ``merge``
+    (apart from the approximate quantiles).
+    """
+
+    def __init__(self, quantiles=DEFAULT_QUANTILES, relative_accuracy=0.01):
+        """
+        Initialize empty aggregates.
+
+        Args:
+            quantiles (tuple): Quantiles reported by ``summary``.
+            relative_accuracy (float): Relative accuracy of the quantile sketches.
+        """
+        self.quantiles = tuple(quantiles)
+        self.relative_accuracy = relative_accuracy
+        self.columns = {}
+        self.rows = 0
+
+    def _column(self, name):
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = _ColumnStats(self.relative_accuracy)
+        return column
+
+    def update(self, chunk):
+        """
+        Fold in a chunk of rows.
+
+        Args:
+            chunk (pd.DataFrame): Rows to add; non-numeric columns are ignored and NaNs skipped.
+
+        Returns:
+            ConsumptionStats: ``self``.
+        """
+        numeric = chunk.select_dtypes(include="number")
+        self.rows += len(chunk)
+        if numeric.empty:
+            return self
+        counts = numeric.count()
+        means = numeric.mean()
+        m2 = numeric.var(ddof=0) * counts
+        totals, minima, maxima = numeric.sum(), numeric.min(), numeric.max()
+        for name in numeric.columns:
+            if not counts[name]:
+                self._column(name)
+                continue
+            column = self._column(name)
+            column.combine(int(counts[name]), float(totals[name]), float(means[name]), float(m2[name]),
+                           float(minima[name]), float(maxima[name]))
+            values = numeric[name].to_numpy(dtype=float)
+            column.sketch.update(values[~np.isnan(values)])
+        return self
+
+    def merge(self, other):
+        """
+        Combine with aggregates computed over other rows (another chunk, file or process).
+
+        Returns:
+            ConsumptionStats: ``self``.
+        """
+        self.rows += other.rows
+        for name, theirs in other.columns.items():
+            column = self._column(name)
+            column.combine(theirs.count, theirs.total, theirs.mean, theirs.m2, theirs.minimum, theirs.maximum)
+            column.sketch.merge(theirs.sketch)
+        return self
+
+    def summary(self):
+        """
+        Return the aggregates in the format of ``ConsumptionAnalyzer.analyze_consumption``, extended.
+
+        Returns:
+            dict: ``total_consumption``, ``average_consumption``, ``count``, ``variance`` and
+            ``std`` (population), ``min``, ``max`` and ``quantiles`` (approximate), each keyed by
+            column, plus ``rows`` and ``status``.
+        """
+        nan = float("nan")
+        columns = self.columns.items()
+        variance = {name: column.m2 / column.count if column.count else nan for name, column in columns}
+        return {
+            "total_consumption": {name: column.total for name, column in columns},
+            "average_consumption": {name: column.mean if column.count else nan for name, column in columns},
+            "count": {name: column.count for name, column in columns},
+            "variance": variance,
+            "std": {name: math.sqrt(value) for name, value in variance.items()},
+            "min": {name: column.minimum if column.count else nan for name, column in columns},
+            "max": {name: column.maximum if column.count else nan for name, column in columns},
+            "quantiles": {name: {q: column.sketch.quantile(q) for q in self.quantiles} for name, column in columns},
+            "rows": self.rows,
+            "status": "success",
+        }
+
+def analyze_chunks(chunks, quantiles=DEFAULT_QUANTILES, relative_accuracy=0.01):
+    """
+    Aggregate an iterable of DataFrame chunks.
+
+    Returns:
+        ConsumptionStats: The aggregates of all chunks.
+    """
+    stats = ConsumptionStats(quantiles, relative_accuracy)
+    for chunk in chunks:
+        stats.update(chunk)
+    return stats
+
+def analyze_file(file_path, chunksize=100000, quantiles=DEFAULT_QUANTILES, relative_accuracy=0.01):
+    """
+    Aggregate one CSV or Parquet file, streamed in chunks with ``DataLoader.iter_chunks``.
+
+    Returns:
+        ConsumptionStats: The aggregates of the file.
+    """
+    from ...utils.data_loader import DataLoader
+
+    stats = analyze_chunks(DataLoader.iter_chunks(file_path, chunksize=chunksize), quantiles, relative_accuracy)
+    logger.info("Aggregated %d rows from %s.", stats.rows, file_path)
+    return stats
+
+def analyze_files(file_paths, chunksize=100000, quantiles=DEFAULT_QUANTILES, relative_accuracy=0.01,
+                  max_workers=None):
+    """
+    Aggregate several files, one per worker process, and merge the partial results.
+
+    Args:
+        file_paths (list): CSV or Parquet files.
+        chunksize (int): Rows per chunk read.
+        quantiles (tuple): Quantiles reported by ``summary``.
+        relative_accuracy (float): Relative accuracy of the quantile sketches.
+        max_workers (int): Number of worker processes (defaults to the CPU count, at most one per
+            file); 1 aggregates the files in-process.
+
+    Returns:
+        ConsumptionStats: The merged aggregates.
+    """
+    file_paths = list(file_paths)
+    max_workers = min(max_workers or os.cpu_count() or 1, max(len(file_paths), 1))
+    merged = ConsumptionStats(quantiles, relative_accuracy)
+    if max_workers == 1:
+        for file_path in file_paths:
+            merged.merge(analyze_file(file_path, chunksize, quantiles, relative_accuracy))
+        return merged
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context()) as pool:
+        futures = [pool.submit(analyze_file, file_path, chunksize, quantiles, relative_accuracy)
+                   for file_path in file_paths]
+        for future in futures:
+            merged.merge(future.result())
+    return merged
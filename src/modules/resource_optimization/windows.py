@@ -0,0 +1,236 @@
+# src/modules/resource_optimization/windows.py
+
+import logging
+import threading
+import numpy as np
+
+# Configure logging for the windowed aggregation module
+logger = logging.getLogger(__name__)
+
+def _as_seconds(timestamps):
+    """Convert timestamps (epoch seconds or datetime64) to float epoch seconds."""
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype == object:
+        # e.g. pandas Timestamps or datetime objects
+        try:
+            timestamps = timestamps.astype("datetime64[ns]")
+        except (TypeError, ValueError):
+            timestamps = timestamps.astype(float)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        return timestamps.astype("datetime64[ns]").astype(np.int64) / 1e9, True
+    return timestamps.astype(float), False
+
+class WindowedAggregator:
+    """
+    Incremental tumbling and sliding window aggregates of consumption, per resource.
+
+    Time is cut into tumbling windows of ``window_seconds``; the last
+    ``history`` windows are kept in ring-buffer arrays of shape
+    ``(resources, history)`` holding count, sum, min and max. Ingesting a row
+    updates one cell. When time moves into a new window, the slots of the
+    windows falling out of retention are cleared, at most ``history`` slots
+    per advance. Updates are therefore O(1) amortized and memory does not grow
+    with the stream.
+
+    Queries read only the ring: ``tumbling`` returns the retained windows and
+    ``sliding`` aggregates the most recent ``span`` windows. Rows older than
+    the retained history are dropped and counted in ``late_rows``. Ingestion
+    and queries may run in different threads.
+    """
+
+    def __init__(self, window_seconds=60.0, history=60):
+        """
+        Initialize the aggregator.
+
+        Args:
+            window_seconds (float): Width of one tumbling window in seconds.
+            history (int): Number of windows retained (the longest sliding span).
+
+        Raises:
+            ValueError: If the window width or history is not positive.
+        """
+        if window_seconds <= 0 or history < 1:
+            logger.error("window_seconds and history must be positive.")
+            raise ValueError("window_seconds and history must be positive.")
+        self.window_seconds = float(window_seconds)
+        self.history = int(history)
+        self.resources = {}
+        self.late_rows = 0
+        self._latest = None  # Index of the most recent window
+        self._datetime = False
+        self._count = np.zeros((0, self.history), dtype=np.int64)
+        self._sum = np.zeros((0, self.history))
+        self._min = np.full((0, self.history), np.inf)
+        self._max = np.full((0, self.history), -np.inf)
+        self._lock = threading.Lock()
+        logger.info("WindowedAggregator initialized with %d windows of %ss.", self.history, self.window_seconds)
+
+    def _rows_for(self, names):
+        """Map resource names to ring rows, growing the arrays (by doubling) for new resources."""
+        unique, inverse = np.unique(np.asarray(names, dtype=object).astype(str), return_inverse=True)
+        rows = np.empty(len(unique), dtype=np.int64)
+        for position, name in enumerate(unique.tolist()):
+            row = self.resources.get(name)
+            if row is None:
+                row = self.resources[name] = len(self.resources)
+            rows[position] = row
+        if len(self.resources) > self._count.shape[0]:
+            extra = max(len(self.resources), 2 * self._count.shape[0]) - self._count.shape[0]
+            self._count = np.vstack([self._count, np.zeros((extra, self.history), dtype=np.int64)])
+            self._sum = np.vstack([self._sum, np.zeros((extra, self.history))])
+            self._min = np.vstack([self._min, np.full((extra, self.history), np.inf)])
+            self._max = np.vstack([self._max, np.full((extra, self.history), -np.inf)])
+        return rows[inverse]
+
+    def _advance(self, window):
+        """Make ``window`` the most recent window, clearing the slots it and its predecessors reuse."""
+        if self._latest is None:
+            self._latest = window - self.history
+        if window <= self._latest:
+            return
+        # Window w lives in slot w % history; reset the slots of the newly opened windows.
+        slots = np.arange(max(self._latest + 1, window - self.history + 1), window + 1) % self.history
+        self._count[:, slots] = 0
+        self._sum[:, slots] = 0.0
+        self._min[:, slots] = np.inf
+        self._max[:, slots] = -np.inf
+        self._latest = window
+
+    def ingest(self, timestamps, resources, values):
+        """
+        Add consumption rows in long format.
+
+        Args:
+            timestamps (array-like): Epoch seconds or datetime64 values, one per row.
+            resources (array-like or str): Resource name per row, or one name for all rows.
+            values (array-like): Consumption per row; NaNs are skipped.
+
+        Returns:
+            int: Number of rows added (excluding NaNs and rows older than the retained history).
+        """
+        seconds, is_datetime = _as_seconds(timestamps)
+        values = np.asarray(values, dtype=float)
+        if isinstance(resources, str):
+            resources = np.full(values.shape[0], resources, dtype=object)
+        if not (seconds.shape[0] == values.shape[0] == len(resources)):
+            logger.error("timestamps, resources and values must have the same length.")
+            raise ValueError("timestamps, resources and values must have the same length.")
+        keep = ~np.isnan(values)
+        if not np.any(keep):
+            return 0
+        windows = np.floor(seconds[keep] / self.window_seconds).astype(np.int64)
+        values = values[keep]
+        with self._lock:
+            self._datetime = self._datetime or is_datetime
+            rows = self._rows_for(np.asarray(resources, dtype=object)[keep])
+            self._advance(int(windows.max()))
+            current = windows > self._latest - self.history
+            self.late_rows += int(np.count_nonzero(~current))
+            rows, slots, values = rows[current], windows[current] % self.history, values[current]
+            np.add.at(self._count, (rows, slots), 1)
+            np.add.at(self._sum, (rows, slots), values)
+            np.minimum.at(self._min, (rows, slots), values)
+            np.maximum.at(self._max, (rows, slots), values)
+        return int(values.shape[0])
+
+    def add(self, timestamp, values):
+        """
+        Add one reading per resource at one time.
+
+        Args:
+            timestamp (float or datetime64): Time of the readings.
+            values (dict): Mapping of resource name to consumption.
+        """
+        return self.ingest(np.full(len(values), np.asarray(timestamp)), list(values), list(values.values()))
+
+    def add_frame(self, frame, time_column="timestamp"):
+        """
+        Add a DataFrame in the wide layout ``ConsumptionAnalyzer`` uses: one numeric column per resource.
+
+        Args:
+            frame (pd.DataFrame): New rows.
+            time_column (str): Column holding the timestamps.
+
+        Returns:
+            int: Number of values added.
+        """
+        timestamps = frame[time_column].to_numpy()
+        columns = [name for name in frame.select_dtypes(include="number").columns if name != time_column]
+        return sum(self.ingest(timestamps, str(name), frame[name].to_numpy(dtype=float)) for name in columns)
+
+    def _window_start(self, window):
+        start = window * self.window_seconds
+        if self._datetime:
+            return np.datetime64(int(round(start * 1e9)), "ns")
+        return start
+
+    def _stats(self, count, total, minimum, maximum):
+        return {
+            "count": int(count),
+            "sum": float(total),
+            "mean": float(total / count) if count else float("nan"),
+            "min": float(minimum) if count else float("nan"),
+            "max": float(maximum) if count else float("nan"),
+        }
+
+    def tumbling(self, resource=None, last=None):
+        """
+        Return the retained tumbling windows, oldest first.
+
+        Args:
+            resource (str): Restrict to one resource (default: all).
+            last (int): Only the ``last`` most recent windows.
+
+        Returns:
+            dict: Mapping of resource to a list of dicts with ``start`` (window start, epoch
+            seconds or datetime64), ``count``, ``sum``, ``mean``, ``min`` and ``max``.
+        """
+        with self._lock:
+            if self._latest is None:
+                return {}
+            span = min(last or self.history, self.history)
+            windows = np.arange(self._latest - span + 1, self._latest + 1)
+            slots = windows % self.history
+            names = self.resources if resource is None else {resource: self.resources[resource]}
+            return {
+                name: [
+                    {"start": self._window_start(int(window)),
+                     **self._stats(self._count[row, slot], self._sum[row, slot], self._min[row, slot],
+                                   self._max[row, slot])}
+                    for window, slot in zip(windows, slots)
+                ]
+                for name, row in names.items()
+            }
+
+    def sliding(self, span=None):
+        """
+        Aggregate the ``span`` most recent windows (ending with the current one) per resource.
+
+        Args:
+            span (int): Number of windows, at most ``history`` (default: all retained windows).
+
+        Returns:
+            dict: ``start`` and ``end`` of the covered time range and ``resources``, a mapping of
+            resource to ``count``, ``sum``, ``mean``, ``min`` and ``max``.
+
+        Raises:
+            ValueError: If ``span`` exceeds the retained history.
+        """
+        span = span or self.history
+        if not 1 <= span <= self.history:
+            logger.error("Sliding span %s is outside 1..%d windows.", span, self.history)
+            raise ValueError(f"Sliding span must be between 1 and {self.history} windows.")
+        with self._lock:
+            if self._latest is None:
+                return {}
+            slots = np.arange(self._latest - span + 1, self._latest + 1) % self.history
+            count = self._count[:, slots].sum(axis=1)
+            total = self._sum[:, slots].sum(axis=1)
+            minimum = self._min[:, slots].min(axis=1)
+            maximum = self._max[:, slots].max(axis=1)
+            return {
+                "start": self._window_start(self._latest - span + 1),
+                "end": self._window_start(self._latest + 1),
+                "resources": {name: self._stats(count[row], total[row], minimum[row], maximum[row])
+                              for name, row in self.resources.items()},
+            }
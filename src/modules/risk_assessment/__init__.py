@@ -1,8 +1,9 @@
 # src/modules/risk_assessment/__init__.py
 
 import logging
+from ...utils.lazy import lazy_attributes
 from .risk_model import RiskModel, SimpleRiskModel, AdvancedRiskModel
-from .risk_evaluator import RiskEvaluator
+from .cache import RiskResultCache
 
 # Configure logging for the risk assessment module
 logger = logging.getLogger(__name__)
@@ -18,9 +19,18 @@ logger.addHandler(console_handler)
 class RiskAssessmentModule:
     """Main class for managing risk assessment models and evaluations."""
 
-    def __init__(self):
-        """Initialize the RiskAssessmentModule with default models."""
+    def __init__(self, cache_size=None, cache_ttl=None):
+        """
+        Initialize the RiskAssessmentModule with default models.
+
+        Args:
+            cache_size (int): Enable the result cache with this many entries (disabled if None).
+            cache_ttl (float): Optional time-to-live for cached results in seconds.
+        """
         self.models = {}
+        self.cache = None
+        if cache_size:
+            self.enable_cache(cache_size, cache_ttl)
         self.register_model("simple", SimpleRiskModel())
         self.register_model("advanced", AdvancedRiskModel(weights={"factor1": 0.5, "factor2": 1.5, "factor3": 2.0}))
         logger.info("RiskAssessmentModule initialized with default models.")
@@ -31,9 +41,29 @@ class RiskAssessmentModule:
             logger.error(f"Model instance must be a subclass of RiskModel.")
             raise ValueError("Model instance must be a subclass of RiskModel.")
         
+        if model_name in self.models and self.cache is not None:
+            self.cache.invalidate_model(model_name)
         self.models[model_name] = model_instance
         logger.info(f"Model '{model_name}' registered successfully.")
 
+    def enable_cache(self, maxsize=10000, ttl=None):
+        """
+        Enable memoization of risk results.
+
+        Args:
+            maxsize (int): Maximum number of cached results.
+            ttl (float): Optional time-to-live for cached results in seconds.
+
+        Returns:
+            RiskResultCache: The cache, whose ``stats()`` report hits and misses.
+        """
+        self.cache = RiskResultCache(maxsize=maxsize, ttl=ttl)
+        return self.cache
+
+    def disable_cache(self):
+        """Disable memoization of risk results and drop the cache."""
+        self.cache = None
+
     def get_model(self, model_name):
         """Retrieve a registered risk model by name."""
         model = self.models.get(model_name)
@@ -47,9 +77,22 @@ class RiskAssessmentModule:
         """Evaluate risk for a given entity using the specified model."""
         logger.info(f"Evaluating risk for entity '{entity_id}' using model '{model_name}'.")
         model = self.get_model(model_name)
-        risk = model.calculate_risk(data)
+        if self.cache is not None:
+            risk = self.cache.get_or_compute(model_name, model, data, lambda: model.calculate_risk(data))
+        else:
+            risk = model.calculate_risk(data)
         logger.info(f"Risk for entity '{entity_id}': {risk}")
         return risk
 
+# Imported on first access (PEP 562) so that scoring alone does not load the process-pool machinery
+_LAZY_IMPORTS = {
+    "RiskEvaluator": ".risk_evaluator",
+    "ShardedRiskExecutor": ".parallel",
+    "IncrementalRiskScorer": ".incremental",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
+
 # Expose the main classes for external use
-__all__ = ["RiskAssessmentModule", "RiskModel", "SimpleRiskModel", "AdvancedRiskModel", "RiskEvaluator"]
+__all__ = ["RiskAssessmentModule", "RiskModel", "SimpleRiskModel", "AdvancedRiskModel", "RiskEvaluator", "ShardedRiskExecutor", "RiskResultCache",
+           "IncrementalRiskScorer"]
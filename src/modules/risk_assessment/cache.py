@@ -0,0 +1,112 @@
+# src/modules/risk_assessment/cache.py
+
+import logging
+import threading
+from cachetools import LRUCache, TTLCache
+
+# Configure logging for the risk result cache module
+logger = logging.getLogger(__name__)
+
+class RiskResultCache:
+    """Size-bounded LRU (optionally TTL) cache of risk scores.
+
+    Entries are content-addressed by ``(model name, model fingerprint,
+    canonicalized factors)``, so a model whose weights change produces new
+    keys, and identical factor vectors submitted again are served from the
+    cache.
+    """
+
+    def __init__(self, maxsize=10000, ttl=None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of cached results; least recently used entries are evicted.
+            ttl (float): Optional time-to-live for entries in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl) if ttl else LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        logger.info("RiskResultCache initialized with maxsize=%s, ttl=%s.", maxsize, ttl)
+
+    @staticmethod
+    def make_key(model_name, model, data):
+        """
+        Build the cache key for scoring ``data`` with ``model``.
+
+        Returns:
+            tuple: The key, or None when the factors are not hashable.
+        """
+        try:
+            factors = tuple(sorted(data.items()))
+            key = (model_name, model.fingerprint(), factors)
+            hash(key)
+        except (AttributeError, TypeError):
+            return None
+        return key
+
+    def get_or_compute(self, model_name, model, data, compute):
+        """
+        Return the cached risk for ``data``, computing and storing it on a miss.
+
+        Args:
+            model_name (str): Registered name of the model.
+            model (RiskModel): The model instance.
+            data (dict): Factor data.
+            compute (callable): Zero-argument callable returning the risk.
+
+        Returns:
+            float: The risk score.
+        """
+        key = self.make_key(model_name, model, data)
+        if key is None:
+            return compute()
+
+        with self._lock:
+            try:
+                risk = self._cache[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                return risk
+
+        risk = compute()
+        with self._lock:
+            self._cache[key] = risk
+        return risk
+
+    def invalidate_model(self, model_name):
+        """Drop every cached result computed by the model registered as ``model_name``."""
+        with self._lock:
+            stale = [key for key in self._cache.keys() if key[0] == model_name]
+            for key in stale:
+                self._cache.pop(key, None)
+        logger.info("Invalidated %d cached results for model '%s'.", len(stale), model_name)
+
+    def clear(self):
+        """Drop all cached results and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Return cache statistics.
+
+        Returns:
+            dict: Hits, misses, hit rate, current size and maximum size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._cache),
+                "maxsize": self.maxsize,
+            }
@@ -0,0 +1,226 @@
+# src/modules/risk_assessment/incremental.py
+
+import logging
+import numpy as np
+from .risk_model import AdvancedRiskModel
+
+# Configure logging for the incremental risk scoring module
+logger = logging.getLogger(__name__)
+
+class IncrementalRiskScorer:
+    """Keep running weighted sums for tracked entities of an AdvancedRiskModel.
+
+    Each tracked entity owns a row of a factor matrix (in the model's
+    ``factor_order``) and a running weighted sum. A factor delta updates the
+    sum in O(1); a weight change is applied to every tracked entity as a
+    single vector operation over the changed weight columns. Non-finite
+    factor values are rejected, since one NaN would poison a running sum
+    until the next ``resync``.
+    """
+
+    def __init__(self, model, capacity=1024):
+        """
+        Initialize the scorer.
+
+        Args:
+            model (AdvancedRiskModel): The weighted model whose scores are maintained.
+            capacity (int): Initial number of entity rows to allocate.
+        """
+        if not isinstance(model, AdvancedRiskModel):
+            logger.error("Incremental scoring requires an AdvancedRiskModel.")
+            raise ValueError("Incremental scoring requires an AdvancedRiskModel.")
+        self.model = model
+        self._weight_vector = model.weight_vector.copy()
+        self._synced_vector = model.weight_vector
+        self._factor_position = {name: index for index, name in enumerate(model.factor_order)}
+        self._index = {}
+        self._entity_ids = []
+        self._factors = np.empty((max(capacity, 1), len(model.factor_order)))
+        self._sums = np.empty(max(capacity, 1))
+        logger.info("IncrementalRiskScorer initialized for %d factors.", len(model.factor_order))
+
+    def __len__(self):
+        return len(self._entity_ids)
+
+    def __contains__(self, entity_id):
+        return entity_id in self._index
+
+    def _reserve(self, count):
+        """Grow the row storage geometrically so appends are amortized O(1)."""
+        needed = len(self._entity_ids) + count
+        capacity = self._factors.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        factors = np.empty((capacity, self._factors.shape[1]))
+        sums = np.empty(capacity)
+        size = len(self._entity_ids)
+        factors[:size] = self._factors[:size]
+        sums[:size] = self._sums[:size]
+        self._factors, self._sums = factors, sums
+
+    def _row(self, entity_id):
+        try:
+            return self._index[entity_id]
+        except KeyError:
+            logger.error(f"Entity '{entity_id}' is not tracked.")
+            raise ValueError(f"Entity '{entity_id}' is not tracked.")
+
+    def _column(self, factor):
+        try:
+            return self._factor_position[factor]
+        except KeyError:
+            logger.error(f"Unknown factor '{factor}'.")
+            raise ValueError(f"Unknown factor '{factor}'.")
+
+    def _check_finite(self, values):
+        if not np.all(np.isfinite(values)):
+            logger.error("Factor values must be finite.")
+            raise ValueError("Factor values must be finite.")
+
+    def _check_weights(self):
+        """Pick up weight changes made directly on the model (it recompiles a new vector)."""
+        if self.model.weight_vector is not self._synced_vector:
+            self.sync_weights()
+
+    def track(self, entity_id, data):
+        """
+        Start tracking an entity (or reset a tracked one) from its full factor data.
+
+        Args:
+            entity_id (str): The entity ID.
+            data (dict): Factor data with exactly the model's factors.
+
+        Returns:
+            float: The entity's risk score.
+        """
+        self.model.validate_data(data)
+        self._check_weights()
+        values = np.asarray([data[name] for name in self.model.factor_order], dtype=np.float64)
+        self._check_finite(values)
+        row = self._index.get(entity_id)
+        if row is None:
+            self._reserve(1)
+            row = len(self._entity_ids)
+            self._index[entity_id] = row
+            self._entity_ids.append(entity_id)
+        self._factors[row] = values
+        self._sums[row] = self._factors[row] @ self._weight_vector
+        return self._sums[row] / self.model.normalizer
+
+    def track_many(self, entity_ids, factors):
+        """
+        Start tracking new entities from a matrix laid out in the model's ``factor_order``.
+
+        Args:
+            entity_ids (list): IDs of entities that are not tracked yet.
+            factors (np.ndarray): 2-D array with one row per entity.
+        """
+        self._check_weights()
+        factors = np.asarray(factors, dtype=np.float64)
+        if factors.ndim != 2 or factors.shape != (len(entity_ids), self._factors.shape[1]):
+            logger.error("Factors must have one row per entity and one column per factor.")
+            raise ValueError("Factors must have one row per entity and one column per factor.")
+        self._check_finite(factors)
+        if any(entity_id in self._index for entity_id in entity_ids) or len(set(entity_ids)) != len(entity_ids):
+            logger.error("Entities passed to track_many must be new and unique.")
+            raise ValueError("Entities passed to track_many must be new and unique.")
+
+        self._reserve(len(entity_ids))
+        start = len(self._entity_ids)
+        stop = start + len(entity_ids)
+        self._factors[start:stop] = factors
+        self._sums[start:stop] = factors @ self._weight_vector
+        self._index.update(zip(entity_ids, range(start, stop)))
+        self._entity_ids.extend(entity_ids)
+
+    def update_factor(self, entity_id, factor, value):
+        """
+        Apply a single factor change in O(1).
+
+        Args:
+            entity_id (str): A tracked entity ID.
+            factor (str): Name of the changed factor.
+            value (float): The factor's new value.
+
+        Returns:
+            float: The entity's updated risk score.
+        """
+        self._check_finite(value)
+        self._check_weights()
+        row = self._row(entity_id)
+        column = self._column(factor)
+        old_value = self._factors[row, column]
+        self._factors[row, column] = value
+        self._sums[row] += self._weight_vector[column] * (value - old_value)
+        return self._sums[row] / self.model.normalizer
+
+    def update_factors(self, entity_ids, factor, values):
+        """
+        Apply one factor's changes to many entities with vector operations.
+
+        Args:
+            entity_ids (list): Unique tracked entity IDs.
+            factor (str): Name of the changed factor.
+            values (np.ndarray): New factor values aligned with ``entity_ids``.
+        """
+        self._check_weights()
+        rows = np.fromiter((self._row(entity_id) for entity_id in entity_ids), dtype=np.intp, count=len(entity_ids))
+        if np.unique(rows).shape[0] != rows.shape[0]:
+            logger.error("Entity IDs passed to update_factors must be unique.")
+            raise ValueError("Entity IDs passed to update_factors must be unique.")
+        column = self._column(factor)
+        values = np.asarray(values, dtype=np.float64)
+        self._check_finite(values)
+        self._sums[rows] += self._weight_vector[column] * (values - self._factors[rows, column])
+        self._factors[rows, column] = values
+
+    def reweight(self, weights):
+        """
+        Update some model weights and re-score all tracked entities.
+
+        Args:
+            weights (dict): Mapping of existing factor names to new weights.
+        """
+        unknown = set(weights) - set(self._factor_position)
+        if unknown:
+            logger.error(f"Unknown factors in weight update: {sorted(unknown)}")
+            raise ValueError(f"Unknown factors in weight update: {sorted(unknown)}")
+        self.model.update_weights(weights)
+        self.sync_weights()
+
+    def sync_weights(self):
+        """Apply any change in the model's weight vector to all tracked running sums."""
+        if self.model.factor_order != tuple(self._factor_position):
+            logger.error("The model's factors changed; create a new scorer.")
+            raise ValueError("The model's factors changed; create a new scorer.")
+        delta = self.model.weight_vector - self._weight_vector
+        changed = np.flatnonzero(delta)
+        if changed.size:
+            size = len(self._entity_ids)
+            self._sums[:size] += self._factors[:size, changed] @ delta[changed]
+            self._weight_vector = self.model.weight_vector.copy()
+            logger.info("Re-weighted %d tracked entities across %d factors.", size, changed.size)
+        self._synced_vector = self.model.weight_vector
+
+    def resync(self):
+        """Recompute all running sums from the stored factors to shed accumulated rounding error."""
+        size = len(self._entity_ids)
+        self._sums[:size] = self._factors[:size] @ self._weight_vector
+
+    def score(self, entity_id):
+        """Return the current risk score of a tracked entity."""
+        self._check_weights()
+        return self._sums[self._row(entity_id)] / self.model.normalizer
+
+    def scores(self):
+        """
+        Return the current risk scores of all tracked entities.
+
+        Returns:
+            tuple: ``(entity_ids, risks)`` with risks aligned to the ID list.
+        """
+        self._check_weights()
+        size = len(self._entity_ids)
+        return list(self._entity_ids), self._sums[:size] / self.model.normalizer
@@ -0,0 +1,131 @@
+# src/modules/risk_assessment/parallel.py
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+# Configure logging for the parallel risk evaluation module
+logger = logging.getLogger(__name__)
+
+# Models shipped to each worker process once, by the pool initializer
+_worker_models = {}
+
+def _init_worker(models, log_level):
+    """Install the model registry in a worker process."""
+    global _worker_models
+    _worker_models = models
+    logging.getLogger(__package__).setLevel(log_level)
+
+def _evaluate_shard(model_name, items):
+    """Evaluate one shard of ``(entity_id, data)`` pairs inside a worker."""
+    model = _worker_models[model_name]
+    results = {}
+    for entity_id, data in items:
+        try:
+            results[entity_id] = model.calculate_risk(data)
+        except Exception as e:
+            logger.error(f"Error evaluating risk for entity '{entity_id}': {e}")
+            results[entity_id] = None
+    return results
+
+class ShardedRiskExecutor:
+    """Evaluate risks for very large entity sets across a pool of worker processes.
+
+    Entities are partitioned into shards of ``chunk_size`` and scored in
+    worker processes. The model registry is pickled once per worker by the
+    pool initializer rather than once per task, so models must be picklable
+    (for ``CustomRiskModel`` this means a module-level calculation function).
+    """
+
+    def __init__(self, models, max_workers=None, chunk_size=10000, log_level=logging.WARNING):
+        """
+        Initialize the executor and start its worker pool.
+
+        Args:
+            models (dict): Mapping of model name to model instance.
+            max_workers (int): Number of worker processes (defaults to the CPU count).
+            chunk_size (int): Number of entities per shard.
+            log_level (int): Logging level for the risk assessment loggers in workers.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.models = dict(models)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.models, log_level),
+        )
+        logger.info("ShardedRiskExecutor started with %d workers, chunk size %d.", self.max_workers, chunk_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        """Shut down the worker pool."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        logger.info("ShardedRiskExecutor shut down.")
+
+    def _shards(self, entities):
+        items = iter(entities.items())
+        while True:
+            shard = list(islice(items, self.chunk_size))
+            if not shard:
+                return
+            yield shard
+
+    def evaluate(self, entities, model_name, ordered=True):
+        """
+        Stream risk results shard by shard.
+
+        At most two shards per worker are in flight at any time, so results
+        can be consumed while later shards are still being partitioned.
+
+        Args:
+            entities (dict): Mapping of entity ID to factor data.
+            model_name (str): Name of the model to use.
+            ordered (bool): Yield shards in input order if True, otherwise as they complete.
+
+        Yields:
+            dict: Mapping of entity ID to risk (None where evaluation failed) for one shard.
+        """
+        if model_name not in self.models:
+            logger.error(f"Model '{model_name}' not found.")
+            raise ValueError(f"Model '{model_name}' not found.")
+
+        max_in_flight = 2 * self.max_workers
+        pending = deque() if ordered else set()
+        for shard in self._shards(entities):
+            future = self._pool.submit(_evaluate_shard, model_name, shard)
+            if ordered:
+                pending.append(future)
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            else:
+                pending.add(future)
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+        if ordered:
+            while pending:
+                yield pending.popleft().result()
+        else:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    def evaluate_all(self, entities, model_name):
+        """Evaluate all entities and return a single results dict in input order."""
+        results = {}
+        for shard_results in self.evaluate(entities, model_name):
+            results.update(shard_results)
+        return results
@@ -1,6 +1,7 @@
 # src/modules/risk_assessment/risk_evaluator.py
 
 import logging
+import numpy as np
 from .risk_model import SimpleRiskModel, AdvancedRiskModel
 
 # Configure logging for the risk evaluator module
@@ -33,9 +34,23 @@ class RiskEvaluator:
         logger.info(f"Risk for entity '{entity_id}': {risk}")
         return risk
 
-    def evaluate_risks_batch(self, entities, model_name):
-        """Evaluate risks for a batch of entities using the specified model."""
+    def evaluate_risks_batch(self, entities, model_name, executor=None):
+        """
+        Evaluate risks for a batch of entities using the specified model.
+
+        Args:
+            entities (dict): Mapping of entity ID to factor data.
+            model_name (str): Name of the registered model to use.
+            executor (ShardedRiskExecutor): Optional executor that shards the batch
+                across worker processes.
+
+        Returns:
+            dict: Mapping of entity ID to risk (None where evaluation failed).
+        """
         logger.info(f"Evaluating risks for batch of entities using model '{model_name}'.")
+        if executor is not None:
+            return executor.evaluate_all(entities, model_name)
+
         results = {}
         for entity_id, data in entities.items():
             try:
@@ -46,6 +61,102 @@ class RiskEvaluator:
                 results[entity_id] = None  # Store None or some error indicator
         return results
 
+    def create_sharded_executor(self, max_workers=None, chunk_size=10000):
+        """
+        Create a process-pool executor preloaded with the registered models.
+
+        Models registered after the executor is created are not visible to it.
+
+        Args:
+            max_workers (int): Number of worker processes (defaults to the CPU count).
+            chunk_size (int): Number of entities per shard.
+
+        Returns:
+            ShardedRiskExecutor: The executor; shut it down (or use it as a context manager) when done.
+        """
+        from .parallel import ShardedRiskExecutor
+
+        return ShardedRiskExecutor(self.models, max_workers=max_workers, chunk_size=chunk_size)
+
+    def evaluate_risks_columnar(self, factors, model_name, columns=None):
+        """
+        Evaluate risks for a columnar batch of entities in a single vectorized pass.
+
+        Args:
+            factors (pd.DataFrame or np.ndarray): One row per entity, one column per factor.
+            model_name (str): Name of the registered model to use.
+            columns (list): Factor names for the columns of a NumPy matrix. Ignored for
+                DataFrames; defaults to the model's factor order when omitted.
+
+        Returns:
+            tuple: ``(risks, errors)`` - a float64 array of risk scores aligned with the
+            input rows (NaN for failed rows) and a boolean error mask.
+        """
+        model = self.get_model(model_name)
+        if hasattr(factors, "columns") and hasattr(factors, "to_numpy"):
+            columns = list(factors.columns)
+            factors = factors.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            factors = np.asarray(factors, dtype=np.float64)
+            if factors.ndim != 2:
+                logger.error("Factor matrix must be two-dimensional.")
+                raise ValueError("Factor matrix must be two-dimensional.")
+            if columns is None:
+                columns = list(getattr(model, "weights", None) or range(factors.shape[1]))
+        logger.info(f"Evaluating columnar batch of {len(factors)} entities using model '{model_name}'.")
+        risks, errors = model.calculate_risk_batch(factors, list(columns))
+        if errors.any():
+            logger.warning(f"Risk evaluation failed for {int(errors.sum())} of {len(errors)} entities.")
+        return risks, errors
+
+    def stream_risks(self, chunks, model_name, id_column=None, factor_columns=None):
+        """
+        Score an iterable of DataFrame chunks, yielding one scored chunk at a time.
+
+        Only one chunk is held in memory at a time, so memory stays bounded
+        regardless of portfolio size.
+
+        Args:
+            chunks (iterable): Iterable of DataFrames, one row per entity.
+            model_name (str): Name of the registered model to use.
+            id_column (str): Optional column holding the entity ID; the chunk index is used otherwise.
+            factor_columns (list): Factor columns to score; defaults to every column except ``id_column``.
+
+        Yields:
+            pd.DataFrame: The chunk's index and ``id_column`` (if given) plus ``risk`` and ``error`` columns.
+        """
+        for chunk in chunks:
+            if factor_columns is not None:
+                factors = chunk[list(factor_columns)]
+            elif id_column is not None:
+                factors = chunk.drop(columns=[id_column])
+            else:
+                factors = chunk
+            risks, errors = self.evaluate_risks_columnar(factors, model_name)
+            scored = chunk[[id_column]].copy() if id_column is not None else chunk.iloc[:, :0].copy()
+            scored["risk"] = risks
+            scored["error"] = errors
+            yield scored
+
+    def stream_risks_from_file(self, file_path, model_name, chunksize=100000, id_column=None, factor_columns=None):
+        """
+        Stream risk scores for a CSV or Parquet file read in chunks via ``DataLoader``.
+
+        Args:
+            file_path (str): Path to a ``.csv`` or ``.parquet`` file.
+            model_name (str): Name of the registered model to use.
+            chunksize (int): Number of rows read and scored per chunk.
+            id_column (str): Optional column holding the entity ID.
+            factor_columns (list): Factor columns to score.
+
+        Yields:
+            pd.DataFrame: Scored chunks, see ``stream_risks``.
+        """
+        from ...utils.data_loader import DataLoader
+
+        chunks = DataLoader.iter_chunks(file_path, chunksize=chunksize)
+        yield from self.stream_risks(chunks, model_name, id_column=id_column, factor_columns=factor_columns)
+
     def get_model(self, model_name):
         """Retrieve a registered risk model by name."""
         model = self.models.get(model_name)
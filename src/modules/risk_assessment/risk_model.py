@@ -2,10 +2,16 @@
 
 import numpy as np
 import logging
+import threading
+from types import MappingProxyType
+from cachetools import LRUCache
 
 # Configure logging for the risk model module
 logger = logging.getLogger(__name__)
 
+# Number of distinct input column layouts whose reordering plans each model keeps
+COLUMN_PLAN_CACHE_SIZE = 64
+
 class RiskModel:
     """Base class for risk models."""
     
@@ -13,6 +19,15 @@ class RiskModel:
         """Calculate risk based on input data."""
         raise NotImplementedError("Subclasses should implement this method.")
 
+    def fingerprint(self):
+        """
+        Return a hashable identifier of the model's scoring behaviour.
+
+        Used to key cached results; two models with the same fingerprint must
+        produce the same risk for the same data.
+        """
+        return (type(self).__qualname__, id(self))
+
     def validate_data(self, data):
         """Validate input data for risk calculation."""
         if not isinstance(data, dict):
@@ -20,6 +35,50 @@ class RiskModel:
             raise ValueError("Data must be a dictionary.")
         logger.debug("Data validation passed.")
 
+    def calculate_risk_batch(self, factors, columns):
+        """
+        Calculate risk for every row of a factor matrix.
+
+        The default implementation falls back to calling ``calculate_risk``
+        once per row; subclasses override it with a vectorized kernel.
+
+        Args:
+            factors (np.ndarray): 2-D float array, one row per entity.
+            columns (list): Factor names, one per column of ``factors``.
+
+        Returns:
+            tuple: ``(risks, errors)`` where ``risks`` is a float64 array aligned
+            with the rows of ``factors`` (NaN where scoring failed) and
+            ``errors`` is a boolean mask of the failed rows.
+        """
+        factors = _as_factor_matrix(factors, columns)
+        risks = np.full(factors.shape[0], np.nan)
+        errors = np.zeros(factors.shape[0], dtype=bool)
+        for row_index, row in enumerate(factors):
+            try:
+                risks[row_index] = self.calculate_risk(dict(zip(columns, row.tolist())))
+            except Exception as e:
+                logger.debug("Row %d failed risk calculation: %s", row_index, e)
+                errors[row_index] = True
+        return risks, errors
+
+def _as_factor_matrix(factors, columns):
+    """Coerce ``factors`` to a 2-D float64 matrix matching ``columns``."""
+    factors = np.asarray(factors, dtype=np.float64)
+    if factors.ndim != 2:
+        logger.error("Factor matrix must be two-dimensional.")
+        raise ValueError("Factor matrix must be two-dimensional.")
+    if factors.shape[1] != len(columns):
+        logger.error("Factor matrix and columns must have the same width.")
+        raise ValueError("Factor matrix and columns must have the same width.")
+    return factors
+
+def _finalize_batch(risks, factors):
+    """Mask out rows whose inputs or results are not finite."""
+    errors = ~np.isfinite(factors).all(axis=1) | ~np.isfinite(risks)
+    risks[errors] = np.nan
+    return risks, errors
+
 class SimpleRiskModel(RiskModel):
     """A simple risk model based on a linear scoring system."""
     
@@ -33,21 +92,125 @@ class SimpleRiskModel(RiskModel):
         logger.info(f"Calculated risk: {risk}")
         return risk
 
+    def fingerprint(self):
+        """Simple models are stateless, so all instances score identically."""
+        return (type(self).__qualname__,)
+
+    def calculate_risk_batch(self, factors, columns):
+        """Calculate the mean factor score of every row in one pass."""
+        factors = _as_factor_matrix(factors, columns)
+        if factors.shape[1] == 0:
+            return np.zeros(factors.shape[0]), np.zeros(factors.shape[0], dtype=bool)
+        with np.errstate(invalid="ignore"):
+            risks = factors.mean(axis=1)
+        return _finalize_batch(risks, factors)
+
 class AdvancedRiskModel(RiskModel):
-    """An advanced risk model using a weighted scoring system."""
+    """An advanced risk model using a weighted scoring system.
+
+    The weights are compiled into a contiguous float64 vector with a fixed
+    factor ordering (``factor_order``) and a cached normalizer, so scoring is
+    a single dot product. Hot callers that already hold values in
+    ``factor_order`` can use ``calculate_risk_array`` and skip dict lookups.
+    """
     
     def __init__(self, weights):
         """Initialize with weights for each factor."""
+        self._plan_lock = threading.Lock()  # cachetools caches are not thread-safe
         self.weights = weights
         logger.debug(f"AdvancedRiskModel initialized with weights: {weights}")
 
+    @property
+    def weights(self):
+        """Read-only view of the factor weights."""
+        return MappingProxyType(self._weights)
+
+    @weights.setter
+    def weights(self, weights):
+        """Replace the weights and recompile the weight vector."""
+        weights = dict(weights)
+        weight_vector = np.ascontiguousarray(list(weights.values()), dtype=np.float64)
+        normalizer = float(weight_vector.sum())
+        if normalizer == 0:
+            logger.error("Weights must not sum to zero.")
+            raise ValueError("Weights must not sum to zero.")
+
+        self._weights = weights
+        self.factor_order = tuple(weights)
+        self.weight_vector = weight_vector
+        self.normalizer = normalizer
+        self._factor_set = frozenset(weights)
+        self._column_plans = LRUCache(maxsize=COLUMN_PLAN_CACHE_SIZE)
+        self._fingerprint = (type(self).__qualname__, self.factor_order, weight_vector.tobytes())
+
+    def __getstate__(self):
+        # Locks do not pickle; models are shipped to worker processes without their plan cache.
+        state = self.__dict__.copy()
+        del state["_plan_lock"]
+        state["_column_plans"] = LRUCache(maxsize=COLUMN_PLAN_CACHE_SIZE)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._plan_lock = threading.Lock()
+
+    def update_weights(self, weights):
+        """
+        Update some or all factor weights and recompile the weight vector.
+
+        Args:
+            weights (dict): Mapping of factor name to its new weight.
+        """
+        self.weights = {**self._weights, **weights}
+        logger.debug(f"AdvancedRiskModel weights updated: {weights}")
+
+    def fingerprint(self):
+        """Identify the model by its compiled factor order and weights."""
+        return self._fingerprint
+
+    def column_plan(self, columns):
+        """
+        Return the column indices that reorder ``columns`` into ``factor_order``.
+
+        The most recently used ``COLUMN_PLAN_CACHE_SIZE`` plans are cached per
+        column tuple, so repeated batches with the same layout pay for the key
+        matching only once. The cache is guarded by a lock, so one model can
+        serve batches from several threads.
+
+        Args:
+            columns (list): Factor names in input column order.
+
+        Returns:
+            np.ndarray: Integer index array into ``columns``, or None when the
+            columns are already in ``factor_order``.
+        """
+        columns = tuple(columns)
+        column_plans = self._column_plans
+        with self._plan_lock:
+            if columns in column_plans:
+                return column_plans[columns]
+        if len(columns) != len(self._factor_set) or set(columns) != self._factor_set:
+            logger.error("Factor columns must match the model weights.")
+            raise ValueError("Factor columns must match the model weights.")
+
+        position = {name: index for index, name in enumerate(columns)}
+        plan = np.array([position[name] for name in self.factor_order], dtype=np.intp)
+        if (plan == np.arange(len(plan))).all():
+            plan = None  # Columns are already in factor order; avoid the gather copy.
+        with self._plan_lock:
+            column_plans[columns] = plan
+        return plan
+
     def validate_data(self, data):
         """Validate input data for the advanced risk model."""
         super().validate_data(data)
         
-        if len(data) != len(self.weights):
+        if len(data) != len(self._factor_set):
             logger.error("Data and weights must have the same length.")
             raise ValueError("Data and weights must have the same length.")
+        if data.keys() != self._factor_set:
+            logger.error("Data and weights must have the same factors.")
+            raise ValueError("Data and weights must have the same factors.")
         logger.debug("Data validation passed for AdvancedRiskModel.")
 
     def calculate_risk(self, data):
@@ -55,11 +218,38 @@ class AdvancedRiskModel(RiskModel):
         logger.debug("Calculating risk using AdvancedRiskModel.")
         self.validate_data(data)
         
-        weighted_scores = [data[key] * self.weights[key] for key in data]
-        risk = sum(weighted_scores) / sum(self.weights.values())
+        values = np.fromiter((data[key] for key in self.factor_order), dtype=np.float64, count=len(self.factor_order))
+        risk = float(values @ self.weight_vector) / self.normalizer
         logger.info(f"Calculated risk: {risk}")
         return risk
 
+    def calculate_risk_array(self, values):
+        """
+        Calculate risk for values already laid out in ``factor_order``.
+
+        Args:
+            values (np.ndarray): 1-D array for one entity or 2-D array with one
+                row per entity.
+
+        Returns:
+            float or np.ndarray: The risk score(s).
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim not in (1, 2) or values.shape[-1] != self.weight_vector.shape[0]:
+            logger.error("Values must have one column per factor.")
+            raise ValueError("Values must have one column per factor.")
+        risk = values @ self.weight_vector / self.normalizer
+        return float(risk) if values.ndim == 1 else risk
+
+    def calculate_risk_batch(self, factors, columns):
+        """Calculate the weighted score of every row as a single dot product."""
+        factors = _as_factor_matrix(factors, columns)
+        plan = self.column_plan(columns)
+        ordered = factors if plan is None else factors[:, plan]
+        with np.errstate(invalid="ignore"):
+            risks = ordered @ self.weight_vector / self.normalizer
+        return _finalize_batch(risks, factors)
+
 class CustomRiskModel(RiskModel):
     """A custom risk model that allows for user-defined risk calculation logic."""
     
@@ -1,7 +1,14 @@
 # src/utils/__init__.py
 
-from .data_loader import DataLoader
-from .metrics import PerformanceMetrics
-from .visualization import VisualizationTools
+from .lazy import lazy_attributes
+
+# Submodules pull in pandas, matplotlib and seaborn, so they are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    'DataLoader': '.data_loader',
+    'PerformanceMetrics': '.metrics',
+    'VisualizationTools': '.visualization',
+}
 
 __all__ = ['DataLoader', 'PerformanceMetrics', 'VisualizationTools']
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
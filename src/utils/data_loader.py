@@ -28,6 +28,74 @@ class DataLoader:
             logger.error(f"Error loading data from {file_path}: {e}")
             raise
 
+    @staticmethod
+    def iter_csv(file_path, chunksize=100000, **kwargs):
+        """
+        Stream a CSV file in chunks of rows.
+
+        Args:
+            file_path (str): Path to the CSV file.
+            chunksize (int): Number of rows per chunk.
+            **kwargs: Extra keyword arguments passed to ``pd.read_csv``.
+
+        Yields:
+            pd.DataFrame: The next chunk of rows.
+        """
+        try:
+            reader = pd.read_csv(file_path, chunksize=chunksize, **kwargs)
+        except Exception as e:
+            logger.error(f"Error loading data from {file_path}: {e}")
+            raise
+        logger.info(f"Streaming data from {file_path} in chunks of {chunksize} rows")
+        with reader:
+            yield from reader
+
+    @staticmethod
+    def iter_parquet(file_path, chunksize=100000, columns=None):
+        """
+        Stream a Parquet file in chunks of rows.
+
+        Requires the optional ``pyarrow`` dependency.
+
+        Args:
+            file_path (str): Path to the Parquet file.
+            chunksize (int): Maximum number of rows per chunk.
+            columns (list): Optional subset of columns to read.
+
+        Yields:
+            pd.DataFrame: The next chunk of rows.
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.error("Streaming Parquet files requires the 'pyarrow' package.")
+            raise ImportError("Streaming Parquet files requires the 'pyarrow' package.")
+
+        try:
+            parquet_file = pq.ParquetFile(file_path)
+        except Exception as e:
+            logger.error(f"Error loading data from {file_path}: {e}")
+            raise
+        logger.info(f"Streaming data from {file_path} in chunks of {chunksize} rows")
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+
+    @staticmethod
+    def iter_chunks(file_path, chunksize=100000):
+        """
+        Stream a CSV or Parquet file in chunks, choosing the reader by extension.
+
+        Args:
+            file_path (str): Path to a ``.csv`` or ``.parquet`` file.
+            chunksize (int): Number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: The next chunk of rows.
+        """
+        if str(file_path).endswith((".parquet", ".pq")):
+            return DataLoader.iter_parquet(file_path, chunksize=chunksize)
+        return DataLoader.iter_csv(file_path, chunksize=chunksize)
+
     @staticmethod
     def load_excel(file_path, sheet_name=0):
         """
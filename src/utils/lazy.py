@@ -0,0 +1,28 @@
+# src/utils/lazy.py
+
+import importlib
+
+def lazy_attributes(package_name, package_globals, lazy_imports):
+    """
+    Build the PEP 562 ``__getattr__`` and ``__dir__`` of a package whose attributes are imported on first access.
+
+    Args:
+        package_name (str): The package's ``__name__``.
+        package_globals (dict): The package's ``globals()``; resolved attributes are cached there.
+        lazy_imports (dict): Mapping of attribute name to the relative module defining it.
+
+    Returns:
+        tuple: ``(__getattr__, __dir__)`` to assign in the package's ``__init__``.
+    """
+    def __getattr__(name):
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(package_globals) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -1,7 +1,5 @@
 # src/utils/visualization.py
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 import logging
 
 # Configure logging for the visualization module
@@ -22,6 +20,8 @@ class VisualizationTools:
             xlabel (str): Label for the X-axis.
             ylabel (str): Label for the Y-axis.
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
         plt.plot(x, y, marker='o')
         plt.title(title)
@@ -43,6 +43,9 @@ class VisualizationTools:
             xlabel (str): Label for the X-axis.
             ylabel (str): Label for the Y-axis.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(10, 6))
         sns.barplot(x=categories, y=values)
         plt.title(title)
@@ -64,6 +67,8 @@ class VisualizationTools:
             xlabel (str): Label for the X-axis.
             ylabel (str): Label for the Y-axis.
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
         plt.hist(data, bins=bins, edgecolor='black')
         plt.title(title)
@@ -85,6 +90,8 @@ class VisualizationTools:
             xlabel (str): Label for the X-axis.
             ylabel (str): Label for the Y-axis.
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
         plt.scatter(x, y, alpha=0.7)
         plt.title(title)
@@ -0,0 +1,137 @@
+# tests/test_currency_async.py
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.modules.currency_exchange import AsyncExchangeRateProvider, ExchangeRateProvider, RateRefresher
+
+class StubRatesHandler(BaseHTTPRequestHandler):
+    """Serves ``/<base>`` with fixed rates (after ``delays[base]`` seconds), failing the first ``failures`` requests with a 503."""
+
+    requests_seen = []
+    failures = 0
+    delays = {}
+
+    def do_GET(self):
+        base = self.path.rsplit("/", 1)[-1]
+        StubRatesHandler.requests_seen.append(base)
+        time.sleep(StubRatesHandler.delays.get(base, 0.05))
+        if StubRatesHandler.failures > 0:
+            StubRatesHandler.failures -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        body = json.dumps({"base": base, "rates": {"USD": 1.0, "EUR": 0.5}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestAsyncExchangeRateProvider(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubRatesHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.api_url = f"http://127.0.0.1:{cls.server.server_address[1]}/latest"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        StubRatesHandler.requests_seen = []
+        StubRatesHandler.failures = 0
+        self.provider = AsyncExchangeRateProvider(api_url=self.api_url, backoff=0.01)
+
+    def tearDown(self):
+        self.provider.close()
+
+    def test_concurrent_misses_share_one_request(self):
+        async def fetch_concurrently():
+            return await asyncio.gather(*(self.provider.fetch_rates_async("USD") for _ in range(5)))
+
+        results = asyncio.run(fetch_concurrently())
+        self.assertEqual(StubRatesHandler.requests_seen, ["USD"])
+        self.assertTrue(all(rates["EUR"] == 0.5 for rates in results))
+
+    def test_cache_hit_returns_rates(self):
+        first = asyncio.run(self.provider.fetch_rates_async("USD"))
+        second = asyncio.run(self.provider.fetch_rates_async("USD"))
+        self.assertEqual(StubRatesHandler.requests_seen, ["USD"])
+        self.assertEqual(second["EUR"], 0.5)
+        self.assertEqual(dict(second), dict(first))
+        many = asyncio.run(self.provider.fetch_many_async(["USD", "EUR"]))
+        self.assertEqual(many["USD"]["EUR"], 0.5)
+        self.assertEqual(type(many["USD"]), type(many["EUR"]))
+
+    def test_parallel_bases(self):
+        results = asyncio.run(self.provider.fetch_many_async(["USD", "EUR"]))
+        self.assertEqual(sorted(StubRatesHandler.requests_seen), ["EUR", "USD"])
+        self.assertEqual(set(results), {"USD", "EUR"})
+
+    def test_parallel_bases_publish_in_requested_order(self):
+        StubRatesHandler.delays = {"USD": 0.2}
+        try:
+            asyncio.run(self.provider.fetch_many_async(["EUR", "USD", "GBP"]))
+        finally:
+            StubRatesHandler.delays = {}
+        versions = [self.provider.cache.get(base).version for base in ("EUR", "USD", "GBP")]
+        self.assertEqual(versions, sorted(versions))
+        self.assertEqual(self.provider.snapshot.base_currency, "GBP")
+
+    def test_transient_errors_are_retried(self):
+        StubRatesHandler.failures = 2
+        asyncio.run(self.provider.fetch_rates_async("USD"))
+        self.assertEqual(len(StubRatesHandler.requests_seen), 3)
+        self.assertEqual(self.provider.get_rate("USD", "EUR"), 0.5)
+
+    def test_sync_fetch_uses_cache(self):
+        self.provider.fetch_rates("USD")
+        self.provider.fetch_rates("USD")
+        self.assertEqual(StubRatesHandler.requests_seen, ["USD"])
+
+class TestRateRefresher(unittest.TestCase):
+
+    def setUp(self):
+        StubRatesHandler.requests_seen = []
+        StubRatesHandler.failures = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubRatesHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        api_url = f"http://127.0.0.1:{self.server.server_address[1]}/latest"
+        self.provider = ExchangeRateProvider(api_url=api_url, cache_ttl=0.2)
+
+    def tearDown(self):
+        self.server.shutdown()
+
+    def test_refreshes_ahead_of_expiry(self):
+        with RateRefresher(self.provider, refresh_interval=0.05) as refresher:
+            time.sleep(0.4)
+            metrics = refresher.metrics()
+        self.assertGreaterEqual(metrics["refresh_count"], 2)
+        self.assertLess(metrics["snapshot_age"], 0.2)
+        self.assertIsNotNone(metrics["last_refresh_latency"])
+
+    def test_serves_stale_snapshot_while_revalidating(self):
+        with RateRefresher(self.provider, refresh_interval=10, retry_interval=10) as refresher:
+            StubRatesHandler.failures = 100
+            time.sleep(0.25)
+            start = time.perf_counter()
+            rate = self.provider.get_rate("USD", "EUR")
+            elapsed = time.perf_counter() - start
+            time.sleep(0.1)
+            metrics = refresher.metrics()
+        self.assertEqual(rate, 0.5)
+        self.assertLess(elapsed, 0.05)
+        self.assertEqual(metrics["failure_count"], 1)
+        self.assertGreater(metrics["snapshot_age"], 0.2)
+
+if __name__ == '__main__':
+    unittest.main()
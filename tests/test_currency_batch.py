@@ -0,0 +1,129 @@
+# tests/test_currency_batch.py
+
+import unittest
+import numpy as np
+from src.modules.currency_exchange import (
+    BatchTransactionResult, CurrencyConverter, ExchangeRateProvider, TransactionProcessor, TransactionStatus
+)
+
+class TestBulkConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = ExchangeRateProvider()
+        self.provider.rates = {"USD": 1.0, "EUR": 0.5, "JPY": 150.0}
+        self.converter = CurrencyConverter(self.provider)
+        self.processor = TransactionProcessor(self.converter)
+
+    def test_convert_many_matches_convert(self):
+        amounts = [10.0, 20.0, 30.0]
+        froms = ["USD", "USD", "EUR"]
+        tos = ["EUR", "JPY", "EUR"]
+        expected = [self.converter.convert(*args) for args in zip(amounts, froms, tos)]
+        np.testing.assert_allclose(self.converter.convert_many(amounts, froms, tos), expected)
+
+    def test_convert_many_rejects_unknown_pair(self):
+        with self.assertRaises(ValueError):
+            self.converter.convert_many([1.0], ["USD"], ["XYZ"])
+
+    def test_convert_many_rejects_scalars_and_misaligned_inputs(self):
+        with self.assertRaises(ValueError):
+            self.converter.convert_many(1.0, "USD", "EUR")
+        with self.assertRaises(ValueError):
+            self.converter.convert_many([1.0, 2.0], ["USD"], ["EUR", "EUR"])
+
+    def test_batch_transactions_isolate_failures(self):
+        results = self.processor.process_batch_transactions([
+            {"amount": 100, "from_currency": "USD", "to_currency": "EUR"},
+            {"amount": 5, "from_currency": "USD", "to_currency": "XYZ"},
+        ])
+        self.assertEqual(results[0]["converted_amount"], 50.0)
+        self.assertEqual(results[0]["original_amount"], 100)
+        self.assertEqual(results[1]["status"], "failed")
+
+    def test_non_numeric_amounts_fail_individually(self):
+        results = self.processor.process_batch_transactions([
+            {"amount": "ten", "from_currency": "USD", "to_currency": "EUR"},
+            {"amount": 4, "from_currency": "USD", "to_currency": "EUR"},
+        ])
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertEqual(results[1]["converted_amount"], 2.0)
+
+    def test_unavailable_rates_fail_every_row(self):
+        provider = ExchangeRateProvider(api_url="http://127.0.0.1:9/latest")  # Nothing listens on port 9
+        processor = TransactionProcessor(CurrencyConverter(provider))
+        results = processor.process_batch_transactions([
+            {"amount": 10.0, "from_currency": "USD", "to_currency": "EUR"},
+            {"amount": "abc", "from_currency": "USD", "to_currency": "JPY"},
+        ])
+        self.assertEqual([result["status"] for result in results], ["failed", "failed"])
+        self.assertIn("abc", results[1]["error"])
+        self.assertEqual(processor.process_transaction(10.0, "USD", "EUR")["status"], "failed")
+
+    def test_columnar_results(self):
+        result = self.processor.process_batch_arrays(
+            np.array([100.0, 5.0, 10.0]), ["USD", "USD", "EUR"], ["EUR", "XYZ", "JPY"])
+        self.assertIsInstance(result, BatchTransactionResult)
+        self.assertEqual(result.status.tolist(), [TransactionStatus.SUCCESS, TransactionStatus.FAILED, TransactionStatus.SUCCESS])
+        self.assertEqual(list(result.errors), [1])
+        self.assertEqual(result[2], {"original_amount": 10.0, "from_currency": "EUR", "to_currency": "JPY",
+                                     "converted_amount": 3000.0, "status": "success"})
+        self.assertEqual(result[-2]["status"], "failed")
+        self.assertEqual(result.failed_count, 1)
+
+class TestCrossRates(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = ExchangeRateProvider()
+        self.provider.set_rates({"EUR": 0.5, "JPY": 150.0}, "USD")
+
+    def test_any_pair_resolves_from_one_snapshot(self):
+        self.assertAlmostEqual(self.provider.get_rate("EUR", "JPY"), 300.0)
+        self.assertAlmostEqual(self.provider.get_rate("JPY", "USD"), 1 / 150.0)
+        self.assertEqual(self.provider.get_rate("EUR", "EUR"), 1.0)
+
+    def test_matrix_is_read_only(self):
+        _, matrix = self.provider.get_cross_rates()
+        with self.assertRaises(ValueError):
+            matrix[0, 0] = 2.0
+
+    def test_cached_base_avoids_fetch(self):
+        self.provider.api_url = "http://127.0.0.1:9"
+        self.provider.cache["USD"] = self.provider.set_rates({"GBP": 0.8}, "USD")
+        self.assertEqual(dict(self.provider.fetch_rates("USD")), {"GBP": 0.8, "USD": 1.0})
+        self.assertAlmostEqual(self.provider.get_rate("GBP", "USD"), 1.25)
+
+    def test_cache_hit_does_not_republish_older_snapshot(self):
+        self.provider.api_url = "http://127.0.0.1:9"
+        self.provider.cache["USD"] = self.provider.set_rates({"GBP": 0.8}, "USD")
+        newer = self.provider.set_rates({"EUR": 0.5}, "EUR")
+        self.assertEqual(dict(self.provider.fetch_rates("USD")), {"GBP": 0.8, "USD": 1.0})  # Served from cache, not fetched
+        self.assertIs(self.provider.snapshot, newer)
+
+class TestRateSnapshots(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = ExchangeRateProvider(snapshot_history=2)
+        self.converter = CurrencyConverter(self.provider)
+        self.first = self.provider.set_rates({"EUR": 0.5}, "USD", source="test")
+
+    def test_snapshots_are_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.first.version = 99
+        with self.assertRaises(TypeError):
+            self.first.rates["EUR"] = 1.0
+
+    def test_batches_can_pin_a_version(self):
+        second = self.provider.set_rates({"EUR": 0.25}, "USD")
+        self.assertGreater(second.version, self.first.version)
+        self.assertEqual(self.converter.convert_many([100], ["USD"], ["EUR"]).tolist(), [25.0])
+        pinned = self.converter.convert_many([100], ["USD"], ["EUR"], snapshot=self.first.version)
+        self.assertEqual(pinned.tolist(), [50.0])
+
+    def test_evicted_version_is_rejected(self):
+        self.provider.set_rates({"EUR": 0.3}, "USD")
+        self.provider.set_rates({"EUR": 0.4}, "USD")
+        with self.assertRaises(ValueError):
+            self.provider.get_snapshot(self.first.version)
+
+if __name__ == '__main__':
+    unittest.main()
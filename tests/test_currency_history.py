@@ -0,0 +1,45 @@
+# tests/test_currency_history.py
+
+import os
+import tempfile
+import unittest
+from src.modules.currency_exchange import ExchangeRateProvider, RateHistoryStore, RateSnapshot
+
+class TestRateHistoryStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "rates.bin")
+        self.store = RateHistoryStore(self.path)
+        self.store.append(RateSnapshot(1, {"EUR": 0.5, "JPY": 150.0}, "USD", timestamp=100.0))
+        self.store.append(RateSnapshot(2, {"EUR": 0.25, "JPY": 100.0}, "USD", timestamp=200.0))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_point_in_time_lookup(self):
+        self.assertAlmostEqual(self.store.rate_at("EUR", "JPY", 150.0), 300.0)
+        self.assertAlmostEqual(self.store.rate_at("EUR", "JPY", 200.0), 400.0)
+        with self.assertRaises(ValueError):
+            self.store.rate_at("EUR", "JPY", 99.0)
+
+    def test_records_are_fixed_width_and_reopenable(self):
+        reopened = RateHistoryStore(self.path)
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(reopened.currencies, ("EUR", "JPY", "USD"))
+        with open(self.path, "ab") as history_file:
+            history_file.write(b"partial")
+        self.assertEqual(len(RateHistoryStore(self.path)), 2)
+
+    def test_out_of_order_append_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.store.append(RateSnapshot(3, {"EUR": 0.5}, "USD", timestamp=150.0))
+
+    def test_provider_warms_from_history(self):
+        provider = ExchangeRateProvider(history_store=RateHistoryStore(self.path), cache_ttl=10 ** 12)
+        self.assertEqual(provider.snapshot.timestamp, 200.0)
+        self.assertAlmostEqual(provider.get_rate("USD", "EUR"), 0.25)
+        self.assertAlmostEqual(provider.get_rate_at("USD", "EUR", 120.0), 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# tests/test_currency_money.py
+
+import unittest
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN, ROUND_HALF_UP
+import numpy as np
+from src.modules.currency_exchange import ExchangeRateProvider, FixedPointConverter, RoundingPolicy
+from src.modules.currency_exchange.money import currency_scale, to_minor_units
+
+DECIMAL_ROUNDING = {
+    RoundingPolicy.HALF_EVEN: ROUND_HALF_EVEN,
+    RoundingPolicy.HALF_UP: ROUND_HALF_UP,
+    RoundingPolicy.DOWN: ROUND_DOWN,
+    RoundingPolicy.FLOOR: ROUND_FLOOR,
+    RoundingPolicy.CEILING: ROUND_CEILING,
+}
+
+class TestFixedPointConverter(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = ExchangeRateProvider(api_url="http://127.0.0.1:9/unreachable")
+        self.provider.set_rates({"EUR": 0.923456789, "JPY": 151.37, "KWD": 0.3071, "GBP": 0.79}, "USD")
+        self.converter = FixedPointConverter(self.provider)
+
+    def reference(self, numerators, minor_amount, from_currency, to_currency, rounding):
+        snapshot = self.provider.snapshot
+        rate = int(numerators[snapshot.currency_index[from_currency], snapshot.currency_index[to_currency]])
+        exact = (Decimal(minor_amount) * rate).scaleb(
+            currency_scale(to_currency) - currency_scale(from_currency) - self.converter.rate_decimals)
+        return int(exact.quantize(Decimal(1), rounding=DECIMAL_ROUNDING[rounding]))
+
+    def test_matches_exact_decimal_reference(self):
+        _, numerators = self.converter.quantized_rates()
+        generator = np.random.default_rng(7)
+        codes = np.array(["USD", "EUR", "JPY", "KWD", "GBP"])
+        amounts = generator.integers(-10 ** 15, 10 ** 15, size=2000)
+        amounts[:5] = [0, 1, -1, 5, -5]
+        froms = codes[generator.integers(0, len(codes), size=2000)]
+        tos = codes[generator.integers(0, len(codes), size=2000)]
+        for rounding in RoundingPolicy:
+            converted = self.converter.convert_minor_many(amounts, froms, tos, rounding=rounding)
+            expected = [self.reference(numerators, int(a), f, t, rounding) for a, f, t in zip(amounts, froms, tos)]
+            self.assertEqual(converted.tolist(), expected, rounding)
+
+    def test_ties_follow_rounding_policy(self):
+        self.provider.set_rates({"EUR": 0.5}, "USD")
+        # 1 cent * 0.5 = 0.5 cent, an exact tie.
+        results = {rounding: self.converter.convert_minor_many([1, -1, 3], ["USD"] * 3, ["EUR"] * 3,
+                                                               rounding=rounding).tolist()
+                   for rounding in RoundingPolicy}
+        self.assertEqual(results[RoundingPolicy.HALF_EVEN], [0, 0, 2])
+        self.assertEqual(results[RoundingPolicy.HALF_UP], [1, -1, 2])
+        self.assertEqual(results[RoundingPolicy.DOWN], [0, 0, 1])
+        self.assertEqual(results[RoundingPolicy.FLOOR], [0, -1, 1])
+        self.assertEqual(results[RoundingPolicy.CEILING], [1, 0, 2])
+
+    def test_major_unit_conversion_uses_currency_scales(self):
+        self.assertEqual(to_minor_units("1.005", "USD"), 100)
+        self.assertEqual(to_minor_units("1.005", "USD", RoundingPolicy.HALF_UP), 101)
+        self.assertEqual(self.converter.convert("100", "USD", "JPY"), Decimal("15137"))
+        self.assertEqual(self.converter.convert("1", "KWD", "USD"), Decimal("3.26"))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.converter.convert_minor_many([100], ["USD"], ["XXX"])
+        with self.assertRaises(ValueError):
+            self.converter.convert_minor_many([1.5], ["USD"], ["EUR"])
+        with self.assertRaises(ValueError):
+            self.converter.convert_minor_many(100, "USD", "EUR")
+        with self.assertRaises(ValueError):
+            self.converter.convert_minor_many(np.array([2 ** 63], dtype=np.uint64), ["USD"], ["EUR"])
+        unsigned = self.converter.convert_minor_many(np.array([100], dtype=np.uint64), ["USD"], ["USD"])
+        self.assertEqual(unsigned.tolist(), [100])
+        with self.assertRaises(OverflowError):
+            self.converter.convert_minor_many([2 ** 63 - 1], ["USD"], ["JPY"])
+
+    def test_scaled_rate_overflow_is_detected(self):
+        # With no rate decimals, USD -> KWD folds a factor of 10 into the rate numerator.
+        self.provider.set_rates({"KWD": 2e18}, "USD")
+        converter = FixedPointConverter(self.provider, rate_decimals=0)
+        with self.assertRaises(OverflowError):
+            converter.convert_minor_many([1], ["USD"], ["KWD"])
+        self.provider.set_rates({"KWD": 3.0}, "USD")
+        self.assertEqual(converter.convert_minor_many([7], ["USD"], ["KWD"]).tolist(), [210])
+
+if __name__ == "__main__":
+    unittest.main()
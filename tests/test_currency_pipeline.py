@@ -0,0 +1,98 @@
+# tests/test_currency_pipeline.py
+
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+import numpy as np
+from src.modules.currency_exchange import (
+    CurrencyConverter, ExchangeRateProvider, TransactionLedger, TransactionPipeline, TransactionProcessor
+)
+
+class TestTransactionPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_uri = "sqlite:///" + os.path.join(self.directory.name, "ledger.db")
+        provider = ExchangeRateProvider()
+        provider.set_rates({"EUR": 0.5}, "USD")
+        self.converter = CurrencyConverter(provider)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_all_transactions_are_committed_in_batches(self):
+        transactions = [{"amount": i, "from_currency": "USD", "to_currency": "EUR"} for i in range(250)]
+        transactions.append({"amount": 1, "from_currency": "USD", "to_currency": "XYZ"})
+        with TransactionPipeline(self.converter, self.db_uri, batch_size=100, flush_interval=0.01) as pipeline:
+            pipeline.submit_many(transactions)
+        metrics = pipeline.metrics()
+        self.assertEqual(metrics["committed"], 251)
+        self.assertEqual(metrics["failed"], 1)
+        self.assertLess(metrics["commits"], 50)
+
+        self.assertEqual(metrics["unwritten"], 0)
+        with self.assertRaises(Exception):
+            pipeline.ledger.count()  # The pipeline closed the ledger it opened
+
+        ledger = TransactionLedger(self.db_uri)
+        self.assertEqual(ledger.count(), 251)
+        journal_mode = ledger._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(journal_mode, "wal")
+        ledger.close()
+
+    def test_invalid_amounts_fail_only_their_rows(self):
+        transactions = [{"amount": amount, "from_currency": "USD", "to_currency": "EUR"}
+                        for amount in (1, Decimal("2.5"), np.float32(4.0), "abc", None, np.int64(6))]
+        with TransactionPipeline(self.converter, self.db_uri, batch_size=100, flush_interval=0.01) as pipeline:
+            pipeline.submit_many(transactions)
+        metrics = pipeline.metrics()
+        self.assertEqual(metrics["committed"], 6)
+        self.assertEqual(metrics["failed"], 2)
+
+        ledger = TransactionLedger(self.db_uri)
+        rows = ledger._connection.execute(
+            "SELECT original_amount, converted_amount, status FROM transactions ORDER BY id").fetchall()
+        ledger.close()
+        self.assertEqual(rows, [(1.0, 0.5, "success"), (2.5, 1.25, "success"), (4.0, 2.0, "success"),
+                                (None, None, "failed"), (None, None, "failed"), (6.0, 3.0, "success")])
+
+    def test_failing_ledger_is_retried_then_reported(self):
+        ledger = TransactionLedger(self.db_uri)
+        write_batch = ledger.write_batch
+        attempts = []
+
+        def flaky_write_batch(rows):
+            attempts.append(len(rows))
+            if len(attempts) <= 2:
+                raise OSError("disk I/O error")
+            write_batch(rows)
+
+        ledger.write_batch = flaky_write_batch
+        with TransactionPipeline(self.converter, ledger, flush_interval=0.01, retry_delay=0.001) as pipeline:
+            pipeline.submit_many([{"amount": 1, "from_currency": "USD", "to_currency": "EUR"}] * 5)
+        self.assertEqual(pipeline.metrics()["committed"], 5)
+        self.assertEqual(ledger.count(), 5)  # A ledger passed in stays open
+
+        def broken_write_batch(rows):
+            raise OSError("disk full")
+
+        ledger.write_batch = broken_write_batch
+        pipeline = TransactionPipeline(self.converter, ledger, write_retries=1, retry_delay=0.001)
+        pipeline.submit(2, "USD", "EUR")
+        with self.assertRaises(RuntimeError):
+            pipeline.close()
+        self.assertEqual(pipeline.metrics()["unwritten"], 1)
+        self.assertEqual(pipeline.unwritten_rows[0][1], 2)
+        self.assertIn("disk full", pipeline.metrics()["last_error"])
+        ledger.close()
+
+    def test_processor_logs_to_ledger(self):
+        ledger = TransactionLedger(self.db_uri)
+        processor = TransactionProcessor(self.converter, ledger=ledger)
+        processor.process_and_log_transaction(10, "USD", "EUR")
+        self.assertEqual(ledger.count(), 1)
+        ledger.close()
+
+if __name__ == '__main__':
+    unittest.main()
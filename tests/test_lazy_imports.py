@@ -0,0 +1,38 @@
+# tests/test_lazy_imports.py
+
+import json
+import subprocess
+import sys
+import unittest
+
+def loaded_after_import(statement, modules):
+    """Run ``statement`` in a fresh interpreter and return which of ``modules`` it loaded."""
+    probe = f"import json, sys\n{statement}\nprint(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_light_entry_points_do_not_load_heavy_dependencies(self):
+        heavy = ("pandas", "matplotlib", "seaborn", "sklearn", "scipy")
+        for statement in ("import src.utils", "import src.main",
+                          "from src.modules.currency_exchange import CurrencyConverter",
+                          "from src.modules.risk_assessment import RiskAssessmentModule",
+                          "import src.modules.cognitive_advisors.learning"):
+            with self.subTest(statement=statement):
+                self.assertEqual(loaded_after_import(statement, heavy), [])
+
+    def test_currency_conversion_does_not_import_requests(self):
+        self.assertEqual(loaded_after_import("import src.modules.currency_exchange", ("requests",)), [])
+
+    def test_lazy_attributes_resolve(self):
+        from src.modules import currency_exchange, risk_assessment
+        import src.utils
+        for package in (currency_exchange, risk_assessment, src.utils):
+            for name in package.__all__:
+                self.assertTrue(hasattr(package, name), f"{package.__name__}.{name}")
+        with self.assertRaises(AttributeError):
+            currency_exchange.DoesNotExist
+
+if __name__ == "__main__":
+    unittest.main()
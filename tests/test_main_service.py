@@ -0,0 +1,84 @@
+# tests/test_main_service.py
+
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from src.main.service import MicroBatcher, NexusService
+from src.modules.currency_exchange import CurrencyConverter, ExchangeRateProvider
+
+async def request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                 + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    while (await reader.readline()) not in (b"\r\n", b""):
+        pass
+    data = await reader.read()
+    writer.close()
+    return int(status_line.split()[1]), json.loads(data)
+
+class TestNexusService(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        provider = ExchangeRateProvider(api_url="http://127.0.0.1:9/unreachable")
+        provider.set_rates({"EUR": 0.5, "JPY": 150.0}, "USD")
+        self.service = NexusService(converter=CurrencyConverter(provider), max_batch_delay=0.01)
+        await self.service.start(port=0)
+
+    async def asyncTearDown(self):
+        await self.service.stop()
+
+    async def test_concurrent_conversions_are_batched(self):
+        responses = await asyncio.gather(*[
+            request(self.service.port, "POST", "/convert",
+                    {"amount": i, "from_currency": "USD", "to_currency": "EUR"}) for i in range(20)])
+        self.assertEqual([body["converted_amount"] for _, body in responses], [i * 0.5 for i in range(20)])
+        self.assertLess(self.service.convert_batcher.batches, 20)
+
+    async def test_risk_and_errors(self):
+        status, body = await request(self.service.port, "POST", "/risk",
+                                     {"model": "advanced", "factors": {"factor1": 1, "factor2": 2, "factor3": 3}})
+        self.assertEqual(status, 200)
+        self.assertAlmostEqual(body["risk"], (0.5 + 3.0 + 6.0) / 4.0)
+        status, body = await request(self.service.port, "POST", "/convert",
+                                     {"amount": 1, "from_currency": "USD", "to_currency": "XXX"})
+        self.assertEqual(status, 400)
+        self.assertIn("XXX", body["error"])
+        status, _ = await request(self.service.port, "POST", "/risk", {"model": "missing", "factors": {"a": 1}})
+        self.assertEqual(status, 400)
+        status, _ = await request(self.service.port, "GET", "/nowhere")
+        self.assertEqual(status, 404)
+
+    async def test_optimize(self):
+        status, body = await request(self.service.port, "POST", "/optimize", {"initial_resources": [1.0, -2.0]})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["status"], "success")
+        for value in body["optimized_resources"]:
+            self.assertAlmostEqual(value, 0.0, places=5)
+        for payload in ({"initial_resources": ["a"]}, {"initial_resources": []},
+                        {"initial_resources": [1.0], "algorithm": "annealing"}):
+            status, body = await request(self.service.port, "POST", "/optimize", payload)
+            self.assertEqual(status, 400)
+            self.assertIn("error", body)
+
+    async def test_failed_optimization_is_not_ok(self):
+        failed = {"error": "solver diverged", "status": "failed"}
+        self.service._process_executor.shutdown()
+        self.service._process_executor = ThreadPoolExecutor(max_workers=1)
+        with mock.patch("src.main.service._solve_optimization", return_value=failed):
+            status, body = await self.service.dispatch("POST", "/optimize", b'{"initial_resources": [1.0]}')
+        self.assertEqual(status, 422)
+        self.assertIn("solver diverged", body["error"])
+
+    async def test_batcher_returns_results_in_order(self):
+        batcher = MicroBatcher(lambda items: [item * 2 for item in items], max_batch_size=4, max_delay=0.01)
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(10)])
+        self.assertEqual(results, [i * 2 for i in range(10)])
+        self.assertEqual(batcher.metrics()["batches"], 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# tests/test_resource_config.py
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.main.config import Config, load_config_file
+from src.modules import resource_optimization
+
+class TestResourceOptimizationConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "config.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, data):
+        with open(self.path, "w") as config_file:
+            json.dump(data, config_file)
+
+    def test_import_reads_no_configuration(self):
+        # An invalid configuration used to make the import itself raise.
+        self.write({"unrelated": True})
+        environment = dict(os.environ, RESOURCE_OPTIMIZATION_CONFIG=self.path,
+                           PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        probe = "import sys, src.modules.resource_optimization; print('scipy' in sys.modules)"
+        completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                                   cwd=self.directory.name, env=environment)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip(), "False")
+
+    def test_validation_happens_when_the_system_is_created(self):
+        self.write({"optimizer_settings": {"default_algorithm": "minimize"}})
+        with self.assertRaises(ValueError):
+            resource_optimization.create_resource_optimization_system(resource_optimization.load_config(self.path))
+        self.write({"optimizer_settings": {"default_algorithm": "minimize"}, "analysis_settings": {}})
+        os.utime(self.path, (0, 12345))  # Force a distinct modification time
+        system = resource_optimization.create_resource_optimization_system(resource_optimization.load_config(self.path))
+        self.assertEqual(system["optimizer"].get_algorithm(), "minimize")
+
+    def test_config_file_is_cached_and_shared_with_main_config(self):
+        self.write({"DB_URI": "sqlite:///ledger.db", "optimizer_settings": {}})
+        first = load_config_file(self.path)
+        first["optimizer_settings"]["mutated"] = True
+        self.assertNotIn("mutated", load_config_file(self.path)["optimizer_settings"])
+        config = Config()
+        config.load_from_file(self.path)
+        self.assertEqual(config.DB_URI, "sqlite:///ledger.db")
+        self.assertEqual(resource_optimization.load_config(os.path.join(self.directory.name, "missing.json")), {})
+
+    def test_config_attribute_is_cached_until_reloaded(self):
+        self.write({"optimizer_settings": {"workers": 1}, "analysis_settings": {}})
+        previous = resource_optimization._config
+        self.addCleanup(setattr, resource_optimization, "_config", previous)
+        resource_optimization.reload_config(self.path)
+        config = resource_optimization.config
+        self.assertIs(resource_optimization.config, config)
+
+        self.write({"optimizer_settings": {"workers": 4}, "analysis_settings": {}})
+        os.utime(self.path, (0, 12345))
+        self.assertEqual(resource_optimization.config["optimizer_settings"]["workers"], 1)
+        resource_optimization.reload_config(self.path)
+        self.assertEqual(resource_optimization.config["optimizer_settings"]["workers"], 4)
+        system = resource_optimization.create_resource_optimization_system(resource_optimization.config)
+        self.assertIs(system["config"], resource_optimization.config)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# tests/test_resource_jobs.py
+
+import unittest
+import numpy as np
+from scipy.optimize import OptimizeResult
+from src.modules.resource_optimization.jobs import _run_start
+from src.modules.resource_optimization.optimizer import Optimizer
+
+def rastrigin(resources):
+    resources = np.asarray(resources)
+    return 10 * len(resources) + np.sum(resources ** 2 - 10 * np.cos(2 * np.pi * resources))
+
+def broken_objective(resources):
+    raise RuntimeError("objective unavailable")
+
+class ArrayCallbackOptimizer(Optimizer):
+    """Calls the callback with the bare ``xk`` array, as SLSQP does before SciPy 1.16."""
+
+    def _solve(self, objective_function, initial_resources, constraints=(), bounds=None, callback=None, jac=None):
+        x = np.zeros(len(initial_resources))
+        try:
+            callback(x)
+        except StopIteration:
+            pass
+        return OptimizeResult(x=x, fun=objective_function(x), success=False, message="stopped")
+
+class TestOptimizationJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = Optimizer()
+        self.problem = {"initial_resources": [3.3, -2.7, 1.6], "objective_function": rastrigin,
+                        "bounds": [(-5, 5)] * 3}
+
+    def test_multi_start_beats_single_start(self):
+        single = self.optimizer.optimize_many([self.problem], n_starts=1, max_workers=1)[0]
+        multi = self.optimizer.optimize_many([self.problem], n_starts=20, max_workers=1, seed=0)[0]
+        self.assertEqual(multi["starts_completed"], 20)
+        self.assertLess(multi["objective"], single["objective"])
+
+    def test_target_cancels_remaining_starts(self):
+        results = self.optimizer.optimize_many({"a": self.problem, "b": dict(self.problem, target_objective=-1)},
+                                               n_starts=30, target_objective=2.5, max_workers=1, seed=0)
+        self.assertTrue(results["a"]["target_reached"])
+        self.assertLessEqual(results["a"]["objective"], 2.5)
+        self.assertGreater(results["a"]["starts_cancelled"], 0)
+        self.assertEqual(results["b"]["starts_completed"], 30)
+
+    def test_process_pool_matches_serial_and_reports_failures(self):
+        problems = {"good": self.problem, "bad": dict(self.problem, objective_function=broken_objective)}
+        serial = self.optimizer.optimize_many(problems, n_starts=4, max_workers=1, seed=3)
+        pooled = self.optimizer.optimize_many(problems, n_starts=4, max_workers=2, seed=3)
+        self.assertAlmostEqual(pooled["good"]["objective"], serial["good"]["objective"])
+        self.assertEqual(pooled["bad"]["status"], "failed")
+        self.assertIn("objective unavailable", pooled["bad"]["error"])
+
+    def test_target_check_accepts_array_callbacks(self):
+        flags = [0]
+        _, _, outcome = _run_start(ArrayCallbackOptimizer(), 0, 0, self.problem, np.ones(3), 0.5, stop_flags=flags)
+        self.assertEqual(flags, [1])
+        self.assertTrue(outcome["target_reached"])
+
+if __name__ == "__main__":
+    unittest.main()
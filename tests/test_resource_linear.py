@@ -0,0 +1,86 @@
+# tests/test_resource_linear.py
+
+import unittest
+import numpy as np
+from scipy import sparse
+from scipy.optimize import minimize
+from src.modules.resource_optimization.linear import LinearProgram, QuadraticProgram
+from src.modules.resource_optimization.optimizer import Optimizer
+
+def pooled_problem(n=60, quadratic=False, seed=0):
+    """Cheapest allocation meeting a total demand with per-pool capacities."""
+    rng = np.random.default_rng(seed)
+    pools = n // 10
+    membership = sparse.csr_matrix((np.ones(n), (np.arange(n) % pools, np.arange(n))), shape=(pools, n))
+    args = (rng.uniform(1.0, 10.0, n), membership, np.full(pools, 12.0), np.ones((1, n)), [30.0], (0, 5.0))
+    if quadratic:
+        return QuadraticProgram(sparse.diags(rng.uniform(0.5, 2.0, n)), *args)
+    return LinearProgram(*args)
+
+def reference_solution(program):
+    lower, upper = program.bound_arrays()
+    return minimize(program, np.full(program.size, 30.0 / program.size), jac=program.gradient, method="SLSQP",
+                    constraints=program.as_constraints(), bounds=list(zip(lower, upper)),
+                    options={"maxiter": 500, "ftol": 1e-12})
+
+class TestLinearFastPath(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = Optimizer()
+
+    def test_linear_program_uses_highs(self):
+        program = pooled_problem()
+        result = self.optimizer.optimize_program(program)
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["solver"], "highs")
+        x = result["optimized_resources"]
+        self.assertAlmostEqual(x.sum(), 30.0, places=6)
+        self.assertTrue(np.all(program.A_ub @ x <= 12.0 + 1e-9))
+        self.assertAlmostEqual(result["objective"], reference_solution(program).fun, places=5)
+        self.assertEqual(len(result["duals"]["ineqlin"]), program.A_ub.shape[0])
+
+    def test_quadratic_program_matches_general_solver(self):
+        program = pooled_problem(quadratic=True)
+        result = self.optimizer.optimize_program(program)
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["solver"], "admm")
+        x = result["optimized_resources"]
+        self.assertAlmostEqual(x.sum(), 30.0, places=5)
+        self.assertTrue(np.all((x >= -1e-6) & (x <= 5.0 + 1e-6)))
+        self.assertAlmostEqual(result["objective"], reference_solution(program).fun, places=4)
+
+    def test_optimize_resources_dispatches_declared_programs(self):
+        program = pooled_problem()
+        result = self.optimizer.optimize_resources(None, (), program)
+        self.assertEqual(result["solver"], "highs")
+        failed = self.optimizer.optimize_resources(None, {"type": "ineq", "fun": lambda x: x}, program)
+        self.assertEqual(failed["status"], "failed")
+
+    def test_infeasible_program_reports_failure(self):
+        program = LinearProgram([1.0, 1.0], A_eq=[[1.0, 1.0]], b_eq=[5.0], bounds=(0, 1))
+        self.assertEqual(self.optimizer.optimize_program(program)["status"], "failed")
+
+    def test_infeasible_and_unbounded_quadratic_programs_stop_early(self):
+        n = 2000
+        infeasible = QuadraticProgram(sparse.identity(n), np.ones(n), A_eq=np.ones((1, n)), b_eq=[5000.0],
+                                      bounds=(0, 1))
+        result = self.optimizer.optimize_program(infeasible)
+        self.assertEqual((result["status"], result["solver"]), ("failed", "admm"))
+        self.assertIn("infeasible", result["error"])
+        self.assertLess(result["iterations"], 1000)
+
+        unbounded = QuadraticProgram(sparse.diags([1.0, 0.0]), [0.0, -1.0], bounds=(None, None))
+        result = self.optimizer.optimize_program(unbounded)
+        self.assertEqual((result["status"], result["solver"]), ("failed", "admm"))
+        self.assertIn("unbounded", result["error"])
+
+    def test_shape_validation(self):
+        with self.assertRaises(ValueError):
+            LinearProgram([1.0, 2.0], A_ub=[[1.0, 1.0, 1.0]], b_ub=[1.0])
+        with self.assertRaises(ValueError):
+            LinearProgram([1.0, 2.0], A_ub=[[1.0, 1.0]])
+        with self.assertRaises(ValueError):
+            QuadraticProgram(np.eye(3), [1.0, 2.0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# tests/test_resource_memoization.py
+
+import unittest
+import numpy as np
+from src.modules.resource_optimization.linear import LinearProgram
+from src.modules.resource_optimization.memoization import MemoizedObjective
+from src.modules.resource_optimization.optimizer import Optimizer, vectorized_objective
+
+class CountingQuartic:
+    """``sum((x - 1)^4 + x^2)``, counting calls of the value and gradient."""
+
+    def __init__(self):
+        self.calls = 0
+        self.gradient_calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return float(np.sum((x - 1.0) ** 4 + x ** 2))
+
+    def gradient(self, x):
+        self.gradient_calls += 1
+        return 4.0 * (x - 1.0) ** 3 + 2.0 * x
+
+class TestMemoizedObjective(unittest.TestCase):
+
+    def test_repeated_points_are_served_from_cache(self):
+        function = CountingQuartic()
+        memoized = MemoizedObjective(function, decimals=6)
+        x = np.array([0.1, 0.2])
+        self.assertEqual(memoized(x), function(x))
+        memoized(x + 1e-9)  # Rounds to the same key
+        memoized(np.array([-0.0, 0.0]))
+        memoized(np.array([0.0, 0.0]))
+        stats = memoized.stats()
+        self.assertEqual(stats["calls"], 4)
+        self.assertEqual(stats["evaluations"], 2)
+        self.assertEqual(stats["cache_hits"], 2)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertGreater(stats["time_per_evaluation"], 0.0)
+
+    def test_cache_is_bounded_lru(self):
+        memoized = MemoizedObjective(lambda x: float(x[0]), max_entries=2)
+        for value in (1.0, 2.0, 1.0, 3.0, 1.0, 2.0):
+            memoized(np.array([value]))
+        self.assertEqual(memoized.stats()["cache_hits"], 2)  # 1.0 twice; 2.0 was evicted by 3.0
+        with self.assertRaises(ValueError):
+            MemoizedObjective(lambda x: 0.0, max_entries=0)
+
+    def test_cached_gradients_are_copies(self):
+        memoized = MemoizedObjective(CountingQuartic(), gradient=lambda x: 2.0 * x)
+        gradient = memoized.jac(np.ones(2))
+        gradient[:] = 0.0
+        np.testing.assert_allclose(memoized.jac(np.ones(2)), 2.0)
+        self.assertEqual(memoized.stats()["gradient"]["cache_hits"], 1)
+
+    def test_extra_arguments_are_part_of_the_key(self):
+        memoized = MemoizedObjective(lambda x, a: float(a))
+        x = np.zeros(2)
+        self.assertEqual(memoized(x, 1), 1.0)
+        self.assertEqual(memoized(x, 2), 2.0)
+        self.assertEqual(memoized(x, 1), 1.0)
+        self.assertEqual(memoized.stats()["cache_hits"], 1)
+
+    def test_value_and_gradient_tuples_are_copied(self):
+        memoized = MemoizedObjective(lambda x: (float(np.sum(x ** 2)), 2.0 * x))
+        _, gradient = memoized(np.ones(2))
+        gradient[:] = 0.0
+        _, gradient = memoized(np.ones(2))
+        np.testing.assert_allclose(gradient, 2.0)
+        gradient[:] = 0.0
+        np.testing.assert_allclose(memoized(np.ones(2))[1], 2.0)
+
+    def test_vectorized_populations_bypass_cache(self):
+        memoized = MemoizedObjective(vectorized_objective(lambda x: np.sum(x, axis=0)))
+        self.assertTrue(memoized.vectorized)
+        memoized(np.ones((3, 5)))
+        memoized(np.ones((3, 5)))
+        self.assertEqual(memoized.stats()["evaluations"], 2)
+
+class TestOptimizerMemoization(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = Optimizer()
+        self.constraint = {"type": "ineq", "fun": lambda x: 1.0 - np.sum(x)}
+
+    def test_result_reports_evaluation_stats(self):
+        function = CountingQuartic()
+        result = self.optimizer.optimize_with_custom_function(np.zeros(4), self.constraint, function,
+                                                              jac=function.gradient)
+        self.assertEqual(result["status"], "success")
+        stats = result["evaluation_stats"]
+        self.assertEqual(stats["evaluations"], function.calls)
+        self.assertEqual(stats["gradient"]["evaluations"], function.gradient_calls)
+        self.assertIn("hit_rate", stats)
+
+    def test_shared_memoized_objective_skips_repeat_evaluations(self):
+        function = CountingQuartic()
+        memoized = MemoizedObjective(function, gradient=function.gradient)
+        first = self.optimizer.optimize_with_custom_function(np.zeros(4), self.constraint, memoized)
+        calls = function.calls
+        second = self.optimizer.optimize_with_custom_function(np.zeros(4), self.constraint, memoized)
+        self.assertEqual(function.calls, calls)
+        self.assertEqual(second["evaluation_stats"]["hit_rate"], 1.0)
+        np.testing.assert_allclose(second["optimized_resources"], first["optimized_resources"])
+
+    def test_declared_programs_keep_the_fast_path(self):
+        program = LinearProgram([1.0, 2.0], A_ub=[[-1.0, -1.0]], b_ub=[-3.0])
+        result = self.optimizer.optimize_with_custom_function([0.0, 0.0], (), program)
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["solver"], "highs")
+        np.testing.assert_allclose(result["optimized_resources"], [3.0, 0.0])
+
+    def test_memoize_can_be_disabled(self):
+        result = self.optimizer.optimize_with_custom_function(np.zeros(2), (), CountingQuartic(), memoize=False)
+        self.assertNotIn("evaluation_stats", result)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+# tests/test_resource_optimizer.py
+
+import unittest
+import numpy as np
+from src.modules.resource_optimization.optimizer import Optimizer, vectorized_objective
+
+class CountingObjective:
+    """Sum-of-squares objective that counts calls and evaluated candidates."""
+
+    def __init__(self, vectorized=False):
+        self.calls = 0
+        self.candidates = 0
+        if vectorized:
+            self.vectorized = True
+
+    def __call__(self, resources):
+        resources = np.asarray(resources)
+        self.calls += 1
+        self.candidates += 1 if resources.ndim == 1 else resources.shape[1]
+        return np.sum(np.square(resources - 0.25), axis=0)
+
+def shifted_squares(resources):
+    return float(np.sum(np.square(np.asarray(resources) - 0.25)))
+
+class TestOptimizerGradients(unittest.TestCase):
+
+    def test_analytic_gradient_saves_evaluations(self):
+        optimizer = Optimizer()
+        x0 = np.linspace(1.0, 2.0, 20)
+        numeric = optimizer.optimize_resources(x0, (), optimizer.example_objective_function)
+        analytic = optimizer.optimize_resources(x0, (), optimizer.example_objective_function,
+                                                jac=optimizer.example_objective_gradient)
+        np.testing.assert_allclose(analytic["optimized_resources"], 0.0, atol=1e-6)
+        self.assertLess(analytic["evaluations"] * 5, numeric["evaluations"])
+
+    def test_objective_returning_value_and_gradient(self):
+        optimizer = Optimizer()
+        result = optimizer.optimize_with_custom_function(
+            [1.0, -1.0], (), lambda x: (np.sum(x ** 2), 2 * x), jac=True)
+        np.testing.assert_allclose(result["optimized_resources"], 0.0, atol=1e-6)
+
+    def test_vectorized_population_evaluation(self):
+        optimizer = Optimizer({"default_algorithm": "differential_evolution"})
+        objective = CountingObjective(vectorized=True)
+        result = optimizer.optimize_resources([0.5, 0.5, 0.5], (), objective)
+        np.testing.assert_allclose(result["optimized_resources"], 0.25, atol=1e-4)
+        # Whole generations are evaluated per call (polishing still calls one point at a time).
+        self.assertGreater(objective.candidates, 5 * objective.calls)
+        self.assertTrue(getattr(optimizer.example_objective_function, "vectorized", False))
+        self.assertEqual(optimizer.example_objective_function(np.ones((3, 4))).shape, (4,))
+
+    def test_differential_evolution_workers(self):
+        optimizer = Optimizer({"default_algorithm": "differential_evolution", "workers": 2})
+        result = optimizer.optimize_resources([0.5, 0.5], (), shifted_squares)
+        self.assertEqual(result["status"], "success")
+        np.testing.assert_allclose(result["optimized_resources"], 0.25, atol=1e-4)
+
+    def test_decorator_marks_function(self):
+        self.assertTrue(vectorized_objective(lambda x: x).vectorized)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# tests/test_resource_rolling.py
+
+import pickle
+import unittest
+import numpy as np
+from src.modules.resource_optimization.optimizer import Optimizer
+from src.modules.resource_optimization.rolling import RollingOptimizer
+
+def demand_problem(demand):
+    """Track ``demand`` as closely as possible."""
+    return (lambda x: float(np.sum(np.square(x - demand))),
+            lambda x: 2.0 * (x - demand))
+
+def capacity_constraints(n, per_resource=5.0, total=100.0):
+    caps = [{"type": "ineq", "fun": (lambda x, i=i: per_resource - x[i])} for i in range(n)]
+    return caps + [{"type": "ineq", "fun": lambda x: total - np.sum(x)}]
+
+class TestRollingOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_warm_start_saves_evaluations_unconstrained(self):
+        rolling = RollingOptimizer()
+        demand = self.rng.uniform(1.0, 2.0, 20)
+        x0 = np.zeros(20)
+        first = rolling.reoptimize("p", lambda x: float(np.sum(np.cosh(x - demand))), x0)
+        self.assertFalse(first["warm_started"])
+        self.assertIsNotNone(rolling._states["p"].hess_inv)
+
+        demand = demand + 0.01
+        second = rolling.reoptimize("p", lambda x: float(np.sum(np.cosh(x - demand))), x0, compare_cold=True)
+        self.assertTrue(second["warm_started"])
+        self.assertEqual(second["status"], "success")
+        np.testing.assert_allclose(second["optimized_resources"], demand, atol=1e-4)
+        self.assertGreater(second["savings"]["evaluations"], 0)
+        self.assertEqual(rolling.totals["solves"], 2)
+        self.assertEqual(rolling.totals["warm_solves"], 1)
+
+    def test_active_constraints_are_tracked(self):
+        rolling = RollingOptimizer()
+        n = 30
+        constraints = capacity_constraints(n, total=1000.0)
+        demand = self.rng.uniform(1.0, 6.0, n)
+        objective, gradient = demand_problem(demand)
+        first = rolling.reoptimize("p", objective, np.zeros(n), constraints, jac=gradient)
+        expected = [i for i in range(n) if demand[i] > 5.0]
+        self.assertEqual(first["active_constraints"], expected)
+
+        objective, gradient = demand_problem(demand + 0.05)
+        second = rolling.reoptimize("p", objective, np.zeros(n), constraints, jac=gradient, compare_cold=True)
+        self.assertTrue(second["warm_started"])
+        self.assertEqual(second["status"], "success")
+        np.testing.assert_allclose(second["optimized_resources"], np.minimum(demand + 0.05, 5.0), atol=1e-5)
+        self.assertEqual(second["active_constraints"], [i for i in range(n) if demand[i] + 0.05 > 5.0])
+        self.assertGreaterEqual(second["savings"]["evaluations"], 0)
+
+    def test_violated_constraints_join_the_working_set(self):
+        rolling = RollingOptimizer()
+        n = 10
+        constraints = capacity_constraints(n)
+        objective, gradient = demand_problem(np.full(n, 1.0))
+        self.assertEqual(rolling.reoptimize("p", objective, np.zeros(n), constraints, jac=gradient)
+                         ["active_constraints"], [])
+
+        # Demand now exceeds every per-resource capacity, none of which was active before.
+        objective, gradient = demand_problem(np.full(n, 8.0))
+        result = rolling.reoptimize("p", objective, np.zeros(n), constraints, jac=gradient)
+        np.testing.assert_allclose(result["optimized_resources"], 5.0, atol=1e-6)
+        self.assertEqual(result["active_constraints"], list(range(n)))
+
+    def test_shape_change_restarts_cold(self):
+        rolling = RollingOptimizer()
+        objective, _ = demand_problem(np.ones(3))
+        rolling.reoptimize("p", objective, np.zeros(3))
+        objective, _ = demand_problem(np.ones(4))
+        result = rolling.reoptimize("p", objective, np.zeros(4))
+        self.assertFalse(result["warm_started"])
+        np.testing.assert_allclose(result["optimized_resources"], 1.0, atol=1e-5)
+
+    def test_constraint_count_change_restarts_cold(self):
+        rolling = RollingOptimizer()
+        objective, gradient = demand_problem(np.full(4, 8.0))
+        rolling.reoptimize("p", objective, np.zeros(4), capacity_constraints(4), jac=gradient)
+        # Dropping the total-capacity constraint keeps every active index in range.
+        result = rolling.reoptimize("p", objective, np.zeros(4), capacity_constraints(4)[:-1], jac=gradient)
+        self.assertFalse(result["warm_started"])
+        np.testing.assert_allclose(result["optimized_resources"], 5.0, atol=1e-6)
+
+    def test_failed_solve_keeps_previous_state(self):
+        rolling = RollingOptimizer()
+        objective, gradient = demand_problem(np.ones(3))
+        rolling.reoptimize("p", objective, np.zeros(3), jac=gradient)
+        state = rolling._states["p"]
+        x, baseline = state.x.copy(), state.baseline
+
+        result = rolling.reoptimize("p", lambda x: float("nan"), np.zeros(3), jac=lambda x: np.full(3, np.nan))
+        self.assertEqual(result["status"], "failed")
+        np.testing.assert_array_equal(state.x, x)
+        self.assertEqual(state.baseline, baseline)
+        self.assertEqual(state.solves, 1)
+
+    def test_reset(self):
+        rolling = RollingOptimizer()
+        objective, _ = demand_problem(np.ones(3))
+        rolling.reoptimize("p", objective, np.zeros(3))
+        rolling.reset("p")
+        self.assertFalse(rolling.reoptimize("p", objective, np.zeros(3))["warm_started"])
+
+    def test_optimizer_reoptimize_and_pickling(self):
+        optimizer = Optimizer()
+        objective, gradient = demand_problem(np.ones(3))
+        optimizer.reoptimize("p", np.zeros(3), (), objective, jac=gradient)
+        result = optimizer.reoptimize("p", np.zeros(3), (), objective, jac=gradient)
+        self.assertTrue(result["warm_started"])
+        self.assertIsNone(pickle.loads(pickle.dumps(optimizer))._rolling)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# tests/test_resource_streaming.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.modules.resource_optimization.consumption_analysis import ConsumptionAnalyzer
+from src.modules.resource_optimization.streaming import ConsumptionStats, QuantileSketch, analyze_chunks
+
+def telemetry(rows, seed):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        "meter": [f"m{i % 7}" for i in range(rows)],
+        "cpu": rng.lognormal(0.0, 1.0, rows),
+        "memory": rng.normal(5.0, 2.0, rows),
+    })
+    frame.loc[::13, "memory"] = np.nan
+    return frame
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def test_relative_accuracy(self):
+        values = np.random.default_rng(0).normal(0.0, 10.0, 20000)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.update(values)
+        for q in (0.05, 0.3, 0.5, 0.9, 0.999):
+            exact = np.quantile(values, q)
+            # Within 1% of a value whose rank is near q
+            self.assertAlmostEqual(sketch.quantile(q), exact, delta=0.02 * abs(exact) + 0.05)
+
+    def test_merge_matches_single_sketch(self):
+        values = np.random.default_rng(1).exponential(3.0, 5000)
+        whole, first, second = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        whole.update(values)
+        first.update(values[:1234])
+        second.update(values[1234:])
+        first.merge(second)
+        for q in (0.1, 0.5, 0.99):
+            self.assertEqual(first.quantile(q), whole.quantile(q))
+        with self.assertRaises(ValueError):
+            first.merge(QuantileSketch(relative_accuracy=0.05))
+
+    def test_bucket_count_is_bounded(self):
+        sketch = QuantileSketch(max_buckets=50)
+        sketch.update(np.logspace(-6, 6, 10000))
+        self.assertLessEqual(len(sketch.positive), 50)
+        self.assertAlmostEqual(sketch.quantile(0.99), 10 ** 5.88, delta=0.02 * 10 ** 5.88)
+        self.assertTrue(np.isnan(QuantileSketch().quantile(0.5)))
+
+    def test_negative_collapse_keeps_values_near_zero(self):
+        sketch = QuantileSketch(max_buckets=50)
+        sketch.update(-np.logspace(-6, 6, 10000))
+        self.assertLessEqual(len(sketch.negative), 50)
+        # Only the most negative values are collapsed, so the top quantile stays accurate.
+        self.assertAlmostEqual(sketch.quantile(0.99), -10 ** -5.88, delta=0.02 * 10 ** -5.88)
+
+class TestConsumptionStats(unittest.TestCase):
+
+    def assert_matches(self, summary, frame):
+        numeric = frame[["cpu", "memory"]]
+        for column in numeric.columns:
+            self.assertAlmostEqual(summary["total_consumption"][column], numeric[column].sum(), places=6)
+            self.assertAlmostEqual(summary["average_consumption"][column], numeric[column].mean(), places=10)
+            self.assertAlmostEqual(summary["variance"][column], numeric[column].var(ddof=0), places=10)
+            self.assertEqual(summary["count"][column], numeric[column].count())
+            self.assertEqual(summary["min"][column], numeric[column].min())
+            self.assertEqual(summary["max"][column], numeric[column].max())
+            median = numeric[column].median()
+            self.assertAlmostEqual(summary["quantiles"][column][0.5], median, delta=0.03 * abs(median))
+        self.assertEqual(summary["rows"], len(frame))
+        self.assertNotIn("meter", summary["total_consumption"])
+
+    def test_chunked_aggregates_match_whole_frame(self):
+        frame = telemetry(10000, seed=0)
+        chunks = (frame.iloc[start:start + 777] for start in range(0, len(frame), 777))
+        self.assert_matches(analyze_chunks(chunks).summary(), frame)
+
+    def test_merge_of_partial_results(self):
+        first, second = telemetry(3000, seed=1), telemetry(5000, seed=2)
+        merged = ConsumptionStats().update(first).merge(ConsumptionStats().update(second))
+        self.assert_matches(merged.summary(), pd.concat([first, second]))
+
+class TestStreamingAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.frames = [telemetry(4000, seed) for seed in range(3)]
+        self.paths = []
+        for index, frame in enumerate(self.frames):
+            path = os.path.join(self.directory.name, f"telemetry_{index}.csv")
+            frame.to_csv(path, index=False)
+            self.paths.append(path)
+        self.analyzer = ConsumptionAnalyzer({"chunksize": 1000})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_files_in_parallel_match_in_memory_analysis(self):
+        whole = pd.concat(self.frames)
+        expected = self.analyzer.analyze_consumption(whole[["cpu", "memory"]])
+        for max_workers in (1, 2):
+            summary = self.analyzer.analyze_consumption_stream(self.paths, max_workers=max_workers)
+            self.assertEqual(summary["status"], "success")
+            for column in ("cpu", "memory"):
+                self.assertAlmostEqual(summary["total_consumption"][column], expected["total_consumption"][column],
+                                       places=6)
+                self.assertAlmostEqual(summary["average_consumption"][column],
+                                       expected["average_consumption"][column], places=10)
+            self.assertEqual(summary["rows"], len(whole))
+
+    def test_single_path_and_chunk_iterables(self):
+        from_path = self.analyzer.analyze_consumption_stream(self.paths[0])
+        from_chunks = self.analyzer.analyze_consumption_stream(iter([self.frames[0]]))
+        self.assertEqual(from_path["count"], from_chunks["count"])
+        self.assertAlmostEqual(from_path["std"]["cpu"], from_chunks["std"]["cpu"], places=10)
+
+    def test_missing_file_reports_failure(self):
+        summary = self.analyzer.analyze_consumption_stream(os.path.join(self.directory.name, "missing.csv"))
+        self.assertEqual(summary["status"], "failed")
+
+if __name__ == "__main__":
+    unittest.main()
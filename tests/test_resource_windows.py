@@ -0,0 +1,96 @@
+# tests/test_resource_windows.py
+
+import threading
+import unittest
+import numpy as np
+import pandas as pd
+from src.modules.resource_optimization.consumption_analysis import ConsumptionAnalyzer
+from src.modules.resource_optimization.windows import WindowedAggregator
+
+class TestWindowedAggregator(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.times = np.sort(rng.uniform(0.0, 3600.0, 20000))
+        self.resources = rng.choice(["cpu", "memory", "disk"], self.times.size)
+        self.values = rng.uniform(0.0, 10.0, self.times.size)
+
+    def feed(self, aggregator, batch=997):
+        for start in range(0, self.times.size, batch):
+            end = start + batch
+            aggregator.ingest(self.times[start:end], self.resources[start:end], self.values[start:end])
+
+    def test_sliding_matches_rescan(self):
+        aggregator = WindowedAggregator(window_seconds=60, history=30)
+        self.feed(aggregator)
+        for span in (1, 7, 30):
+            result = aggregator.sliding(span)
+            in_range = (self.times >= result["start"]) & (self.times < result["end"])
+            self.assertEqual(result["end"] - result["start"], span * 60)
+            for resource in ("cpu", "memory", "disk"):
+                expected = self.values[in_range & (self.resources == resource)]
+                stats = result["resources"][resource]
+                self.assertEqual(stats["count"], expected.size)
+                self.assertAlmostEqual(stats["sum"], expected.sum(), places=6)
+                self.assertAlmostEqual(stats["mean"], expected.mean(), places=10)
+                self.assertEqual(stats["min"], expected.min())
+                self.assertEqual(stats["max"], expected.max())
+        with self.assertRaises(ValueError):
+            aggregator.sliding(31)
+
+    def test_tumbling_windows(self):
+        aggregator = WindowedAggregator(window_seconds=300, history=4)
+        self.feed(aggregator)
+        windows = aggregator.tumbling("disk")["disk"]
+        self.assertEqual([window["start"] for window in windows], [2400.0, 2700.0, 3000.0, 3300.0])
+        for window in windows:
+            mask = (self.times >= window["start"]) & (self.times < window["start"] + 300) & (self.resources == "disk")
+            self.assertEqual(window["count"], np.count_nonzero(mask))
+            self.assertAlmostEqual(window["sum"], self.values[mask].sum(), places=6)
+        self.assertEqual(len(aggregator.tumbling(last=2)["cpu"]), 2)
+
+    def test_late_rows_and_gaps(self):
+        aggregator = WindowedAggregator(window_seconds=10, history=3)
+        aggregator.ingest([5.0, 15.0], "cpu", [1.0, 2.0])
+        aggregator.ingest([95.0], "cpu", [4.0])  # Jumps past the retained history
+        self.assertEqual(aggregator.ingest([15.0], "cpu", [8.0]), 0)
+        self.assertEqual(aggregator.late_rows, 1)
+        windows = aggregator.tumbling()["cpu"]
+        self.assertEqual([window["count"] for window in windows], [0, 0, 1])
+        self.assertTrue(np.isnan(windows[0]["mean"]))
+        aggregator.ingest([85.0, float("nan")], "cpu", [3.0, float("nan")])  # Late but retained
+        self.assertEqual(aggregator.sliding()["resources"]["cpu"]["sum"], 7.0)
+
+    def test_datetime_frames_and_new_resources(self):
+        aggregator = ConsumptionAnalyzer({"window_seconds": 60, "window_history": 10}).create_window_aggregator()
+        frame = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=120, freq="10s"),
+            "cpu": np.arange(120, dtype=float),
+            "meter": ["m1"] * 120,
+        })
+        self.assertEqual(aggregator.add_frame(frame), 60)  # Only the last 10 minutes are retained
+        self.assertEqual(aggregator.late_rows, 60)
+        aggregator.add(pd.Timestamp("2024-01-01 00:19:59"), {"gpu": 5.0, "cpu": 1.0})
+        result = aggregator.sliding(1)
+        self.assertEqual(result["start"], np.datetime64("2024-01-01T00:19:00"))
+        self.assertEqual(result["resources"]["cpu"]["sum"], 114.0 + 115.0 + 116.0 + 117.0 + 118.0 + 119.0 + 1.0)
+        self.assertEqual(result["resources"]["gpu"]["count"], 1)
+        self.assertNotIn("meter", result["resources"])
+
+    def test_concurrent_ingest_and_query(self):
+        aggregator = WindowedAggregator(window_seconds=60, history=60)
+        reader = threading.Thread(target=lambda: [aggregator.sliding(10) for _ in range(200)])
+        reader.start()
+        self.feed(aggregator, batch=101)
+        reader.join()
+        total = sum(stats["count"] for stats in aggregator.sliding()["resources"].values())
+        self.assertEqual(total, self.times.size)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            WindowedAggregator(window_seconds=0)
+        with self.assertRaises(ValueError):
+            WindowedAggregator().ingest([1.0, 2.0], ["cpu"], [1.0, 2.0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# tests/test_risk_batch.py
+
+import os
+import pickle
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from itertools import permutations
+import numpy as np
+import pandas as pd
+from src.modules.risk_assessment.risk_evaluator import RiskEvaluator
+from src.modules.risk_assessment.risk_model import COLUMN_PLAN_CACHE_SIZE, AdvancedRiskModel
+
+class TestColumnarRiskEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = RiskEvaluator()
+
+    def test_simple_model_matches_scalar_path(self):
+        frame = pd.DataFrame({"a": [1.0, 4.0], "b": [3.0, 8.0]})
+        risks, errors = self.evaluator.evaluate_risks_columnar(frame, "simple")
+        self.assertEqual(risks.tolist(), [2.0, 6.0])
+        self.assertFalse(errors.any())
+
+    def test_advanced_model_reorders_dataframe_columns(self):
+        frame = pd.DataFrame({"factor3": [1.0], "factor1": [2.0], "factor2": [4.0]})
+        risks, _ = self.evaluator.evaluate_risks_columnar(frame, "advanced")
+        expected = self.evaluator.evaluate_risk("e1", "advanced", {"factor1": 2.0, "factor2": 4.0, "factor3": 1.0})
+        self.assertAlmostEqual(risks[0], expected)
+
+    def test_matrix_rows_with_missing_values_are_masked(self):
+        matrix = np.array([[1.0, 1.0, 1.0], [np.nan, 1.0, 1.0]])
+        risks, errors = self.evaluator.evaluate_risks_columnar(matrix, "advanced")
+        self.assertEqual(errors.tolist(), [False, True])
+        self.assertAlmostEqual(risks[0], 1.0)
+        self.assertTrue(np.isnan(risks[1]))
+
+    def test_mismatched_columns_are_rejected(self):
+        frame = pd.DataFrame({"factor1": [1.0], "factor2": [1.0], "other": [1.0]})
+        with self.assertRaises(ValueError):
+            self.evaluator.evaluate_risks_columnar(frame, "advanced")
+
+    def test_non_matrix_input_is_rejected(self):
+        for factors in (1.0, [1.0, 2.0, 3.0]):
+            with self.assertRaises(ValueError):
+                self.evaluator.evaluate_risks_columnar(factors, "advanced")
+
+class TestCompiledAdvancedRiskModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = AdvancedRiskModel(weights={"factor1": 0.5, "factor2": 1.5, "factor3": 2.0})
+
+    def test_weights_are_compiled(self):
+        self.assertEqual(self.model.factor_order, ("factor1", "factor2", "factor3"))
+        self.assertEqual(self.model.weight_vector.dtype, np.float64)
+        self.assertEqual(self.model.normalizer, 4.0)
+
+    def test_update_weights_recompiles(self):
+        self.model.update_weights({"factor3": 6.0})
+        self.assertEqual(self.model.normalizer, 8.0)
+        self.assertAlmostEqual(self.model.calculate_risk({"factor1": 1, "factor2": 1, "factor3": 2}), 1.75)
+
+    def test_fast_path_matches_dict_path(self):
+        data = {"factor2": 2.0, "factor1": 4.0, "factor3": 1.0}
+        self.assertAlmostEqual(self.model.calculate_risk_array([4.0, 2.0, 1.0]), self.model.calculate_risk(data))
+        self.assertEqual(self.model.calculate_risk_array(np.ones((3, 3))).shape, (3,))
+
+    def test_mismatched_key_set_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.model.calculate_risk({"factor1": 1, "factor2": 1, "factor4": 1})
+
+    def test_column_plan_cache_is_bounded(self):
+        model = AdvancedRiskModel(weights={f"f{i}": 1.0 for i in range(5)})
+        for columns in permutations(model.factor_order):
+            model.column_plan(columns)
+        self.assertEqual(len(model._column_plans), COLUMN_PLAN_CACHE_SIZE)
+        np.testing.assert_array_equal(model.column_plan(("f4", "f3", "f2", "f1", "f0")), [4, 3, 2, 1, 0])
+
+    def test_column_plans_are_thread_safe_and_picklable(self):
+        model = AdvancedRiskModel(weights={f"f{i}": float(i + 1) for i in range(5)})
+        layouts = list(permutations(model.factor_order))
+
+        def plan_all(offset):
+            return [model.column_plan(columns) for columns in layouts[offset:] + layouts[:offset]]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for plans in pool.map(plan_all, range(0, 120, 15)):
+                self.assertEqual(len(plans), len(layouts))
+        self.assertEqual(len(model._column_plans), COLUMN_PLAN_CACHE_SIZE)
+
+        copy = pickle.loads(pickle.dumps(model))
+        self.assertEqual(copy.calculate_risk_array(np.ones(5)), model.calculate_risk_array(np.ones(5)))
+        np.testing.assert_array_equal(copy.column_plan(layouts[-1]), model.column_plan(layouts[-1]))
+
+class TestStreamingRiskEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = RiskEvaluator()
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+        pd.DataFrame({
+            "entity_id": [f"e{i}" for i in range(5)],
+            "factor1": [1.0, 2.0, 3.0, 4.0, None],
+            "factor2": [1.0] * 5,
+            "factor3": [1.0] * 5,
+        }).to_csv(self.path, index=False)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_stream_from_csv_in_chunks(self):
+        chunks = list(self.evaluator.stream_risks_from_file(self.path, "advanced", chunksize=2, id_column="entity_id"))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        scored = pd.concat(chunks)
+        self.assertEqual(scored["entity_id"].tolist(), [f"e{i}" for i in range(5)])
+        self.assertAlmostEqual(scored["risk"].iloc[0], 1.0)
+        self.assertEqual(scored["error"].tolist(), [False, False, False, False, True])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# tests/test_risk_cache.py
+
+import unittest
+from src.modules.risk_assessment import RiskAssessmentModule
+from src.modules.risk_assessment.risk_model import AdvancedRiskModel, CustomRiskModel
+
+class TestRiskResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.module = RiskAssessmentModule(cache_size=2)
+        self.data = {"factor1": 1.0, "factor2": 2.0, "factor3": 3.0}
+
+    def test_repeated_factors_hit_cache(self):
+        first = self.module.evaluate_risk("e1", "advanced", self.data)
+        second = self.module.evaluate_risk("e2", "advanced", dict(reversed(list(self.data.items()))))
+        self.assertEqual(first, second)
+        self.assertEqual(self.module.cache.stats()["hits"], 1)
+        self.assertEqual(self.module.cache.stats()["misses"], 1)
+
+    def test_size_bounded_eviction(self):
+        for value in range(5):
+            self.module.evaluate_risk("e", "simple", {"a": value})
+        self.assertEqual(self.module.cache.stats()["size"], 2)
+
+    def test_overwriting_model_invalidates_results(self):
+        self.module.evaluate_risk("e1", "advanced", self.data)
+        self.module.register_model("advanced", AdvancedRiskModel(weights={"factor1": 1, "factor2": 0, "factor3": 0}))
+        self.assertEqual(self.module.cache.stats()["size"], 0)
+        self.assertEqual(self.module.evaluate_risk("e1", "advanced", self.data), 1.0)
+
+    def test_weight_change_changes_key(self):
+        model = self.module.get_model("advanced")
+        before = self.module.evaluate_risk("e1", "advanced", self.data)
+        model.update_weights({"factor1": 100.0})
+        self.assertNotEqual(self.module.evaluate_risk("e1", "advanced", self.data), before)
+
+    def test_cache_is_opt_in(self):
+        module = RiskAssessmentModule()
+        module.register_model("custom", CustomRiskModel(lambda data: 7))
+        self.assertIsNone(module.cache)
+        self.assertEqual(module.evaluate_risk("e1", "custom", {"a": 1}), 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+# tests/test_risk_incremental.py
+
+import unittest
+import numpy as np
+from src.modules.risk_assessment.incremental import IncrementalRiskScorer
+from src.modules.risk_assessment.risk_model import AdvancedRiskModel
+
+class TestIncrementalRiskScorer(unittest.TestCase):
+
+    def setUp(self):
+        self.model = AdvancedRiskModel(weights={"factor1": 0.5, "factor2": 1.5, "factor3": 2.0})
+        self.scorer = IncrementalRiskScorer(self.model, capacity=1)
+        self.data = {"factor1": 1.0, "factor2": 2.0, "factor3": 3.0}
+        self.scorer.track("e1", self.data)
+        self.scorer.track_many(["e2", "e3"], np.ones((2, 3)))
+
+    def full_score(self, **changes):
+        return self.model.calculate_risk({**self.data, **changes})
+
+    def test_factor_delta_matches_full_recompute(self):
+        risk = self.scorer.update_factor("e1", "factor2", 10.0)
+        self.assertAlmostEqual(risk, self.full_score(factor2=10.0))
+
+    def test_vectorized_factor_updates(self):
+        self.scorer.update_factors(["e2", "e3"], "factor3", [3.0, 5.0])
+        _, risks = self.scorer.scores()
+        np.testing.assert_allclose(risks[1:], [(0.5 + 1.5 + 6.0) / 4, (0.5 + 1.5 + 10.0) / 4])
+
+    def test_reweight_rescores_all_entities(self):
+        self.scorer.reweight({"factor1": 4.0})
+        self.assertAlmostEqual(self.scorer.score("e1"), self.full_score())
+        self.assertAlmostEqual(self.scorer.score("e2"), 1.0)
+
+    def test_direct_model_update_is_picked_up(self):
+        self.model.update_weights({"factor3": 0.0})
+        self.assertAlmostEqual(self.scorer.score("e1"), self.full_score())
+
+    def test_unknown_entity_or_factor(self):
+        with self.assertRaises(ValueError):
+            self.scorer.update_factor("missing", "factor1", 1.0)
+        with self.assertRaises(ValueError):
+            self.scorer.update_factor("e1", "factor9", 1.0)
+
+    def test_non_finite_factors_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.scorer.update_factor("e1", "factor1", float("nan"))
+        with self.assertRaises(ValueError):
+            self.scorer.update_factors(["e2", "e3"], "factor1", [1.0, float("inf")])
+        with self.assertRaises(ValueError):
+            self.scorer.track_many(["e4"], [[1.0, float("nan"), 1.0]])
+        with self.assertRaises(ValueError):
+            self.scorer.track("e4", {**self.data, "factor1": float("nan")})
+        self.assertAlmostEqual(self.scorer.score("e1"), self.full_score())
+        self.assertAlmostEqual(self.scorer.score("e2"), 1.0)
+        self.assertNotIn("e4", self.scorer)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+# tests/test_risk_parallel.py
+
+import os
+import unittest
+from src.modules.risk_assessment.parallel import ShardedRiskExecutor
+from src.modules.risk_assessment.risk_evaluator import RiskEvaluator
+from src.modules.risk_assessment.risk_model import CustomRiskModel
+
+def max_factor(data):
+    return max(data.values())
+
+class TestShardedRiskExecutor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.evaluator = RiskEvaluator()
+        cls.evaluator.register_model("custom", CustomRiskModel(max_factor))
+        cls.executor = cls.evaluator.create_sharded_executor(max_workers=2, chunk_size=3)
+        cls.entities = {f"e{i}": {"factor1": i, "factor2": 1.0, "factor3": 2.0} for i in range(10)}
+        cls.entities["bad"] = {"factor1": 1.0}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_matches_serial_batch(self):
+        serial = self.evaluator.evaluate_risks_batch(self.entities, "advanced")
+        sharded = self.evaluator.evaluate_risks_batch(self.entities, "advanced", executor=self.executor)
+        self.assertEqual(list(sharded), list(self.entities))
+        self.assertEqual(sharded, serial)
+        self.assertIsNone(sharded["bad"])
+
+    def test_custom_model_as_completed(self):
+        results = {}
+        for shard in self.executor.evaluate(self.entities, "custom", ordered=False):
+            self.assertLessEqual(len(shard), 3)
+            results.update(shard)
+        self.assertEqual(results["e9"], 9)
+        self.assertEqual(len(results), len(self.entities))
+
+    def test_unknown_model(self):
+        with self.assertRaises(ValueError):
+            list(self.executor.evaluate(self.entities, "missing"))
+
+    def test_worker_count(self):
+        self.assertEqual(self.executor.max_workers, 2)
+        with ShardedRiskExecutor({}) as executor:
+            self.assertEqual(executor.max_workers, os.cpu_count() or 1)
+
+if __name__ == '__main__':
+    unittest.main()